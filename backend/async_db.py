@@ -0,0 +1,138 @@
+"""
+async_db.py — asyncio MySQL pool (aiomysql) for the high-traffic read endpoints.
+
+Sync routes run in Starlette's thread pool and hold a thread for the whole DB round trip, so the
+chat polling traffic (conversation list, message history, /users/me, the items feed) was capped
+by thread count and the 20-connection mysql.connector pool. Routes that take
+get_async_db_connection are `async def` and wait on the socket inside the event loop instead;
+when every async connection is out, further requests queue on the pool (up to CHECKOUT_TIMEOUT)
+without tying up a thread.
+
+The pool runs with autocommit on: these endpoints mostly read, and a pooled connection left inside
+an implicit transaction would keep serving its old REPEATABLE READ snapshot. Writes stay on the
+sync pool (database.py), except the read marker set when a thread is opened, which runs in an
+explicit transaction (conversation_summary.mark_read). Liveness is handled by aiomysql itself —
+connections whose socket has hit EOF are dropped on acquire and connections older than
+POOL_RECYCLE_SECONDS are reopened — so there is no ping per checkout. Checkout wait and hold time
+go to `metrics` (`replica_metrics`), shown beside the sync pools' on GET /admin/pool/stats.
+
+With DB_REPLICA_HOST set there is a second pool on the replica for get_async_read_db_connection,
+routed the same way as database.get_read_db_connection.
+
+Both pools count against the server's max_connections: POOL_SIZE here plus database.POOL_SIZE
+per worker.
+"""
+import asyncio
+import contextlib
+import time
+
+import aiomysql
+from fastapi import HTTPException, Request
+
+import database
+import pool_metrics
+
+POOL_SIZE = 20
+CHECKOUT_TIMEOUT = 10.0
+POOL_RECYCLE_SECONDS = 300
+
+Error = aiomysql.Error
+
+metrics = pool_metrics.PoolMetrics(POOL_SIZE)
+replica_metrics = pool_metrics.PoolMetrics(POOL_SIZE)
+
+_pools = {}  # "primary" / "replica" -> aiomysql pool
+_pool_lock = asyncio.Lock()
+
+
+async def get_pool(replica: bool = False):
+    """The process-wide aiomysql pool for the primary (or the replica, when configured), created on first use."""
+    name = "replica" if replica else "primary"
+    pool = _pools.get(name)
+    if pool is None:
+        async with _pool_lock:
+            pool = _pools.get(name)
+            if pool is None:
+                settings = database.replica_db_config if replica else database.db_config
+                pool = _pools[name] = await aiomysql.create_pool(
+                    host=settings["host"],
+                    user=settings["user"],
+                    password=settings["password"],
+                    db=settings["database"],
+                    port=int(settings["port"]),
+                    minsize=1,
+                    maxsize=POOL_SIZE,
+                    autocommit=True,
+                    pool_recycle=POOL_RECYCLE_SECONDS,
+                    charset="utf8mb4",
+                )
+                print(f"Async database connection pool ({name}) created successfully")
+    return pool
+
+
+async def prewarm(count: int, replica: bool = False) -> int:
+    """Create the pool and open up to count connections ahead of the first requests; returns the pool size."""
+    pool = await get_pool(replica)
+    count = min(count, pool.maxsize)
+    results = await asyncio.gather(*(pool.acquire() for _ in range(count)), return_exceptions=True)
+    for connection in results:
+        if not isinstance(connection, BaseException):
+            pool.release(connection)
+    errors = [err for err in results if isinstance(err, BaseException)]
+    if errors and len(errors) == len(results):
+        raise errors[0]
+    return pool.size
+
+
+async def close_pool():
+    for name in list(_pools):
+        pool = _pools.pop(name)
+        pool.close()
+        await pool.wait_closed()
+
+
+@contextlib.asynccontextmanager
+async def _checkout(request: Request, replica: bool):
+    try:
+        pool = await get_pool(replica)
+    except Exception as err:
+        raise HTTPException(status_code=500, detail=f"Database error: {err}")
+    pool_stats = replica_metrics if replica else metrics
+    started = time.monotonic()
+    if pool.freesize == 0 and pool.size >= pool.maxsize:
+        pool_stats.exhausted()
+    try:
+        connection = await asyncio.wait_for(pool.acquire(), timeout=CHECKOUT_TIMEOUT)
+    except asyncio.TimeoutError:
+        pool_stats.timed_out()
+        raise HTTPException(status_code=503, detail="Database is busy, please retry")
+    checked_out = time.monotonic()
+    pool_stats.checked_out(checked_out - started)
+    try:
+        yield connection
+    finally:
+        pool.release(connection)
+        pool_stats.returned(database.route_label(request), time.monotonic() - checked_out)
+
+
+async def get_async_db_connection(request: Request):
+    """
+    Async counterpart of database.get_db_connection: yields an aiomysql connection and returns it
+    to the pool afterwards. Use as db=Depends(get_async_db_connection) in `async def` routes.
+    """
+    async with _checkout(request, replica=False) as connection:
+        yield connection
+
+
+def read_connection(request: Request):
+    """
+    `async with read_connection(request) as db:` checks out a read connection (replica unless
+    use_primary()) inside a route, for routes that need one only on some paths (e.g. a cache miss).
+    """
+    return _checkout(request, replica=database.reads_replica(request))
+
+
+async def get_async_read_db_connection(request: Request):
+    """Async counterpart of database.get_read_db_connection (replica unless use_primary())."""
+    async with read_connection(request) as connection:
+        yield connection
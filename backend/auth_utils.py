@@ -1,15 +1,13 @@
 import bcrypt
-from jose import jwt, JWTError
 from datetime import datetime, timedelta
-import os
-from dotenv import load_dotenv
+from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
-load_dotenv()
+import config
 
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key")
+SECRET_KEY = config.SECRET_KEY
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
@@ -21,18 +19,25 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
+# python-jose is imported inside the functions below, on the first token rather than at startup
+
 def create_access_token(data: dict):
+    from jose import jwt
+
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     """
     FastAPI dependency: decode JWT from Authorization: Bearer header
     and return the token payload (contains sub, id, role).
+    Async (no I/O) so async routes resolve it on the event loop instead of a threadpool hop.
     """
+    from jose import jwt, JWTError
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -46,3 +51,17 @@ def get_current_user(token: str = Depends(oauth2_scheme)):
         return payload  # contains sub (email), id, role
     except JWTError:
         raise credentials_exception
+
+
+def user_id_from_request(request) -> Optional[int]:
+    """The user id in the request's bearer token, or None (missing or invalid token). Never raises."""
+    from jose import jwt, JWTError
+
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).get("id")
+    except JWTError:
+        return None
@@ -0,0 +1,87 @@
+"""
+backfill_photo_hashes.py - Compute items.image_phash for photos uploaded before duplicate detection.
+
+Walks items that have an image_url but no hash in id order, downloads each photo (Cloudinary URL or
+a legacy /uploads/ file), hashes it with photo_hash.phash and writes the hashes back one batch per
+transaction. Safe to stop and re-run: finished rows are skipped. Running app workers pick the new
+hashes up on their next index refresh (photo_hash.REFRESH_SECONDS).
+
+Usage: python backfill_photo_hashes.py [--batch-size 100] [--limit N]
+"""
+
+import argparse
+import os
+
+import mysql.connector
+import requests
+import config
+import photo_hash
+
+db_config = {
+    "host": config.DB_HOST,
+    "user": config.DB_USER,
+    "password": config.DB_PASSWORD,
+    "database": config.DB_NAME,
+    "port": config.DB_PORT,
+}
+
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads")
+DOWNLOAD_TIMEOUT = 15
+
+
+def fetch_image(url: str):
+    """Image bytes for an items.image_url, or None if it cannot be read."""
+    try:
+        if url.startswith("/uploads/"):
+            with open(os.path.join(UPLOADS_DIR, os.path.basename(url)), "rb") as f:
+                return f.read()
+        resp = requests.get(url, timeout=DOWNLOAD_TIMEOUT)
+        resp.raise_for_status()
+        return resp.content
+    except (OSError, requests.RequestException) as e:
+        print(f"  [SKIP] {url}: {e}")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=None, help="stop after this many items")
+    args = parser.parse_args()
+
+    conn = mysql.connector.connect(**db_config)
+    cursor = conn.cursor()
+    last_id, seen, hashed = 0, 0, 0
+    try:
+        while args.limit is None or seen < args.limit:
+            size = args.batch_size if args.limit is None else min(args.batch_size, args.limit - seen)
+            cursor.execute("""
+                SELECT id, image_url FROM items
+                WHERE id > %s AND image_url IS NOT NULL AND image_url <> '' AND image_phash IS NULL
+                ORDER BY id
+                LIMIT %s
+            """, (last_id, size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            updates = []
+            for item_id, url in rows:
+                content = fetch_image(url)
+                value = photo_hash.phash(content) if content else None
+                if value is not None:
+                    updates.append((value, item_id))
+            if updates:
+                cursor.executemany("UPDATE items SET image_phash = %s WHERE id = %s", updates)
+            conn.commit()
+            seen += len(rows)
+            hashed += len(updates)
+            last_id = rows[-1][0]
+            print(f"Processed {seen} items ({hashed} hashed), up to id {last_id}")
+    finally:
+        cursor.close()
+        conn.close()
+    print(f"Done. {hashed} of {seen} photos hashed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+bench_pool_checkout.py - Per-request DB overhead: ping on every checkout vs database.InstrumentedPool.
+
+Old path: MySQLConnectionPool.get_connection() (is_connected() pings the server),
+then get_db_connection's own ping(reconnect=True), then the request's first query, then close()
+(session reset). New path: InstrumentedPool.get_connection(), which skips the ping for connections
+used within IDLE_PING_SECONDS, then the first query and close().
+
+Each "request" is checkout + SELECT 1 + return, run back to back against the configured database,
+so the difference is the round trips saved; it grows with the latency to the server (run it from
+the same region as production to get meaningful numbers).
+
+Usage: python bench_pool_checkout.py [--requests 500] [--pool-size 5]
+"""
+
+import argparse
+import statistics
+import time
+
+from mysql.connector import pooling
+
+import database
+
+
+def run(pool, requests: int, extra_ping: bool):
+    samples = []
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        conn = pool.get_connection()
+        if extra_ping:
+            conn.ping(reconnect=True)
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        cursor.close()
+        conn.close()
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return statistics.median(samples), samples[int(0.95 * (len(samples) - 1))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--pool-size", type=int, default=5)
+    args = parser.parse_args()
+
+    old_pool = pooling.MySQLConnectionPool(
+        pool_name="bench_old", pool_size=args.pool_size, pool_reset_session=True, **database.db_config
+    )
+    new_pool = database.InstrumentedPool(
+        pool_name="bench_new", pool_size=args.pool_size, pool_reset_session=True, **database.db_config
+    )
+    # Warm both: every connection has been used once, as in a running server
+    run(old_pool, args.pool_size, True)
+    run(new_pool, args.pool_size, False)
+
+    old_p50, old_p95 = run(old_pool, args.requests, True)
+    new_p50, new_p95 = run(new_pool, args.requests, False)
+    print(f"{args.requests} requests (checkout + SELECT 1 + return), pool_size={args.pool_size}")
+    print(f"  old (ping on every checkout): p50 {old_p50 * 1000:7.2f} ms   p95 {old_p95 * 1000:7.2f} ms")
+    print(f"  new (idle-threshold ping):    p50 {new_p50 * 1000:7.2f} ms   p95 {new_p95 * 1000:7.2f} ms")
+    print(f"  saved per request: {(old_p50 - new_p50) * 1000:.2f} ms at p50")
+
+
+if __name__ == "__main__":
+    main()
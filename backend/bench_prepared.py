@@ -0,0 +1,116 @@
+"""
+bench_prepared.py - Hot lookups as text queries vs cached prepared statements (statements.py).
+
+For each hot query (require_admin's role check, the user lookup by email, the conversation
+participant check and the conversation and claim lists with their last message) it runs
+--iterations calls on one pooled connection through three paths and reports the per-call time:
+
+  text      cursor(dictionary=True).execute(sql, params) + fetchall — interpolated client-side,
+            parsed and planned by the server every time
+  cursor    one cursor(prepared=True, dictionary=True) reused for every call — prepared once, but
+            the connector sends COM_STMT_RESET before each execute
+  cached    statements.fetch_all — prepared once per connection, then only the parameters are sent
+
+The prepared numbers exclude the one-off prepare (both are warmed first), as on a running server
+where every pooled connection has seen these statements. Parameters come from the user with the
+most conversations in the configured database, so run it against a copy with realistic data; the
+difference also depends on the latency to the server. Needs the mysql.connector C extension
+(without it statements.py falls back to text queries).
+
+Usage: python bench_prepared.py [--iterations 2000]
+"""
+
+import argparse
+import statistics
+import time
+
+import database
+import statements
+from main import ADMIN_CHECK_SQL, CONVERSATION_LIST_SQL, USER_BY_EMAIL_SQL
+from routers.messaging import CLAIM_LIST_SQL
+
+# The handlers' SQL (the participant check is written inline in several of them)
+QUERIES = {
+    "require_admin": (ADMIN_CHECK_SQL, "user_id"),
+    "user by email": (USER_BY_EMAIL_SQL, "email"),
+    "participant check": ("SELECT item_id, finder_id, claimer_id FROM conversations WHERE id = %s", "conversation_id"),
+    "conversation list": (CONVERSATION_LIST_SQL, "user_id_twice"),
+    "claim list": (CLAIM_LIST_SQL, "user_id_twice"),
+}
+
+BUSIEST_USER_SQL = """
+    SELECT u.id, u.email, MIN(c.id) AS conversation_id FROM users u
+    JOIN conversations c ON u.id IN (c.finder_id, c.claimer_id)
+    GROUP BY u.id, u.email ORDER BY COUNT(*) DESC LIMIT 1
+"""
+
+
+def text_query(db, sql, params):
+    cursor = db.cursor(dictionary=True)
+    try:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def prepared_cursor_query(cursor):
+    def run(db, sql, params):
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    return run
+
+
+def timed(fn, db, sql, params, iterations):
+    samples = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn(db, sql, params)
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return statistics.median(samples), statistics.fmean(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    if not statements.stats()["c_extension"]:
+        raise SystemExit("Needs the mysql.connector C extension (statements.py falls back to text queries without it)")
+
+    db = database.connection_pool.get_connection(label="bench")
+    try:
+        row = text_query(db, BUSIEST_USER_SQL, ())
+        if not row:
+            raise SystemExit("Needs at least one conversation in the database")
+        row = row[0]
+        params = {
+            "user_id": (row["id"],),
+            "user_id_twice": (row["id"], row["id"]),
+            "email": (row["email"],),
+            "conversation_id": (row["conversation_id"],),
+        }
+
+        print(f"{args.iterations} calls per query on one connection (p50 per call; saved = cached vs text)")
+        print(f"  {'query':<18} {'text':>10} {'cursor':>10} {'cached':>10} {'saved':>8}")
+        for name, (sql, param_key) in QUERIES.items():
+            query_params = params[param_key]
+            cursor = db.cursor(prepared=True, dictionary=True)
+            try:
+                paths = [text_query, prepared_cursor_query(cursor), statements.fetch_all]
+                for _ in range(20):  # warm every path (and the prepared-statement cache)
+                    for path in paths:
+                        path(db, sql, query_params)
+                text_p50, cursor_p50, cached_p50 = (timed(path, db, sql, query_params, args.iterations)[0] for path in paths)
+            finally:
+                cursor.close()
+            saved = (text_p50 - cached_p50) / text_p50 * 100 if text_p50 else 0.0
+            print(f"  {name:<18} {text_p50 * 1e6:8.1f}us {cursor_p50 * 1e6:8.1f}us {cached_p50 * 1e6:8.1f}us {saved:7.1f}%")
+        print(f"  cache: {statements.stats()}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
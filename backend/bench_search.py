@@ -0,0 +1,148 @@
+"""
+bench_search.py - Search latency benchmark: FULLTEXT (search.py) vs the old '%q%' LIKE scan.
+
+Seeds a scratch table `bench_items` (same search columns and indexes as `items`) in the configured
+database, growing it through each size, and reports p50/p95 latency of both query shapes.
+The FULLTEXT p95 should stay roughly flat as the table grows; the LIKE p95 grows linearly.
+The scratch table is dropped at the end.
+
+Usage: python bench_search.py [--sizes 1000,10000,100000,1000000] [--queries 200] [--like-max 100000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+import mysql.connector
+import config
+import search
+
+db_config = {
+    "host": config.DB_HOST,
+    "user": config.DB_USER,
+    "password": config.DB_PASSWORD,
+    "database": config.DB_NAME,
+    "port": config.DB_PORT,
+}
+
+CREATE_SQL = f"""
+    CREATE TABLE bench_items (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        title VARCHAR(255) NOT NULL,
+        description TEXT,
+        status VARCHAR(16) NOT NULL,
+        location VARCHAR(255),
+        keywords VARCHAR(255),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        INDEX {search.TITLE_INDEX} (title),
+        FULLTEXT INDEX {search.FULLTEXT_INDEX} (title, description, location, keywords)
+    )
+"""
+
+COLORS = ["black", "blue", "red", "white", "silver", "green", "brown", "pink", "grey", "gold"]
+THINGS = ["wallet", "backpack", "iphone", "airpods", "charger", "umbrella", "laptop", "keys",
+          "bottle", "jacket", "textbook", "calculator", "earrings", "watch", "headphones", "badge"]
+PLACES = ["Laz Otti Library", "Central Cafeteria", "Sports Complex", "BBS", "Amphi Theatre",
+          "Winslow", "Queen Esther", "University Main Church", "Babcock Super Store", "New Horizon 1"]
+QUERIES = ["black wallet", "airpods", "iphone charger", "blue backpack", "keys", "silver watch",
+           "umbrella", "textbook", "gold earrings", "library", "laptop", "wal", "air"]
+
+
+def _row(rng):
+    color, thing = rng.choice(COLORS), rng.choice(THINGS)
+    place = rng.choice(PLACES)
+    return (
+        f"{color.title()} {thing}",
+        f"Found a {color} {thing} near {place}. Serial {rng.randint(1000, 999999)}.",
+        rng.choice(["Lost", "Found"]),
+        place,
+        f"{color}, {thing}",
+    )
+
+
+def _grow(conn, target, rng, batch=5000):
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM bench_items")
+    current = cursor.fetchone()[0]
+    while current < target:
+        n = min(batch, target - current)
+        cursor.executemany(
+            "INSERT INTO bench_items (title, description, status, location, keywords) VALUES (%s, %s, %s, %s, %s)",
+            [_row(rng) for _ in range(n)],
+        )
+        conn.commit()
+        current += n
+    cursor.close()
+
+
+def _timed(conn, sql, params):
+    cursor = conn.cursor()
+    start = time.perf_counter()
+    cursor.execute(sql, params)
+    cursor.fetchall()
+    elapsed = (time.perf_counter() - start) * 1000
+    cursor.close()
+    return elapsed
+
+
+def _fulltext_sql(q):
+    clause = search.build_search(q)
+    order = f"{clause.rank_sql} DESC, i.created_at DESC" if clause.rank_sql else "i.created_at DESC"
+    sql = f"SELECT i.id FROM bench_items i WHERE {clause.where_sql} ORDER BY {order} LIMIT 50"
+    return sql, tuple(clause.where_params + clause.rank_params)
+
+
+def _like_sql(q):
+    like_q = f"%{q}%"
+    sql = """
+        SELECT i.id FROM bench_items i
+        WHERE (i.title LIKE %s OR i.description LIKE %s OR i.location LIKE %s OR i.keywords LIKE %s)
+        ORDER BY i.created_at DESC LIMIT 50
+    """
+    return sql, (like_q, like_q, like_q, like_q)
+
+
+def _percentiles(samples):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return statistics.median(ordered), p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--like-max", type=int, default=100000, help="skip the LIKE scan above this size")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    rng = random.Random(42)
+    conn = mysql.connector.connect(**db_config)
+    cursor = conn.cursor()
+    cursor.execute("DROP TABLE IF EXISTS bench_items")
+    cursor.execute(CREATE_SQL)
+    cursor.close()
+
+    print(f"{'rows':>10} | {'fulltext p50':>12} {'p95':>8} | {'like p50':>10} {'p95':>8}   (ms)")
+    try:
+        for size in sizes:
+            _grow(conn, size, rng)
+            ft = [_timed(conn, *_fulltext_sql(rng.choice(QUERIES))) for _ in range(args.queries)]
+            ft_p50, ft_p95 = _percentiles(ft)
+            if size <= args.like_max:
+                like = [_timed(conn, *_like_sql(rng.choice(QUERIES))) for _ in range(args.queries)]
+                like_p50, like_p95 = _percentiles(like)
+                like_cols = f"{like_p50:>10.2f} {like_p95:>8.2f}"
+            else:
+                like_cols = f"{'skipped':>10} {'':>8}"
+            print(f"{size:>10} | {ft_p50:>12.2f} {ft_p95:>8.2f} | {like_cols}")
+    finally:
+        cursor = conn.cursor()
+        cursor.execute("DROP TABLE IF EXISTS bench_items")
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+bench_serialization.py - Per-row cost of encoding item lists: old path vs serialization.JSONRows.
+
+Old path: str() on created_at/date_found for every row, response_model validation of every dict
+(List[ItemResponse]) and json.dumps of the validated output, as FastAPI did for GET /items.
+Dict path: serialization.dumps on the raw dictionary-cursor rows (zipped into dicts as the cursor does).
+Records path: tuple-cursor rows mapped through rows.shape and encoded by serialization.dumps.
+
+Rows are synthetic (same columns and types as a dictionary-cursor row of items + reporter_name),
+so no database is needed (main is imported only to reuse ItemResponse).
+
+Usage: python bench_serialization.py [--rows 1000] [--repeat 50]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+
+import rows as row_shapes
+import serialization
+from main import ItemResponse
+
+
+def make_rows(n: int):
+    start = datetime(2025, 9, 1, 8, 0, 0)
+    rows = []
+    for i in range(n):
+        created = start + timedelta(minutes=37 * i)
+        rows.append({
+            "id": i + 1,
+            "title": f"Black backpack #{i}",
+            "description": "Jansport backpack with a laptop sleeve and a water bottle in the side pocket.",
+            "status": random.choice(["Lost", "Found"]),
+            "category": "Bags",
+            "location": "Laz Otti Library",
+            "keywords": "backpack, black, jansport",
+            "date_found": date(2025, 9, 1) + timedelta(days=i % 60),
+            "contact_preference": "in_app",
+            "image_url": f"https://res.cloudinary.com/demo/image/upload/v1/findit_items/{i}.jpg",
+            "user_id": 1 + i % 50,
+            "verification_pin": None,
+            "created_at": created,
+            "reporter_name": "Ada Obi",
+        })
+    return rows
+
+
+def old_path(rows, adapter):
+    for item in rows:
+        if item.get("created_at"):
+            item["created_at"] = str(item["created_at"])
+        if item.get("date_found"):
+            item["date_found"] = str(item["date_found"])
+    validated = adapter.validate_python(rows)
+    return json.dumps(adapter.dump_python(validated, mode="json"), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def dict_path(raw, names):
+    return serialization.dumps([dict(zip(names, r)) for r in raw])
+
+
+def records_path(raw, description):
+    return serialization.dumps(row_shapes.shape(description).records(raw))
+
+
+def timed(fn, fresh_rows, repeat):
+    samples = []
+    for _ in range(repeat):
+        rows = fresh_rows()
+        t0 = time.perf_counter()
+        fn(rows)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    adapter = TypeAdapter(List[ItemResponse])
+    template = make_rows(args.rows)
+    fresh_rows = lambda: [dict(r) for r in template]  # the old path mutates rows
+
+    names = tuple(template[0])
+    description = [(name,) for name in names]
+    raw = [tuple(r[name] for name in names) for r in template]
+
+    # Same values on the wire (key order follows the SELECT instead of the model)
+    expected = json.loads(old_path(fresh_rows(), adapter))
+    assert expected == json.loads(dict_path(raw, names)), "wire formats differ (dict rows)"
+    assert expected == json.loads(records_path(raw, description)), "wire formats differ (records)"
+
+    old = timed(lambda rows: old_path(rows, adapter), fresh_rows, args.repeat)
+    dicts = timed(lambda _: dict_path(raw, names), lambda: None, args.repeat)
+    records = timed(lambda _: records_path(raw, description), lambda: None, args.repeat)
+    print(f"{args.rows} rows, median of {args.repeat} runs")
+    print(f"  old (str() + response_model + json.dumps): {old * 1e6 / args.rows:8.2f} us/row")
+    print(f"  dict rows (serialization.dumps):           {dicts * 1e6 / args.rows:8.2f} us/row  ({old / dicts:.1f}x)")
+    print(f"  records (rows.shape + dumps):              {records * 1e6 / args.rows:8.2f} us/row  ({old / records:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+bulk_import.py — Admin bulk import of items from CSV or NDJSON (POST /admin/items/import).
+
+Rows are parsed and validated up front, then valid rows are written CHUNK_SIZE at a time: one
+executemany INSERT (mysql.connector turns it into a single multi-row INSERT), one executemany for
+the matching ITEM_IMPORTED audit rows, and one commit per chunk. InnoDB gives the rows of one
+multi-row INSERT consecutive ids (a step of auto_increment_increment apart) starting at its
+lastrowid, so the audit rows are keyed from those instead of reading ids back, which could pick up
+items the same admin created concurrently. A chunk that fails is rolled back
+and its rows are reported as errors; earlier chunks stay committed. Per-item emails are not sent.
+
+Accepted columns (CSV header or NDJSON keys): title (required), description, status (Lost|Found,
+default Found), category, location, keywords, date_found (YYYY-MM-DD), contact_preference,
+image_url. Unknown columns are ignored. Uploads over MAX_UPLOAD_BYTES are rejected unread.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import mysql.connector
+
+CHUNK_SIZE = 500
+MAX_ROWS = 10000
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+STATUSES = ("Lost", "Found")
+
+# column -> max length (None: TEXT)
+COLUMNS = {
+    "title": 255,
+    "description": None,
+    "status": 20,
+    "category": 100,
+    "location": 255,
+    "keywords": 255,
+    "date_found": 10,
+    "contact_preference": 50,
+    "image_url": 500,
+}
+
+INSERT_SQL = f"""
+    INSERT INTO items ({", ".join(COLUMNS)}, user_id)
+    VALUES ({", ".join(["%s"] * (len(COLUMNS) + 1))})
+"""
+AUDIT_SQL = """
+    INSERT INTO audit_logs (user_id, action, item_id, details, ip_address, created_at)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+
+class ImportFormatError(ValueError):
+    """The upload as a whole cannot be read (bad encoding, unknown format, too many rows)."""
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str], requested: Optional[str] = None) -> str:
+    if requested:
+        fmt = requested.lower()
+    elif (filename or "").lower().endswith((".ndjson", ".jsonl")) or "ndjson" in (content_type or ""):
+        fmt = "ndjson"
+    else:
+        fmt = "csv"
+    if fmt not in ("csv", "ndjson"):
+        raise ImportFormatError("format must be csv or ndjson")
+    return fmt
+
+
+def parse(content: bytes, fmt: str) -> List[Tuple[int, object]]:
+    """(row number, dict) pairs; a str in place of the dict is a parse error for that row."""
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ImportFormatError("file must be UTF-8 encoded")
+    rows: List[Tuple[int, object]] = []
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(text))
+        if not reader.fieldnames or "title" not in [f.strip().lower() for f in reader.fieldnames]:
+            raise ImportFormatError("CSV header must include a title column")
+        for number, raw in enumerate(reader, start=1):
+            rows.append((number, {(k or "").strip().lower(): v for k, v in raw.items()}))
+    else:
+        number = 0
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                raw = json.loads(line)
+            except ValueError as e:
+                rows.append((number, f"invalid JSON: {e}"))
+                continue
+            rows.append((number, raw if isinstance(raw, dict) else "each line must be a JSON object"))
+    if len(rows) > MAX_ROWS:
+        raise ImportFormatError(f"at most {MAX_ROWS} rows per import")
+    return rows
+
+
+def validate(raw: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+    """Cleaned column values, or an error message."""
+    values = {}
+    for column, max_len in COLUMNS.items():
+        value = raw.get(column)
+        value = None if value is None else str(value).strip() or None
+        if value is not None and max_len is not None and len(value) > max_len:
+            return None, f"{column} is longer than {max_len} characters"
+        values[column] = value
+    if not values["title"]:
+        return None, "title is required"
+    values["status"] = (values["status"] or "Found").capitalize()
+    if values["status"] not in STATUSES:
+        return None, f"status must be one of {', '.join(STATUSES)}"
+    if values["date_found"]:
+        try:
+            date.fromisoformat(values["date_found"])
+        except ValueError:
+            return None, "date_found must be YYYY-MM-DD"
+    values["contact_preference"] = values["contact_preference"] or "in_app"
+    return values, None
+
+
+def import_rows(db, rows: List[Tuple[int, object]], user_id: int, ip_address: Optional[str] = None):
+    """
+    Insert the valid rows in chunked transactions.
+    Returns (report, created) where report has one entry per input row and created holds the
+    inserted items as dicts (id plus columns) for item_events.
+    """
+    report: Dict[int, dict] = {}
+    valid: List[Tuple[int, Dict]] = []
+    for number, raw in rows:
+        if isinstance(raw, str):
+            report[number] = {"row": number, "status": "error", "error": raw}
+            continue
+        values, error = validate(raw)
+        if error:
+            report[number] = {"row": number, "status": "error", "error": error}
+        else:
+            valid.append((number, values))
+
+    created: List[dict] = []
+    cursor = db.cursor()
+    try:
+        cursor.execute("SELECT @@auto_increment_increment")
+        id_step = cursor.fetchone()[0]
+        for start in range(0, len(valid), CHUNK_SIZE):
+            chunk = valid[start:start + CHUNK_SIZE]
+            try:
+                cursor.executemany(INSERT_SQL, [tuple(v.values()) + (user_id,) for _n, v in chunk])
+                # A multi-row INSERT reports its first id; the rest follow it in insert order
+                first_id = cursor.lastrowid
+                ids = [first_id + k * id_step for k in range(len(chunk))]
+                now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+                cursor.executemany(AUDIT_SQL, [
+                    (user_id, "ITEM_IMPORTED", item_id, f"Imported: {values['title']}", ip_address, now_utc)
+                    for item_id, (_n, values) in zip(ids, chunk)
+                ])
+                db.commit()
+            except mysql.connector.Error as err:
+                db.rollback()
+                for number, _values in chunk:
+                    report[number] = {"row": number, "status": "error", "error": f"Database error: {err}"}
+                continue
+            for item_id, (number, values) in zip(ids, chunk):
+                report[number] = {"row": number, "status": "created", "item_id": item_id}
+                created.append(dict(values, id=item_id, user_id=user_id))
+    finally:
+        cursor.close()
+    return [report[number] for number, _raw in rows], created
@@ -0,0 +1,207 @@
+"""
+compression.py — gzip/brotli response compression with a size threshold and precompressed bodies.
+
+CompressionMiddleware negotiates Accept-Encoding (br preferred over gzip, q-values honoured) and
+compresses compressible media types (JSON, NDJSON, text). Complete bodies under MINIMUM_SIZE go
+out as they are — a few hundred bytes of JSON gain nothing from it. Streamed bodies (the NDJSON
+list modes) are compressed chunk by chunk and flushed after every chunk, so each batch still
+reaches the client as soon as it is written instead of waiting in the compressor.
+
+Hot cached payloads are stored as CachedBody: the encoded JSON plus each compressed variant,
+built the first time a client asks for that encoding and reused until the cache entry expires,
+so the same feed page is not recompressed for every poll. Such responses already carry
+Content-Encoding and the middleware passes them through untouched.
+"""
+import threading
+import zlib
+from typing import Dict, Optional
+
+import brotli
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+MINIMUM_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # per-response and streamed bodies
+CACHED_BROTLI_QUALITY = 9  # precompressed once per cache entry, so spend more CPU for smaller bodies
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "application/javascript", "text/")
+ENCODINGS = ("br", "gzip")  # server preference order
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """The encoding to use for an Accept-Encoding header, or None for identity."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    best, best_q = None, 0.0
+    for encoding in ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, brotli_quality: int = BROTLI_QUALITY) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+class _StreamCompressor:
+    """Incremental encoder whose output after each chunk is decodable on its own."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._zlib = None
+        else:
+            self._brotli = None
+            self._zlib = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+def _compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """ASGI middleware; see the module docstring."""
+
+    def __init__(self, app, minimum_size: int = MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        pending = []  # body chunks held back until the threshold is reached or the body ends
+        pending_size = 0
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, pending_size, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                if not _compressible(headers):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                # Middleware built on call_next re-chunks every body as a stream, so a small
+                # body is only known to be small once it ends: hold chunks back until then
+                pending.append(message.get("body", b""))
+                pending_size += len(pending[-1])
+                if more_body and pending_size < self.minimum_size:
+                    return
+                body = b"".join(pending)
+                pending.clear()
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body:
+                    # Complete body: compress in one go and send with its real length
+                    body = compress(body, encoding)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                compressor = _StreamCompressor(encoding)
+                await send(start_message)
+            else:
+                body = message.get("body", b"")
+
+            data = compressor.chunk(body) if body else b""
+            if not more_body:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class CachedBody:
+    """An encoded response body with its compressed variants, built once each on first use."""
+
+    def __init__(self, body: bytes, weight: int = 1, media_type: str = "application/json"):
+        self.body = body
+        self.weight = weight
+        self.media_type = media_type
+        self._variants: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def variant(self, encoding: str) -> bytes:
+        compressed = self._variants.get(encoding)
+        if compressed is None:
+            with self._lock:
+                compressed = self._variants.get(encoding)
+                if compressed is None:
+                    compressed = self._variants[encoding] = compress(self.body, encoding, CACHED_BROTLI_QUALITY)
+        return compressed
+
+
+async def cached_response_async(cached: CachedBody, request: Request) -> Response:
+    """cached_response for async routes: a variant not compressed yet is built in the thread pool."""
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if encoding is not None and len(cached.body) >= MINIMUM_SIZE and encoding not in cached._variants:
+        return await run_in_threadpool(cached_response, cached, request)
+    return cached_response(cached, request)
+
+
+def cached_response(cached: CachedBody, request: Request) -> Response:
+    """Serve a CachedBody, reusing its precompressed variant when the client accepts one."""
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if encoding is None or len(cached.body) < MINIMUM_SIZE:
+        return Response(cached.body, media_type=cached.media_type, headers={"Vary": "Accept-Encoding"})
+    return Response(
+        cached.variant(encoding),
+        media_type=cached.media_type,
+        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+    )
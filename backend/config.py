@@ -1,33 +1,21 @@
 # ──────────────────────────────────────────────────────────
-# config.py — Robust "Search Party" .env loader
+# config.py — Settings from the environment and one optional .env file
+# The one place settings are read: other modules import config instead of calling load_dotenv or
+# os.getenv themselves, so the .env file is parsed once per process. Importing it prints nothing;
+# report() logs the summary from main's startup hook.
 # ──────────────────────────────────────────────────────────
+import logging
 import os
-import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
-# ── 1. SEARCH PARTY: Try multiple locations for .env (optional — works without file on Render) ──
-_THIS_DIR = Path(__file__).resolve().parent  # backend/
+# uvicorn's logger, so report() shows up beside the server's own startup lines
+logger = logging.getLogger("uvicorn.error")
 
-_SEARCH_LOCATIONS = [
-    _THIS_DIR / ".env",                          # backend/.env  (most common)
-    _THIS_DIR.parent / ".env",                   # project root/.env
-    Path.cwd() / ".env",                         # current working directory
-    Path.home() / ".env",                        # user home (fallback)
-]
-
-_env_loaded = False
-for _candidate in _SEARCH_LOCATIONS:
-    if _candidate.exists():
-        load_dotenv(dotenv_path=_candidate, override=True)
-        print(f"[OK] Loaded .env from: {_candidate}")
-        _env_loaded = True
-        break                                    # first match wins
-
-if not _env_loaded:
-    # Optional: load_dotenv(override=True) does not fail if .env is missing (e.g. on Render)
-    load_dotenv(override=True)
-    print("[CONFIG] No .env file found; using environment variables only (OK for production/Render).")
+# ── 1. .env FILE (optional — works without file on Render) ──
+# One path: backend/.env, or the file FINDIT_ENV_FILE names. Its values override the environment.
+ENV_FILE = Path(os.getenv("FINDIT_ENV_FILE") or Path(__file__).resolve().parent / ".env")
+ENV_LOADED = load_dotenv(dotenv_path=ENV_FILE, override=True)
 
 
 # ── 2. CONFIGURATION VALUES ──
@@ -37,11 +25,24 @@ DB_USER = os.getenv("DB_USER", "root")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "")
 DB_NAME = os.getenv("DB_NAME", "findit")
 DB_PORT = int(os.getenv("DB_PORT", 3306))
+# Optional read replica for read-only endpoints (see database.get_read_db_connection); unset = primary only
+DB_REPLICA_HOST = os.getenv("DB_REPLICA_HOST", "")
+DB_REPLICA_PORT = int(os.getenv("DB_REPLICA_PORT", DB_PORT))
+DB_REPLICA_USER = os.getenv("DB_REPLICA_USER", DB_USER)
+DB_REPLICA_PASSWORD = os.getenv("DB_REPLICA_PASSWORD", DB_PASSWORD)
+# Connections each pool opens in the startup hook (main.prewarm_pools), before the first requests;
+# the rest are opened on demand. 0 opens every connection on demand.
+DB_POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", 4))
 
 # Auth
-SECRET_KEY = os.getenv("SECRET_KEY", "supersecretkey123")
+SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key")
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "")
 
+# Cloudinary (image uploads; the SDK is configured on first use, see main.cloudinary_uploader)
+CLOUDINARY_CLOUD_NAME = os.getenv("CLOUDINARY_CLOUD_NAME")
+CLOUDINARY_API_KEY = os.getenv("CLOUDINARY_API_KEY")
+CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
+
 # Email (MAIL_* naming — used by email_service, utils, main)
 MAIL_FROM = os.getenv("MAIL_FROM")
 MAIL_USERNAME = os.getenv("MAIL_USERNAME")
@@ -53,23 +54,26 @@ EMAIL_PORT = int(os.getenv("EMAIL_PORT", 465))
 # Resend (used instead of SMTP on Render free tier)
 RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
 
-# ── 3. VALIDATION ──
-def validate():
-    """Warn if email vars are missing; do not crash so the app can stay up (e.g. for Render + UptimeRobot)."""
-    missing = []
-    if not MAIL_FROM:
-        missing.append("MAIL_FROM")
-    if not RESEND_API_KEY:
-        missing.append("RESEND_API_KEY")
+# ── 3. STARTUP REPORT ──
+def report():
+    """
+    Log where the settings came from and warn about missing email settings. Called from main's
+    startup hook rather than at import; does not raise, so the app stays up without email
+    (e.g. for Render + UptimeRobot).
+    """
+    if ENV_LOADED:
+        logger.info("[CONFIG] Loaded .env from %s", ENV_FILE)
+    else:
+        logger.info("[CONFIG] No .env at %s; using environment variables only (OK for production/Render).", ENV_FILE)
+    logger.info("[CONFIG] DB = %s@%s:%s/%s", DB_USER, DB_HOST, DB_PORT, DB_NAME)
+    if DB_REPLICA_HOST:
+        logger.info("[CONFIG] DB replica = %s@%s:%s/%s", DB_REPLICA_USER, DB_REPLICA_HOST, DB_REPLICA_PORT, DB_NAME)
+    logger.info(
+        "[CONFIG] MAIL_FROM = %s, MAIL_USERNAME = %s, MAIL_PASSWORD %s, RESEND_API_KEY %s",
+        MAIL_FROM, MAIL_USERNAME, "set" if MAIL_PASSWORD else "NOT SET", "set" if RESEND_API_KEY else "NOT SET",
+    )
+    missing = [name for name, value in (("MAIL_FROM", MAIL_FROM), ("RESEND_API_KEY", RESEND_API_KEY)) if not value]
     if missing:
-        print(f"[WARNING] Email will be skipped until you set: {', '.join(missing)} (Resend). App will still run.")
+        logger.warning("[CONFIG] Email will be skipped until you set: %s (Resend). App will still run.", ", ".join(missing))
     else:
-        print(f"[OK] Email config OK (Resend) -> sending as {MAIL_FROM}")
-
-
-# ── 4. DEBUG SUMMARY ──
-print(f"[CONFIG] MAIL_FROM     = {MAIL_FROM}")
-print(f"[CONFIG] MAIL_USERNAME = {MAIL_USERNAME}")
-print(f"[CONFIG] MAIL_PASSWORD = {'***SET***' if MAIL_PASSWORD else 'NOT SET [WARNING]'}")
-print(f"[CONFIG] RESEND_API_KEY = {'***SET***' if RESEND_API_KEY else 'NOT SET [WARNING]'}")
-print(f"[CONFIG] DB            = {DB_USER}@{DB_HOST}:{DB_PORT}/{DB_NAME}")
+        logger.info("[CONFIG] Email config OK (Resend) -> sending as %s", MAIL_FROM)
@@ -0,0 +1,180 @@
+"""
+conversation_summary.py — Last-message and unread state stored on conversations and claims.
+
+The conversation lists are polled every few seconds per open tab. Rather than finding each
+conversation's last message and read state on every poll, these columns
+(migrations/0008_conversation_summary.py) are kept up to date as messages are written:
+
+  conversations  last_message_id, last_message_at, last_sender_id, and finder_unread /
+                 claimer_unread: messages to that participant since they last opened the thread
+  claims         last_message_id (the claim-based chat in routers/messaging.py)
+
+so GET /conversations, GET /messages/conversations and GET /api/claims/list read them with
+one primary-key join to messages for the text.
+
+Every INSERT INTO messages calls record_message (conversation messages, keyed by item and the
+sender/receiver pair) or record_claim_message (claim messages) with the same cursor, before the
+handler's commit, so the summary and the message commit or roll back together. The update locks
+the conversation (or claim) row, and "last" is the highest message id: when two sends commit out of
+order, the earlier one does not overwrite the later one. Messages from the System user are not
+between the two participants, so, as in the thread query, they are not part of the summary.
+
+Opening a thread (GET /conversations/{id}/messages) calls mark_read, which marks the reader's
+messages read and resets their count in one transaction, and only when that count is not
+already 0, so the message poll does not write on every request.
+
+Migration 0008 fills the columns for existing conversations and claims with the same statements
+(written out there, so its checksum covers them). Running this module recomputes every summary
+from messages again, one batch of ids per transaction, to repair drift (e.g. after messages were
+edited by hand); it is safe to run while the app is up.
+
+Usage: python conversation_summary.py [--batch-size 500]
+"""
+import argparse
+
+BACKFILL_BATCH_SIZE = 500
+
+# The SET clauses run left to right and see earlier assignments, so last_message_id is set last
+RECORD_MESSAGE_SQL = """
+    UPDATE conversations SET
+        last_sender_id = IF(COALESCE(last_message_id, 0) < %(message_id)s, %(sender_id)s, last_sender_id),
+        last_message_at = IF(COALESCE(last_message_id, 0) < %(message_id)s,
+                             (SELECT created_at FROM messages WHERE id = %(message_id)s), last_message_at),
+        last_message_id = GREATEST(COALESCE(last_message_id, 0), %(message_id)s),
+        finder_unread = finder_unread + (finder_id = %(receiver_id)s),
+        claimer_unread = claimer_unread + (claimer_id = %(receiver_id)s)
+    WHERE item_id = %(item_id)s AND (
+        (finder_id = %(sender_id)s AND claimer_id = %(receiver_id)s)
+        OR (finder_id = %(receiver_id)s AND claimer_id = %(sender_id)s)
+    )
+"""
+
+RECORD_CLAIM_MESSAGE_SQL = """
+    UPDATE claims SET last_message_id = GREATEST(COALESCE(last_message_id, 0), %s) WHERE id = %s
+"""
+
+MARK_MESSAGES_READ_SQL = """
+    UPDATE messages SET is_read = TRUE
+    WHERE item_id = %(item_id)s AND receiver_id = %(user_id)s
+    AND (sender_id = %(finder_id)s OR sender_id = %(claimer_id)s)
+"""
+
+MARK_READ_SQL = """
+    UPDATE conversations SET
+        finder_unread = IF(finder_id = %(user_id)s, 0, finder_unread),
+        claimer_unread = IF(claimer_id = %(user_id)s, 0, claimer_unread)
+    WHERE id = %(conversation_id)s
+"""
+
+
+def record_message(cursor, message_id: int, item_id: int, sender_id: int, receiver_id: int):
+    """Update the summary of the conversation the message belongs to (none: no-op)."""
+    cursor.execute(RECORD_MESSAGE_SQL, {
+        "message_id": message_id, "item_id": item_id, "sender_id": sender_id, "receiver_id": receiver_id,
+    })
+
+
+def record_claim_message(cursor, message_id: int, claim_id: int):
+    cursor.execute(RECORD_CLAIM_MESSAGE_SQL, (message_id, claim_id))
+
+
+async def mark_read(db, conversation_id: int, conversation: dict, user_id: int):
+    """
+    Mark the messages to user_id in the conversation read and reset their unread count, in one
+    transaction on an aiomysql connection (the async pool otherwise runs with autocommit).
+    conversation carries item_id, finder_id and claimer_id.
+    """
+    params = {
+        "conversation_id": conversation_id, "user_id": user_id, "item_id": conversation["item_id"],
+        "finder_id": conversation["finder_id"], "claimer_id": conversation["claimer_id"],
+    }
+    await db.begin()
+    try:
+        async with db.cursor() as cursor:
+            await cursor.execute(MARK_MESSAGES_READ_SQL, params)
+            await cursor.execute(MARK_READ_SQL, params)
+        await db.commit()
+    except BaseException:
+        await db.rollback()
+        raise
+
+
+# ── Backfill ──
+
+_PAIR = """
+    m.item_id = c.item_id AND (
+        (m.sender_id = c.finder_id AND m.receiver_id = c.claimer_id)
+        OR (m.sender_id = c.claimer_id AND m.receiver_id = c.finder_id)
+    )
+"""
+
+BACKFILL_SQL = [
+    f"""
+    UPDATE conversations c SET
+        c.last_message_id = (
+            SELECT MAX(m.id) FROM messages m WHERE {_PAIR}
+        ),
+        c.last_message_at = NULL,
+        c.last_sender_id = NULL,
+        c.finder_unread = (
+            SELECT COUNT(*) FROM messages m
+            WHERE m.item_id = c.item_id AND m.sender_id = c.claimer_id AND m.receiver_id = c.finder_id AND NOT m.is_read
+        ),
+        c.claimer_unread = (
+            SELECT COUNT(*) FROM messages m
+            WHERE m.item_id = c.item_id AND m.sender_id = c.finder_id AND m.receiver_id = c.claimer_id AND NOT m.is_read
+        )
+    WHERE c.id > %s AND c.id <= %s
+    """,
+    """
+    UPDATE conversations c JOIN messages m ON m.id = c.last_message_id
+    SET c.last_message_at = m.created_at, c.last_sender_id = m.sender_id
+    WHERE c.id > %s AND c.id <= %s
+    """,
+    """
+    UPDATE claims c SET c.last_message_id = (SELECT MAX(m.id) FROM messages m WHERE m.claim_id = c.id)
+    WHERE c.id > %s AND c.id <= %s
+    """,
+]
+
+
+def backfill_batches(cursor, batch_size: int = BACKFILL_BATCH_SIZE):
+    """
+    Recompute every conversation and claim summary from messages, batch_size ids per statement.
+    Yields (table, last id done, max id) after each batch, so the caller can commit in between.
+    """
+    for table, statements in (("conversations", BACKFILL_SQL[:2]), ("claims", BACKFILL_SQL[2:])):
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+        max_id = cursor.fetchone()[0]
+        for low in range(0, max_id, batch_size):
+            for sql in statements:
+                cursor.execute(sql, (low, low + batch_size))
+            yield table, min(low + batch_size, max_id), max_id
+
+
+def main():
+    import mysql.connector
+    import config
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE)
+    args = parser.parse_args()
+
+    conn = mysql.connector.connect(
+        host=config.DB_HOST, user=config.DB_USER, password=config.DB_PASSWORD,
+        database=config.DB_NAME, port=config.DB_PORT,
+    )
+    cursor = conn.cursor()
+    try:
+        print("Backfilling conversation and claim summaries:")
+        for table, done, max_id in backfill_batches(cursor, args.batch_size):
+            conn.commit()
+            print(f"  {table}: up to id {done} of {max_id}")
+    finally:
+        cursor.close()
+        conn.close()
+    print("Done.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +0,0 @@
-USE findit;
-
-CREATE TABLE IF NOT EXISTS conversations (
-    id INT AUTO_INCREMENT PRIMARY KEY,
-    item_id INT NOT NULL,
-    finder_id INT NOT NULL,
-    claimer_id INT NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
-    FOREIGN KEY (finder_id) REFERENCES users(id) ON DELETE CASCADE,
-    FOREIGN KEY (claimer_id) REFERENCES users(id) ON DELETE CASCADE,
-    UNIQUE KEY unique_conversation (item_id, claimer_id)
-);
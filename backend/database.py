@@ -1,6 +1,14 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import mysql.connector
+from fastapi import HTTPException, Request
 from mysql.connector import pooling
 import config  # loads .env automatically
+from auth_utils import user_id_from_request
+import pool_metrics
 
 db_config = {
     "host": config.DB_HOST,
@@ -10,14 +18,239 @@ db_config = {
     "port": config.DB_PORT,
 }
 
+replica_db_config = {
+    "host": config.DB_REPLICA_HOST,
+    "user": config.DB_REPLICA_USER,
+    "password": config.DB_REPLICA_PASSWORD,
+    "database": config.DB_NAME,
+    "port": config.DB_REPLICA_PORT,
+}
+
+POOL_SIZE = 20
+# How long a checkout waits for a connection to come back when all are in use. mysql.connector's
+# own pool fails immediately instead, which turned every short burst into 500s.
+CHECKOUT_TIMEOUT = 10.0
+# Connections returned to the pool within this many seconds are handed out without a ping. Well under
+# MySQL's wait_timeout and managed-DB proxy idle cutoffs, so a recently used connection is almost
+# always still open; the rare one that is not is caught by the first-statement retry below.
+IDLE_PING_SECONDS = 30.0
+# "MySQL server has gone away", "Lost connection to MySQL server (during query)"
+STALE_CONNECTION_ERRNOS = {2006, 2013, 2055}
+
+
+class LazyPingConnection(pooling.PooledMySQLConnection):
+    """
+    Pooled connection handed out without a liveness ping. If its first statement fails because the
+    server closed the connection, it reconnects and runs that statement once more. This is safe to
+    retry: autocommit is off and nothing else ran on the session, so the server discarded any
+    partial work with the dead connection.
+    """
+
+    def __init__(self, pool, cnx, verified: bool):
+        super().__init__(pool, cnx)
+        self.verified = verified
+        self.handed_off = False  # see hand_off()
+
+    def cursor(self, *args, **kwargs):
+        cursor = self._cnx.cursor(*args, **kwargs)
+        if not self.verified:
+            for name in ("execute", "executemany"):
+                try:
+                    setattr(cursor, name, self._retry_first(cursor, getattr(cursor, name)))
+                except AttributeError:
+                    # Cursor class that cannot be wrapped: fall back to checking up front
+                    self._cnx.ping(reconnect=True)
+                    self.verified = True
+                    return cursor
+        return cursor
+
+    def _retry_first(self, cursor, method):
+        def call(*args, **kwargs):
+            return self.run_first(method, *args, **kwargs)
+        return call
+
+    def run_first(self, method, *args, **kwargs):
+        """Call method(*args, **kwargs), retrying it once after a reconnect if it is the first statement."""
+        if self.verified:
+            return method(*args, **kwargs)
+        try:
+            result = method(*args, **kwargs)
+        except mysql.connector.Error as err:
+            if self.verified or err.errno not in STALE_CONNECTION_ERRNOS:
+                raise
+            self.verified = True
+            print(f"[DB] Stale pooled connection ({err.errno}); reconnecting and retrying once.")
+            self._cnx.reconnect(attempts=1)
+            return method(*args, **kwargs)
+        self.verified = True
+        return result
+
+
+class InstrumentedPool(pooling.MySQLConnectionPool):
+    """
+    MySQLConnectionPool that queues checkouts (up to CHECKOUT_TIMEOUT) while every connection is
+    in use, pings only connections idle past IDLE_PING_SECONDS, and reports checkout wait, hold
+    time per label, in-use counts and exhaustion to `metrics` (pool_metrics.metrics by default).
+
+    Connections are opened on demand, up to pool_size, instead of all of them one after another
+    while the module is imported; prewarm() opens a few ahead of the first requests.
+    """
+
+    def __init__(self, metrics: pool_metrics.PoolMetrics = None, pool_name: str = None,
+                 pool_size: int = 5, pool_reset_session: bool = True, **kwargs):
+        self._metrics = metrics or pool_metrics.metrics
+        self._returned = threading.Condition()
+        self._checked_out = {}  # id(raw connection) -> (checked out at, label)
+        self._last_used = {}  # id(raw connection) -> when it was last returned (monotonic)
+        self._opened = 0  # connections opened so far (never more than pool_size)
+        # Without connection arguments the base class opens nothing; set_config only validates them
+        super().__init__(pool_name=pool_name, pool_size=pool_size, pool_reset_session=pool_reset_session)
+        self.set_config(**kwargs)
+        self._metrics.pool_size = self.pool_size
+
+    def _open(self):
+        """
+        Open one more connection if the pool is below pool_size, else None. The handshake runs
+        outside the pool lock, so prewarm() and concurrent first requests connect in parallel.
+        """
+        with self._returned:
+            if self._opened >= self.pool_size:
+                return None
+            self._opened += 1
+        try:
+            cnx = pooling.connect(**self._cnx_config)
+        except Exception:
+            with self._returned:
+                self._opened -= 1
+            raise
+        cnx.pool_config_version = self._config_version
+        return cnx
+
+    def prewarm(self, count: int) -> int:
+        """Open up to count connections (concurrently) and leave them idle in the pool; returns how many opened."""
+        count = max(min(count, self.pool_size - self._opened), 0)
+        if not count:
+            return 0
+
+        def open_one(_):
+            try:
+                return self._open()
+            except mysql.connector.Error as err:
+                return err
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            results = list(executor.map(open_one, range(count)))
+        opened = [cnx for cnx in results if cnx is not None and not isinstance(cnx, mysql.connector.Error)]
+        for cnx in opened:
+            self.add_connection(cnx)  # just connected: the first checkout skips the ping
+        errors = [err for err in results if isinstance(err, mysql.connector.Error)]
+        if errors and not opened:
+            raise errors[0]
+        return len(opened)
+
+    def _checkout(self) -> LazyPingConnection:
+        """
+        MySQLConnectionPool.get_connection without its unconditional is_connected() — a ping on
+        every checkout, made while holding the module-wide pool lock. Only connections idle for more
+        than IDLE_PING_SECONDS (or never handed out) are pinged, outside the lock.
+        """
+        with pooling.CONNECTION_POOL_LOCK:
+            try:
+                cnx = self._cnx_queue.get(block=False)
+            except queue.Empty:
+                cnx = None
+        if cnx is None:
+            cnx = self._open()
+            if cnx is None:
+                raise pooling.PoolError("Failed getting connection; pool exhausted")
+            return LazyPingConnection(self, cnx, verified=True)
+        try:
+            if self._config_version != cnx.pool_config_version:
+                cnx.config(**self._cnx_config)
+                cnx.reconnect()
+                cnx.pool_config_version = self._config_version
+                verified = True
+            else:
+                last_used = self._last_used.get(id(cnx))
+                verified = last_used is None or time.monotonic() - last_used > IDLE_PING_SECONDS
+                if verified:
+                    cnx.ping(reconnect=True, attempts=1)
+        except mysql.connector.Error:
+            # Failed to reconnect, give connection back to pool
+            self._queue_connection(cnx)
+            raise
+        return LazyPingConnection(self, cnx, verified)
+
+    def get_connection(self, label: str = "background", timeout: float = CHECKOUT_TIMEOUT):
+        started = time.monotonic()
+        exhausted = False
+        while True:
+            try:
+                pooled = self._checkout()
+                break
+            except pooling.PoolError:
+                if not exhausted:
+                    self._metrics.exhausted()
+                    exhausted = True
+                remaining = started + timeout - time.monotonic()
+                if remaining <= 0:
+                    self._metrics.timed_out()
+                    raise
+                with self._returned:
+                    # Bounded wait: a return can slip in between the failed get and this wait
+                    self._returned.wait(min(remaining, 0.1))
+        now = time.monotonic()
+        with self._returned:
+            self._checked_out[id(pooled._cnx)] = (now, label)
+        self._metrics.checked_out(now - started)
+        return pooled
+
+    def _end_transaction(self, cnx) -> bool:
+        """
+        Roll back whatever the request left open, so the next checkout does not inherit its
+        transaction or REPEATABLE READ snapshot. Stands in for pool_reset_session, which would also
+        deallocate the connection's prepared statements (statements.py); nothing here sets other
+        session state. Returns False if the connection looks broken.
+        """
+        try:
+            if cnx.in_transaction or cnx.unread_result:
+                cnx.rollback()
+        except mysql.connector.Error as err:
+            print(f"[DB] Rollback on return failed ({err}); connection will be pinged on next checkout.")
+            return False
+        return True
+
+    def add_connection(self, cnx=None):
+        healthy = True
+        try:
+            if cnx is not None and not self.reset_session:
+                healthy = self._end_transaction(cnx)
+            super().add_connection(cnx)
+        finally:
+            if cnx is not None:
+                with self._returned:
+                    if healthy:
+                        self._last_used[id(cnx)] = time.monotonic()
+                    else:
+                        self._last_used.pop(id(cnx), None)
+                    entry = self._checked_out.pop(id(cnx), None)
+                    self._returned.notify()
+                if entry is not None:
+                    self._metrics.returned(entry[1], time.monotonic() - entry[0])
+
+
 # Create a connection pool: enough lanes for many concurrent slow connections.
-# pool_size=20 gives enough open lanes; mysql.connector has no max_overflow or pool_recycle
-# (use pool_reset_session + ping(reconnect=True) below to avoid stale connections).
+# pool_size=20 gives enough open lanes, opened as needed (main.prewarm_pools opens
+# config.DB_POOL_PREWARM of them at startup); mysql.connector has no max_overflow or pool_recycle
+# (InstrumentedPool's idle-threshold ping and stale-connection retry keep connections usable
+# without a round trip per checkout). pool_reset_session is off so prepared statements survive
+# between requests; add_connection rolls back any open transaction instead.
+# GET /admin/pool/stats and GET /health/ready show whether the size fits the load.
 try:
-    connection_pool = pooling.MySQLConnectionPool(
+    connection_pool = InstrumentedPool(
         pool_name="findit_pool",
-        pool_size=20,
-        pool_reset_session=True,
+        pool_size=POOL_SIZE,
+        pool_reset_session=False,
         **db_config
     )
     print("Database connection pool created successfully")
@@ -25,19 +258,150 @@ except mysql.connector.Error as err:
     print(f"Error creating connection pool: {err}")
     connection_pool = None
 
+# Optional read replica (DB_REPLICA_HOST). Known read-only handlers take get_read_db_connection,
+# which routes them here unless the caller needs read-your-writes (see use_primary).
+replica_metrics = pool_metrics.PoolMetrics()
+replica_pool = None
+if config.DB_REPLICA_HOST:
+    try:
+        replica_pool = InstrumentedPool(
+            metrics=replica_metrics,
+            pool_name="findit_replica_pool",
+            pool_size=POOL_SIZE,
+            pool_reset_session=False,
+            **replica_db_config
+        )
+        print(f"Replica connection pool created successfully ({config.DB_REPLICA_HOST})")
+    except mysql.connector.Error as err:
+        print(f"Error creating replica connection pool, reads stay on the primary: {err}")
+
+
+def route_label(request: Request) -> str:
+    route = request.scope.get("route")
+    return f"{request.method} {getattr(route, 'path', request.url.path)}"
+
+
+def _yield_from(pool, request: Request):
+    try:
+        connection = pool.get_connection(label=route_label(request))
+    except pooling.PoolError:
+        raise HTTPException(status_code=503, detail="Database is busy, please retry")
+    try:
+        yield connection
+    finally:
+        if not connection.handed_off:
+            connection.close()
+
 
-def get_db_connection():
+def hand_off(connection):
     """
-    Get a connection from the pool. Pre-pings so only alive connections are used;
+    Take over the request's connection from its dependency, which then leaves it checked out; the
+    new owner must close() it. For responses that keep reading after the handler returns (NDJSON
+    streams), so they do not hold a second connection from the pool alongside the request's.
+    """
+    connection.handed_off = True
+    return connection
+
+
+def get_db_connection(request: Request):
+    """
+    Get a connection from the pool. Only connections idle past IDLE_PING_SECONDS are pinged; a
+    stale one is reconnected on its first statement (LazyPingConnection).
     try/finally ensures connection.close() so the pool doesn't exhaust.
     Use as a FastAPI dependency: db=Depends(get_db_connection).
+    Hold time is recorded under the route's path template (see pool_metrics.py).
     """
     if not connection_pool:
         raise Exception("Database connection pool is not initialized")
-    connection = connection_pool.get_connection()
+    yield from _yield_from(connection_pool, request)
+
+
+# ── Read routing ──
+# A user's own writes must be visible to their next reads, but the replica may lag behind the
+# primary. After a successful write request (any method other than GET/HEAD/OPTIONS, see
+# track_user_writes in main.py) the user's reads go to the primary for READ_YOUR_WRITES_SECONDS.
+# This is per worker; a client that needs a fresh read regardless (e.g. right after a write that
+# another worker handled) can send READ_PRIMARY_HEADER: primary.
+# The in-process read caches (response_cache.py) follow the same routing: reads that use_primary()
+# bypass them, and replica reads do not refill them within REPLICA_LAG_SECONDS of an invalidation.
+READ_YOUR_WRITES_SECONDS = 10.0
+# Replication lag we plan for: the same window that keeps a writer's own reads on the primary
+REPLICA_LAG_SECONDS = READ_YOUR_WRITES_SECONDS
+READ_PRIMARY_HEADER = "X-Read-Consistency"
+
+_recent_writers = {}  # user id -> monotonic time until which their reads use the primary
+_recent_writers_lock = threading.Lock()
+
+
+def mark_write(user_id):
+    now = time.monotonic()
+    with _recent_writers_lock:
+        _recent_writers[user_id] = now + READ_YOUR_WRITES_SECONDS
+        if len(_recent_writers) > 10000:
+            for uid in [uid for uid, until in _recent_writers.items() if until <= now]:
+                del _recent_writers[uid]
+
+
+def use_primary(request: Request) -> bool:
+    """Whether this read must see the primary (client asked for it, or the user wrote recently)."""
+    if request.headers.get(READ_PRIMARY_HEADER, "").lower() == "primary":
+        return True
+    user_id = user_id_from_request(request)
+    if user_id is None:
+        return False
+    with _recent_writers_lock:
+        until = _recent_writers.get(user_id)
+    return until is not None and until > time.monotonic()
+
+
+def reads_replica(request: Request) -> bool:
+    """Whether this request's read-only queries go to the replica."""
+    return replica_pool is not None and not use_primary(request)
+
+
+def cache_settle_seconds(request: Request) -> float:
+    """
+    settle_seconds for response_cache puts of what this request read: REPLICA_LAG_SECONDS when it read
+    the replica, which may not have applied a write the cache was just invalidated for; 0 for the primary.
+    """
+    return REPLICA_LAG_SECONDS if reads_replica(request) else 0.0
+
+
+def get_read_db_connection(request: Request):
+    """
+    Dependency for read-only handlers: a replica connection, or a primary one when use_primary()
+    says the read must be fresh. Handlers taking it must never write.
+    """
+    if reads_replica(request):
+        yield from _yield_from(replica_pool, request)
+    else:
+        yield from get_db_connection(request)
+
+
+if replica_pool is None:
+    # No replica: share the request's primary connection (FastAPI caches a dependency per request,
+    # so handlers that also need require_admin do not check out a second connection)
+    get_read_db_connection = get_db_connection  # noqa: F811
+
+
+def read_pool(request: Request):
+    """The pool a read-only helper that checks out its own connection (e.g. streaming) should use."""
+    return replica_pool if reads_replica(request) else connection_pool
+
+
+def with_connection(label: str, fn, *args, pool=None):
+    """
+    Run fn(connection, *args) on a connection from pool (default: the primary) and return its
+    result. For the sync helpers that async routes call through run_in_threadpool.
+    """
+    pool = pool or connection_pool
+    if not pool:
+        raise Exception("Database connection pool is not initialized")
     try:
-        # Ensure connection is alive before use (reconnect if needed) — warm, instant queries
-        connection.ping(reconnect=True)
-        yield connection
+        connection = pool.get_connection(label=label)
+    except pooling.PoolError:
+        raise HTTPException(status_code=503, detail="Database is busy, please retry")
+    try:
+        return fn(connection, *args)
     finally:
         connection.close()
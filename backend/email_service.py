@@ -3,19 +3,25 @@ Email sending via Resend API (works on Render free tier; no SMTP ports 25/465/58
 Uses RESEND_API_KEY from environment. Designed to run in FastAPI BackgroundTasks.
 Use onboarding@resend.dev as From until you have a verified domain in Resend.
 """
-import os
 import traceback
-import resend
-import config  # for MAIL_FROM
+import config  # for MAIL_FROM, RESEND_API_KEY
 
 # API key from environment (required for Resend)
-RESEND_API_KEY = os.environ.get("RESEND_API_KEY")
+RESEND_API_KEY = config.RESEND_API_KEY
 # From: use MAIL_FROM only if set (verified domain); otherwise Resend requires onboarding@resend.dev
 _raw_from = (config.MAIL_FROM or "").strip()
 SENDER_EMAIL = _raw_from if _raw_from else "Findit <onboarding@resend.dev>"
 print(f"[EMAIL] Sender (From) address: {SENDER_EMAIL!r} (use onboarding@resend.dev if no verified domain)")
 
 
+def _resend():
+    """The Resend SDK, imported on the first email (these run as background tasks) instead of at startup."""
+    import resend
+
+    resend.api_key = RESEND_API_KEY
+    return resend
+
+
 def send_login_alert_email(user_email: str, user_name: str):
     """
     Sends a security alert email on successful login.
@@ -51,7 +57,7 @@ def send_login_alert_email(user_email: str, user_name: str):
 """
     try:
         print("[EMAIL] send_login_alert_email Setting resend.api_key")
-        resend.api_key = RESEND_API_KEY
+        resend = _resend()
         print("[EMAIL] send_login_alert_email Calling Resend API (Emails.send)...")
         resend.Emails.send({
             "from": SENDER_EMAIL,
@@ -97,7 +103,7 @@ def send_reset_code_email(user_email: str, otp: str):
 """
     try:
         print("[EMAIL] send_reset_code_email Setting resend.api_key")
-        resend.api_key = RESEND_API_KEY
+        resend = _resend()
         print("[EMAIL] send_reset_code_email Calling Resend API (Emails.send)...")
         resend.Emails.send({
             "from": SENDER_EMAIL,
@@ -140,7 +146,7 @@ def send_welcome_email(user_email: str, user_name: str):
 """
     try:
         print("[EMAIL] send_welcome_email Setting resend.api_key")
-        resend.api_key = RESEND_API_KEY
+        resend = _resend()
         print("[EMAIL] send_welcome_email Calling Resend API (Emails.send)...")
         resend.Emails.send({
             "from": SENDER_EMAIL,
@@ -183,7 +189,7 @@ def send_item_notification(user_email: str, user_name: str, item_title: str, ite
 """
     try:
         print("[EMAIL] send_item_notification Setting resend.api_key")
-        resend.api_key = RESEND_API_KEY
+        resend = _resend()
         print("[EMAIL] send_item_notification Calling Resend API (Emails.send)...")
         resend.Emails.send({
             "from": SENDER_EMAIL,
@@ -195,3 +201,44 @@ def send_item_notification(user_email: str, user_name: str, item_title: str, ite
     except Exception as e:
         print(f"[EMAIL ERROR] send_item_notification FAILED to {user_email}: {e!r}")
         traceback.print_exc()
+
+
+def send_saved_search_alert(user_email: str, user_name: str, item_title: str, item_id: int, search_label: str):
+    """
+    Tells a user that a newly reported item matches one of their saved searches. Safe to run in a BackgroundTask.
+    """
+    print(f"[EMAIL] send_saved_search_alert START to={user_email!r} item_id={item_id} search={search_label!r}")
+    if not RESEND_API_KEY:
+        print("[EMAIL] send_saved_search_alert ABORT: RESEND_API_KEY not set; skipping saved search alert.")
+        return
+    name = user_name or "User"
+    subject = "New match for your saved search — Findit"
+    html_body = f"""\
+<html>
+  <body style="font-family: Arial, sans-serif; color: #333; max-width: 600px; margin: 0 auto;">
+    <div style="background-color: #003898; padding: 20px; text-align: center; border-radius: 8px 8px 0 0;">
+      <h1 style="color: #ffffff; margin: 0;">Findit</h1>
+    </div>
+    <div style="padding: 30px; background-color: #f9f9f9; border: 1px solid #e0e0e0; border-top: none; border-radius: 0 0 8px 8px;">
+      <h2 style="color: #333;">New match for your saved search</h2>
+      <p>Hello <strong>{name}</strong>,</p>
+      <p>A new item &quot;{item_title}&quot; (ID: {item_id}) matches your saved search <strong>{search_label}</strong>.</p>
+      <p>Open Findit to view it and start a claim if it is yours.</p>
+      <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 20px 0;" />
+      <p style="font-size: 12px; color: #999;">You are receiving this because you saved this search on Findit. Delete the saved search to stop these alerts.</p>
+    </div>
+  </body>
+</html>
+"""
+    try:
+        resend = _resend()
+        resend.Emails.send({
+            "from": SENDER_EMAIL,
+            "to": [user_email],
+            "subject": subject,
+            "html": html_body,
+        })
+        print(f"[EMAIL] send_saved_search_alert SUCCESS: alert sent to {user_email} for item #{item_id}")
+    except Exception as e:
+        print(f"[EMAIL ERROR] send_saved_search_alert FAILED to {user_email}: {e!r}")
+        traceback.print_exc()
@@ -0,0 +1,192 @@
+"""
+facets.py — Filter-chip counts per status, category and location for the browse page.
+
+The unfiltered/structured case (status and category filters only) is answered from an in-memory
+aggregate: a Counter of (status, category, location) -> number of items. It is loaded with one
+GROUP BY on first use and then maintained incrementally through item_events, so requests never
+scan. The counter is small (distinct combinations, not items) and is re-read from the primary every
+REFRESH_SECONDS to absorb writes made by other workers; writes hooked in while that GROUP BY runs
+are replayed onto the new counter (see FacetCounter).
+
+Searches (?q=) depend on the text match, so those counts are computed once per distinct filter set
+over the matching rows only and kept in a short-TTL LRU (response_cache) that every item write clears.
+
+Facets are disjunctive: each dimension ignores its own filter, so with ?status=Lost the status
+counts still show how many Found items there are.
+"""
+import threading
+import time
+from collections import Counter
+from typing import Iterable, Optional, Tuple
+
+from response_cache import LRUTTLCache
+
+REFRESH_SECONDS = 60
+SEARCH_TTL_SECONDS = 30
+OTHER_LOCATION = "Other"
+
+Triple = Tuple[str, Optional[str], Optional[str]]
+
+
+def canonical_location(location: Optional[str]) -> Optional[str]:
+    """'Other - behind the chapel' and free text prefixed 'Other' collapse into a single 'Other' chip."""
+    loc = (location or "").strip()
+    if not loc:
+        return None
+    if loc.lower().startswith("other"):
+        return OTHER_LOCATION
+    return loc
+
+
+def tally(triples: Iterable[Tuple[Triple, int]], status: Optional[str] = None, category: Optional[str] = None) -> dict:
+    """Disjunctive facet counts from ((status, category, location), count) pairs."""
+    by_status, by_category, by_location = Counter(), Counter(), Counter()
+    total = 0
+    for (item_status, item_category, location), n in triples:
+        status_ok = not status or item_status == status
+        category_ok = not category or item_category == category
+        if category_ok:
+            by_status[item_status] += n
+        if status_ok and item_category:
+            by_category[item_category] += n
+        if status_ok and category_ok:
+            total += n
+            if location:
+                by_location[location] += n
+    return {
+        "status": dict(by_status),
+        "category": dict(by_category),
+        "location": dict(by_location),
+        "total": total,
+    }
+
+
+class FacetCounter:
+    """
+    Thread-safe (status, category, canonical location) -> count aggregate.
+
+    A reload runs its GROUP BY without holding the lock while item_events keeps calling add() and
+    remove(). begin_reload() starts recording those deltas; finish_reload() builds the new counter
+    off to the side, replays the recorded deltas onto it and swaps it in under the lock, so an item
+    written during the reload is counted once rather than lost. (A write committed just before the
+    GROUP BY whose hook runs after begin_reload() is counted twice until the next refresh; hooks run
+    right after the commit, so that window is microseconds.) clear() or invalidate() during a
+    reload discards its result, since the rows may predate them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._loaded_at = 0.0
+        self._epoch = 0  # bumped by clear() and invalidate()
+        self._pending = None  # deltas recorded while a reload runs, else None
+
+    @staticmethod
+    def _key(status, category, location) -> Triple:
+        return (status, category or None, canonical_location(location))
+
+    @staticmethod
+    def _apply(counts: Counter, key: Triple, n: int):
+        counts[key] += n
+        if counts[key] <= 0:
+            del counts[key]
+
+    def begin_reload(self) -> Optional[int]:
+        """Start recording deltas for a reload; None if another reload is already running."""
+        with self._lock:
+            if self._pending is not None:
+                return None
+            self._pending = []
+            return self._epoch
+
+    def finish_reload(self, rows, token: int):
+        """Swap in the aggregate of (status, category, location, count) rows plus the deltas since begin_reload()."""
+        counts = Counter()
+        for status, category, location, n in rows:
+            counts[self._key(status, category, location)] += n
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if token != self._epoch:
+                return
+            for key, n in pending:
+                self._apply(counts, key, n)
+            self._counts = counts
+            self._loaded_at = time.monotonic()
+
+    def abort_reload(self):
+        with self._lock:
+            self._pending = None
+
+    def load(self, rows):
+        """Replace the aggregate from (status, category, location, count) rows."""
+        token = self.begin_reload()
+        if token is not None:
+            self.finish_reload(rows, token)
+
+    def add(self, status, category, location, n: int = 1):
+        key = self._key(status, category, location)
+        with self._lock:
+            self._apply(self._counts, key, n)
+            if self._pending is not None:
+                self._pending.append((key, n))
+
+    def remove(self, status, category, location):
+        self.add(status, category, location, -1)
+
+    def move(self, old_status, new_status, category, location):
+        if old_status == new_status:
+            return
+        self.remove(old_status, category, location)
+        self.add(new_status, category, location)
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = 0.0
+            self._epoch += 1
+
+    def clear(self):
+        with self._lock:
+            self._counts = Counter()
+            self._epoch += 1
+
+    def is_stale(self) -> bool:
+        return not self._loaded_at or time.monotonic() - self._loaded_at > REFRESH_SECONDS
+
+    def snapshot(self):
+        with self._lock:
+            return list(self._counts.items())
+
+
+counter = FacetCounter()
+
+# ?q= facet results keyed by (normalized q, status, category)
+search_cache = LRUTTLCache("item_facets", max_entries=256, ttl_seconds=SEARCH_TTL_SECONDS)
+
+
+def ensure_loaded(db):
+    """
+    Reload the counter if stale. db must be a primary connection: add()/remove() run as soon as a
+    write commits, so a lagging replica would return counts missing writes already applied.
+    """
+    if not counter.is_stale():
+        return
+    token = counter.begin_reload()
+    if token is None:
+        return  # another request is reloading; the current counts are still maintained meanwhile
+    cursor = db.cursor()
+    try:
+        cursor.execute("SELECT status, category, location, COUNT(*) FROM items GROUP BY status, category, location")
+        counter.finish_reload(cursor.fetchall(), token)
+    except BaseException:
+        counter.abort_reload()
+        raise
+    finally:
+        cursor.close()
+
+
+def triples_from_rows(rows) -> Iterable[Tuple[Triple, int]]:
+    """Canonicalize (status, category, location, count) rows from a GROUP BY."""
+    merged = Counter()
+    for status, category, location, n in rows:
+        merged[FacetCounter._key(status, category, location)] += n
+    return merged.items()
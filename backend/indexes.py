@@ -0,0 +1,167 @@
+"""
+indexes.py — Composite indexes for the hot query shapes, and an EXPLAIN check that they are used.
+
+  messages       thread reads: WHERE item_id = ? AND ((sender, receiver) pair either way)
+                 ORDER BY created_at — message history and the conversation_summary.py backfill
+  conversations  the conversation list: WHERE finder_id = ? OR claimer_id = ? ORDER BY created_at
+  items          the feed filtered by status (and category), newest first
+  audit_logs     the admin log (newest first) and last-login lookups per user
+
+The messages index leads with (item_id, created_at) rather than (item_id, sender_id, receiver_id):
+the sender/receiver condition is an OR of two pairs, so an index on the pair would give two ranges
+that still need a sort, while this one returns an item's messages already in created_at order and
+filters the pair inside the index (index condition pushdown). An item has few messages.
+
+The indexes are created by migrations/0007_hot_query_indexes.py in place (ALGORITHM=INPLACE),
+with the lock level left to MySQL, which allows concurrent writes where the table permits; InnoDB
+appends the primary key to each, so created_at order is also (created_at, id) order.
+
+`python indexes.py` runs EXPLAIN on each hot query against the configured database and exits
+non-zero if one does a full scan, misses its index or sorts rows it should read in index order.
+The SQL is the handlers' own (main.message_history_sql, CONVERSATION_LIST_SQL, feed_query,
+AUDIT_LOG_SQL, ADMIN_USERS_QUERY), so a change to a query is checked as soon as it is made.
+Run it against a copy with realistic data: on a near-empty table the optimizer may rightly prefer
+a scan. Usage: python indexes.py
+"""
+import argparse
+import sys
+from typing import List, NamedTuple, Sequence
+
+import main
+import pagination
+
+
+class HotQuery(NamedTuple):
+    name: str
+    sql: str
+    params: str  # key into sample_params()
+    table: str  # table (or alias) whose access is checked
+    indexes: Sequence[str]  # any of these counts as covered
+    allow_filesort: bool = False
+
+
+# The handlers' own SQL, so the check covers what production runs
+_FEED_PAGE = " LIMIT %s"  # get_items adds this after feed_query's ORDER BY
+
+HOT_QUERIES = [
+    HotQuery(
+        "message history",
+        main.message_history_sql(with_system=True),
+        "thread_with_system", "messages", ["idx_messages_item_created"],
+    ),
+    HotQuery(
+        "message history (no System user)",
+        main.message_history_sql(with_system=False),
+        "thread", "messages", ["idx_messages_item_created"],
+    ),
+    # finder OR claimer is answered by merging the two per-user ranges, which cannot come back in
+    # created_at order; only the user's own conversations are sorted
+    HotQuery(
+        "conversation list",
+        main.CONVERSATION_LIST_SQL,
+        "user_twice", "c", ["idx_conversations_finder", "idx_conversations_claimer"], allow_filesort=True,
+    ),
+    HotQuery(
+        "feed by status",
+        main.feed_query(None, None, "status", None, None)[0] + _FEED_PAGE,
+        "status_page", "i", ["idx_items_status_created", "idx_items_status_category_created"],
+    ),
+    HotQuery(
+        "feed by status and category",
+        main.feed_query(None, None, "status", "category", None)[0] + _FEED_PAGE,
+        "status_category_page", "i", ["idx_items_status_category_created"],
+    ),
+    HotQuery(
+        "admin audit log",
+        main.AUDIT_LOG_SQL,
+        "audit_page", "a", ["idx_audit_logs_created"],
+    ),
+    # The per-user subquery of the admin user list
+    HotQuery(
+        "last login of a user",
+        main.ADMIN_USERS_QUERY,
+        "none", "audit_logs", ["idx_audit_logs_user_action"],
+    ),
+]
+
+
+def sample_params(cursor) -> dict:
+    """Parameters taken from existing rows (EXPLAIN on ids that do not exist says little)."""
+    cursor.execute("SELECT item_id, finder_id, claimer_id FROM conversations ORDER BY id DESC LIMIT 1")
+    convo = cursor.fetchone() or (1, 1, 2)
+    cursor.execute("SELECT status, category FROM items WHERE category IS NOT NULL ORDER BY id DESC LIMIT 1")
+    item = cursor.fetchone() or ("Found", "Electronics")
+    cursor.execute("SELECT id FROM users WHERE email = 'system@findit.internal' LIMIT 1")
+    system = cursor.fetchone() or (0,)
+    item_id, finder_id, claimer_id = convo
+    page = pagination.DEFAULT_PAGE_SIZE + 1
+    thread = (item_id, finder_id, claimer_id, claimer_id, finder_id)
+    return {
+        "thread": thread,
+        "thread_with_system": thread + (system[0],),
+        "user_twice": (finder_id, finder_id),
+        "status_page": (item[0], page),
+        "status_category_page": (item[0], item[1], page),
+        "audit_page": (100,),
+        "none": (),
+    }
+
+
+def explain(cursor, sql: str, params) -> List[dict]:
+    cursor.execute("EXPLAIN " + sql, params)
+    columns = [d[0] for d in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def check_query(cursor, query: HotQuery, params) -> List[str]:
+    """Problems with the plan for one hot query (empty when it is served by its index)."""
+    plan = explain(cursor, query.sql, params)
+    row = next((r for r in plan if r.get("table") == query.table), None)
+    if row is None:
+        return [f"{query.name}: no plan row for {query.table} ({plan})"]
+    problems = []
+    used = set((row.get("key") or "").split(","))
+    extra = row.get("Extra") or ""
+    if row.get("type") == "ALL":
+        problems.append(f"{query.name}: full scan of {query.table}")
+    elif not used.intersection(query.indexes):
+        problems.append(f"{query.name}: uses {row.get('key')!r}, expected one of {list(query.indexes)}")
+    if "filesort" in extra and not query.allow_filesort:
+        problems.append(f"{query.name}: filesort ({extra})")
+    return problems
+
+
+def check_all(cursor) -> List[str]:
+    samples = sample_params(cursor)
+    problems = []
+    for query in HOT_QUERIES:
+        found = check_query(cursor, query, samples[query.params])
+        print(f"  {'FAIL' if found else 'ok  '}  {query.name}")
+        problems.extend(found)
+    return problems
+
+
+def main():
+    import mysql.connector
+    import config
+
+    argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter).parse_args()
+
+    conn = mysql.connector.connect(
+        host=config.DB_HOST, user=config.DB_USER, password=config.DB_PASSWORD,
+        database=config.DB_NAME, port=config.DB_PORT,
+    )
+    cursor = conn.cursor()
+    try:
+        print("EXPLAIN check of the hot queries:")
+        problems = check_all(cursor)
+    finally:
+        cursor.close()
+        conn.close()
+    for problem in problems:
+        print(f"  - {problem}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
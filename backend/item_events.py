@@ -0,0 +1,76 @@
+"""
+item_events.py — Write hooks that keep in-process item indexes and caches in step with the items table.
+
+Call these after the corresponding change is committed. Item arguments are dicts (or dict rows)
+carrying at least id, and status/category/location/title/keywords/image_phash where the hook needs them.
+"""
+import facets
+import matching
+import photo_hash
+import response_cache
+import trigram
+
+
+def _drop_cached_reads(item_ids=()):
+    response_cache.items_feed.clear()
+    facets.search_cache.clear()
+    for item_id in item_ids:
+        response_cache.item_detail.invalidate(item_id)
+
+
+def item_created(item: dict):
+    """A new item row was committed. Queues it for Lost/Found match scoring."""
+    trigram.index.add(item["id"], item.get("title"), item.get("keywords"))
+    photo_hash.index.add(item["id"], item.get("image_phash"))
+    facets.counter.add(item.get("status"), item.get("category"), item.get("location"))
+    _drop_cached_reads()
+    matching.enqueue(item["id"])
+
+
+def items_imported(items):
+    """A batch of item rows was committed (admin bulk import). Clears cached reads once for the batch."""
+    for item in items:
+        trigram.index.add(item["id"], item.get("title"), item.get("keywords"))
+        facets.counter.add(item.get("status"), item.get("category"), item.get("location"))
+        matching.enqueue(item["id"])
+    _drop_cached_reads()
+
+
+def item_updated(item_id: int):
+    """Columns of an item that reads return changed (e.g. a new verification PIN)."""
+    _drop_cached_reads([item_id])
+
+
+def items_deleted(items):
+    """Item rows were deleted. Each entry needs id, status, category and location."""
+    for item in items:
+        trigram.index.remove(item["id"])
+        photo_hash.index.remove(item["id"])
+        facets.counter.remove(item.get("status"), item.get("category"), item.get("location"))
+    _drop_cached_reads([item["id"] for item in items])
+    matching.invalidate()
+
+
+def item_status_changed(item_id: int, old_status: str, new_status: str, category=None, location=None):
+    """An item's status changed (PIN verified, handover completed)."""
+    facets.counter.move(old_status, new_status, category, location)
+    _drop_cached_reads([item_id])
+    matching.invalidate()
+
+
+def items_changed():
+    """Bulk or untracked change (e.g. location normalization): rebuild derived state on next use."""
+    facets.counter.invalidate()
+    matching.invalidate()
+    _drop_cached_reads()
+    response_cache.item_detail.clear()
+
+
+def items_wiped():
+    """The items table was emptied."""
+    trigram.index.clear()
+    photo_hash.index.clear()
+    facets.counter.clear()
+    matching.invalidate()
+    _drop_cached_reads()
+    response_cache.item_detail.clear()
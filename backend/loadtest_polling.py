@@ -0,0 +1,105 @@
+"""
+loadtest_polling.py - Throughput of the chat polling endpoints under many concurrent pollers.
+
+Simulates N clients polling like messages/page.tsx and messages/[id]/page.tsx: each loops over
+GET /conversations, GET /conversations/{id}/messages and GET /users/me (plus GET /items?limit=20
+with --feed) and sleeps --interval seconds between rounds (0 = as fast as the server answers).
+Reports completed requests per second, latency percentiles and error counts.
+
+To compare the sync and async paths, run it against a server started from the commit before the
+async port and again from this one, with the same --workers setting and database:
+
+    uvicorn main:app --workers 1 --port 8000
+    python loadtest_polling.py --pollers 500 --duration 60 --user-id 12 --email you@example.com --conversation 3
+
+The token is minted with SECRET_KEY from the environment (auth_utils.create_access_token), so the
+user must exist in the database the server uses; alternatively pass --token.
+Needs httpx (pip install httpx), which the server itself does not.
+
+Usage: python loadtest_polling.py [--base-url http://localhost:8000] [--pollers 500] [--duration 60]
+                                  [--interval 0] [--feed] (--token T | --user-id ID --email E)
+                                  [--conversation ID]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+
+async def poller(client, paths, deadline, interval, latencies, outcomes):
+    while time.monotonic() < deadline:
+        for path in paths:
+            t0 = time.perf_counter()
+            try:
+                response = await client.get(path)
+                outcomes[response.status_code] += 1
+            except httpx.HTTPError as err:
+                outcomes[type(err).__name__] += 1
+                continue
+            latencies.append(time.perf_counter() - t0)
+        if interval:
+            await asyncio.sleep(interval)
+
+
+async def run(args, token):
+    paths = ["/conversations", "/users/me"]
+    if args.conversation:
+        paths.insert(1, f"/conversations/{args.conversation}/messages")
+    if args.feed:
+        paths.append("/items?limit=20")
+    limits = httpx.Limits(max_connections=args.pollers, max_keepalive_connections=args.pollers)
+    latencies, outcomes = [], Counter()
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"},
+        limits=limits,
+        timeout=httpx.Timeout(30.0),
+    ) as client:
+        started = time.monotonic()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            poller(client, paths, deadline, args.interval, latencies, outcomes) for _ in range(args.pollers)
+        ))
+        elapsed = time.monotonic() - started
+    return latencies, outcomes, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--pollers", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--interval", type=float, default=0.0, help="seconds between a poller's rounds")
+    parser.add_argument("--feed", action="store_true", help="also poll GET /items?limit=20")
+    parser.add_argument("--conversation", type=int, help="conversation id for the message-history poll")
+    parser.add_argument("--token")
+    parser.add_argument("--user-id", type=int)
+    parser.add_argument("--email")
+    args = parser.parse_args()
+
+    token = args.token
+    if not token:
+        if args.user_id is None or not args.email:
+            parser.error("pass --token, or --user-id and --email to mint one")
+        from auth_utils import create_access_token
+        token = create_access_token({"sub": args.email, "id": args.user_id, "role": "student"})
+
+    latencies, outcomes, elapsed = asyncio.run(run(args, token))
+    latencies.sort()
+    ok = sum(count for status, count in outcomes.items() if status == 200)
+    print(f"{args.pollers} pollers for {elapsed:.1f}s against {args.base_url}")
+    print(f"  throughput: {ok / elapsed:8.1f} ok req/s   ({sum(outcomes.values())} responses)")
+    if latencies:
+        def pct(p):
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+        print(f"  latency:    p50 {pct(0.50):7.1f} ms   p95 {pct(0.95):7.1f} ms   p99 {pct(0.99):7.1f} ms"
+              f"   mean {statistics.fmean(latencies) * 1000:7.1f} ms")
+    print(f"  outcomes:   {dict(sorted(outcomes.items(), key=lambda kv: str(kv[0])))}")
+
+
+if __name__ == "__main__":
+    main()
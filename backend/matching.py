@@ -0,0 +1,306 @@
+"""
+matching.py — Lost-to-Found matching engine.
+
+When an item is reported, a background worker scores it against every open item of the opposite
+status (a Lost report against Found items and vice versa) and stores the best pairs in
+item_matches, in both directions, so GET /items/{id}/matches is one read on the
+(item_id, score) index.
+
+Scoring is vectorized with NumPy over a per-process CandidateSet. Category, canonical location and
+date_found are integer columns compared in a single pass. Title+keywords and description tokens are
+kept CSR-style (one flat token-id array plus row offsets), so the overlap with the new item's tokens
+is one np.isin and one np.add.reduceat; text similarity is the Jaccard index of the token sets.
+
+Like the trigram index, the candidate set is rebuilt from MySQL every REFRESH_SECONDS (writes made
+by other workers) and after item_events reports deletes or status changes.
+"""
+import datetime
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import search
+import trigram
+from facets import canonical_location
+
+MATCH_TABLE = "item_matches"
+OPEN_STATUSES = ("Lost", "Found")
+OPPOSITE = {"Lost": "Found", "Found": "Lost"}
+
+WEIGHTS = {"name": 0.30, "description": 0.15, "category": 0.25, "location": 0.15, "date": 0.15}
+MIN_SCORE = 0.35
+TOP_K = 20
+DATE_SCALE_DAYS = 7.0  # date score halves roughly every 5 days apart
+UNKNOWN_DATE_SCORE = 0.3
+REFRESH_SECONDS = 300
+
+_ITEM_COLUMNS = "id, status, category, location, date_found, title, keywords, description"
+
+
+def tokens(*texts: str) -> List[str]:
+    return sorted({w for text in texts for w in trigram.words(text) if w not in search.STOPWORDS})
+
+
+def _day(value) -> int:
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    if isinstance(value, datetime.date):
+        return value.toordinal()
+    if isinstance(value, str) and value:
+        try:
+            return datetime.date.fromisoformat(value[:10]).toordinal()
+        except ValueError:
+            return -1
+    return -1
+
+
+class Features:
+    """The parts of an item the scorer compares."""
+
+    __slots__ = ("item_id", "status", "category", "location", "day", "name_tokens", "description_tokens")
+
+    def __init__(self, item_id, status, category, location, date_found, title, keywords, description):
+        self.item_id = item_id
+        self.status = status
+        self.category = (category or "").strip().lower() or None
+        self.location = canonical_location(location)
+        self.day = _day(date_found)
+        self.name_tokens = tokens(title, keywords)
+        self.description_tokens = tokens(description)
+
+    @classmethod
+    def from_row(cls, row: Sequence):
+        return cls(*row)
+
+
+class _TokenMatrix:
+    """CSR token sets: row i owns token_ids[offsets[i]:offsets[i + 1]]."""
+
+    def __init__(self, rows: List[List[int]]):
+        self.sizes = np.fromiter((len(r) for r in rows), dtype=np.int32, count=len(rows))
+        self.offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(self.sizes, out=self.offsets[1:])
+        self.token_ids = np.fromiter((t for r in rows for t in r), dtype=np.int32, count=int(self.offsets[-1]))
+
+    def jaccard(self, query_ids: np.ndarray, query_size: int) -> np.ndarray:
+        """query_ids are the query tokens present in the vocabulary; query_size counts all of them."""
+        n = len(self.sizes)
+        if n == 0 or len(query_ids) == 0 or len(self.token_ids) == 0:
+            return np.zeros(n, dtype=np.float32)
+        hits = np.isin(self.token_ids, query_ids).astype(np.int32)
+        # reduceat over the non-empty rows only: their starts are strictly increasing and in range,
+        # so each sums exactly its own tokens; rows with no tokens overlap nothing
+        nonempty = self.sizes > 0
+        overlap = np.zeros(n, dtype=np.int32)
+        overlap[nonempty] = np.add.reduceat(hits, self.offsets[:-1][nonempty])
+        union = self.sizes + query_size - overlap
+        return np.where(union > 0, overlap / np.maximum(union, 1), 0.0).astype(np.float32)
+
+
+class CandidateSet:
+    """Open items of one status as NumPy columns, rebuilt lazily when the item set changes."""
+
+    def __init__(self, status: str):
+        self.status = status
+        self._lock = threading.Lock()
+        self._features: Dict[int, Features] = {}
+        self._arrays = None
+        self._loaded_at = 0.0
+
+    def load(self, features: List[Features]):
+        with self._lock:
+            self._features = {f.item_id: f for f in features}
+            self._arrays = None
+            self._loaded_at = time.monotonic()
+
+    def add(self, feature: Features):
+        with self._lock:
+            self._features[feature.item_id] = feature
+            self._arrays = None
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = 0.0
+
+    def is_stale(self) -> bool:
+        return not self._loaded_at or time.monotonic() - self._loaded_at > REFRESH_SECONDS
+
+    def _build(self):
+        features = list(self._features.values())
+        vocab: Dict[str, int] = {}
+        categories: Dict[str, int] = {}
+        locations: Dict[str, int] = {}
+
+        def code(table, value):
+            return -1 if value is None else table.setdefault(value, len(table))
+
+        def ids(words):
+            return [vocab.setdefault(w, len(vocab)) for w in words]
+
+        self._arrays = {
+            "ids": np.fromiter((f.item_id for f in features), dtype=np.int64, count=len(features)),
+            "category": np.fromiter((code(categories, f.category) for f in features), dtype=np.int32, count=len(features)),
+            "location": np.fromiter((code(locations, f.location) for f in features), dtype=np.int32, count=len(features)),
+            "day": np.fromiter((f.day for f in features), dtype=np.int32, count=len(features)),
+            "name": _TokenMatrix([ids(f.name_tokens) for f in features]),
+            "description": _TokenMatrix([ids(f.description_tokens) for f in features]),
+            "vocab": vocab,
+            "categories": categories,
+            "locations": locations,
+        }
+
+    def score(self, item: Features) -> Tuple[np.ndarray, np.ndarray]:
+        """(candidate ids, scores) for every candidate, excluding the item itself."""
+        with self._lock:
+            if self._arrays is None:
+                self._build()
+            a = self._arrays
+        n = len(a["ids"])
+        if n == 0:
+            return a["ids"], np.zeros(0, dtype=np.float32)
+
+        def query_ids(words):
+            return np.fromiter((a["vocab"][w] for w in words if w in a["vocab"]), dtype=np.int32)
+
+        name = a["name"].jaccard(query_ids(item.name_tokens), len(item.name_tokens))
+        description = a["description"].jaccard(query_ids(item.description_tokens), len(item.description_tokens))
+        total = WEIGHTS["name"] * name + WEIGHTS["description"] * description
+        shares_words = (name > 0) | (description > 0)
+
+        category = a["categories"].get(item.category, -2) if item.category else -2
+        total += WEIGHTS["category"] * (a["category"] == category)
+
+        location = a["locations"].get(item.location, -2) if item.location else -2
+        location_score = (a["location"] == location).astype(np.float32)
+        if item.location == "Other":
+            location_score *= 0.5  # "Other - ..." is too vague to count as the same place
+        total += WEIGHTS["location"] * location_score
+
+        if item.day >= 0:
+            known = a["day"] >= 0
+            gap = np.abs(a["day"] - item.day).astype(np.float32)
+            date_score = np.where(known, np.exp(-gap / DATE_SCALE_DAYS), UNKNOWN_DATE_SCORE)
+        else:
+            date_score = np.full(n, UNKNOWN_DATE_SCORE, dtype=np.float32)
+        total += WEIGHTS["date"] * date_score
+
+        # Same category and place alone is not a match: require at least one shared word
+        total[~shares_words] = 0.0
+        total[a["ids"] == item.item_id] = 0.0
+        return a["ids"], total.astype(np.float32)
+
+
+candidates = {status: CandidateSet(status) for status in OPEN_STATUSES}
+
+
+def ensure_loaded(db, status: str):
+    candidate_set = candidates[status]
+    if not candidate_set.is_stale():
+        return
+    cursor = db.cursor()
+    try:
+        cursor.execute(f"SELECT {_ITEM_COLUMNS} FROM items WHERE status = %s", (status,))
+        candidate_set.load([Features.from_row(row) for row in cursor.fetchall()])
+    finally:
+        cursor.close()
+
+
+def invalidate():
+    """Item rows were deleted or changed status: rebuild candidate sets on next use."""
+    for candidate_set in candidates.values():
+        candidate_set.invalidate()
+
+
+def top_matches(item: Features, limit: int = TOP_K) -> List[Tuple[int, float]]:
+    """Best (candidate_id, score) pairs for item among open items of the opposite status."""
+    opposite = OPPOSITE.get(item.status)
+    if opposite is None:
+        return []
+    ids, scores = candidates[opposite].score(item)
+    keep = np.flatnonzero(scores >= MIN_SCORE)
+    if len(keep) > limit:
+        keep = keep[np.argpartition(-scores[keep], limit - 1)[:limit]]
+    keep = keep[np.argsort(-scores[keep], kind="stable")]
+    return [(int(ids[i]), round(float(scores[i]), 4)) for i in keep]
+
+
+def score_item(db, item_id: int) -> int:
+    """Score one item and store its matches (both directions). Returns the number of pairs stored."""
+    cursor = db.cursor()
+    try:
+        cursor.execute(f"SELECT {_ITEM_COLUMNS} FROM items WHERE id = %s", (item_id,))
+        row = cursor.fetchone()
+        if not row or row[1] not in OPPOSITE:
+            return 0
+        item = Features.from_row(row)
+        ensure_loaded(db, OPPOSITE[item.status])
+        matches = top_matches(item)
+
+        cursor.execute(f"DELETE FROM {MATCH_TABLE} WHERE item_id = %s", (item_id,))
+        if matches:
+            pairs = [(item_id, cid, score) for cid, score in matches] + [(cid, item_id, score) for cid, score in matches]
+            cursor.executemany(
+                f"INSERT INTO {MATCH_TABLE} (item_id, candidate_id, score) VALUES (%s, %s, %s) "
+                "ON DUPLICATE KEY UPDATE score = VALUES(score)",
+                pairs,
+            )
+        db.commit()
+        candidates[item.status].add(item)
+        return len(matches)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+class MatchWorker:
+    """Single daemon thread that drains a queue of item ids, scoring each on its own pool connection."""
+
+    def __init__(self):
+        self._queue: "queue.Queue[int]" = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def enqueue(self, item_id: int):
+        with self._lock:
+            if item_id in self._pending:
+                return
+            self._pending.add(item_id)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="match-worker", daemon=True)
+                self._thread.start()
+        self._queue.put(item_id)
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _run(self):
+        import database  # the pool is created on import; keep matching importable without it
+
+        while True:
+            item_id = self._queue.get()
+            with self._lock:
+                self._pending.discard(item_id)
+            conn = None
+            try:
+                conn = database.connection_pool.get_connection()
+                stored = score_item(conn, item_id)
+                print(f"[MATCHING] Item {item_id}: {stored} matches stored.")
+            except Exception as e:
+                print(f"[MATCHING] Failed to score item {item_id}: {e}")
+            finally:
+                if conn is not None:
+                    conn.close()
+                self._queue.task_done()
+
+
+worker = MatchWorker()
+
+
+def enqueue(item_id: int):
+    worker.enqueue(item_id)
@@ -0,0 +1,258 @@
+"""
+migrate.py — Versioned schema migrations (backend/migrations/).
+
+Migrations are files named NNNN_description.sql or NNNN_description.py, applied in version order.
+A .sql file is split on ';' and run statement by statement; a .py file defines up(cursor). Each
+applied migration is recorded in schema_migrations with the SHA-256 of its file. A file edited after
+it was applied is reported as a checksum mismatch and stops the run: add a new migration instead.
+
+MySQL commits DDL as it goes, so a migration that fails halfway is not rolled back. Keep each
+one re-runnable — CREATE ... IF NOT EXISTS, or the *_exists helpers below in .py migrations —
+which is also what lets the early ones run against databases that got their schema from the old
+startup probing.
+
+At startup (main.run_migrations) a current schema costs one query: the highest applied version
+compared with the newest file. Otherwise the worker takes the advisory lock LOCK_NAME (GET_LOCK),
+so when several workers start together one migrates while the others wait and then find nothing
+left to do. Versions only ever increase; a file numbered below the applied maximum is not noticed
+by the startup check (python migrate.py still applies it).
+
+Usage: python migrate.py [status]
+"""
+import hashlib
+import importlib.util
+import os
+import re
+import sys
+import time
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import mysql.connector
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+LOCK_NAME = "findit_schema_migrations"
+LOCK_TIMEOUT_SECONDS = 300
+
+_FILE_RE = re.compile(r"^(\d{4})_(\w+)\.(sql|py)$")
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        execution_ms INT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+class MigrationError(Exception):
+    pass
+
+
+class Migration(NamedTuple):
+    version: int
+    filename: str
+    path: str
+
+    def checksum(self) -> str:
+        with open(self.path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+
+def discover() -> List[Migration]:
+    """Migration files in version order."""
+    migrations = {}
+    for filename in os.listdir(MIGRATIONS_DIR):
+        match = _FILE_RE.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Two migrations numbered {version}: {migrations[version].filename}, {filename}")
+        migrations[version] = Migration(version, filename, os.path.join(MIGRATIONS_DIR, filename))
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def current_version(cursor) -> int:
+    """Highest applied version, 0 if nothing has been applied yet."""
+    try:
+        cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+    except mysql.connector.Error as err:
+        if err.errno == 1146:  # ER_NO_SUCH_TABLE
+            return 0
+        raise
+    return cursor.fetchone()[0]
+
+
+def applied_checksums(cursor) -> Dict[int, str]:
+    cursor.execute("SELECT version, checksum FROM schema_migrations")
+    return {version: checksum for version, checksum in cursor.fetchall()}
+
+
+def _run(cursor, migration: Migration):
+    if migration.filename.endswith(".sql"):
+        with open(migration.path, encoding="utf-8") as f:
+            script = f.read()
+        script = "\n".join(line for line in script.splitlines() if not line.strip().startswith("--"))
+        for statement in script.split(";"):
+            if statement.strip():
+                cursor.execute(statement)
+        return
+    spec = importlib.util.spec_from_file_location(f"migration_{migration.version:04d}", migration.path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.up(cursor)
+
+
+def migrate(conn) -> List[Migration]:
+    """Apply pending migrations under the advisory lock; returns the ones applied."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (LOCK_NAME, LOCK_TIMEOUT_SECONDS))
+        if cursor.fetchone()[0] != 1:
+            raise MigrationError(f"Timed out after {LOCK_TIMEOUT_SECONDS}s waiting for the migration lock")
+        try:
+            cursor.execute(CREATE_TABLE_SQL)
+            done = applied_checksums(cursor)
+            pending = []
+            for migration in discover():
+                if migration.version not in done:
+                    pending.append(migration)
+                elif done[migration.version] != migration.checksum():
+                    raise MigrationError(
+                        f"{migration.filename} changed after it was applied (checksum mismatch); add a new migration instead"
+                    )
+            for migration in pending:
+                print(f"[MIGRATION] Applying {migration.filename}...")
+                started = time.monotonic()
+                _run(cursor, migration)
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name, checksum, execution_ms) VALUES (%s, %s, %s, %s)",
+                    (migration.version, migration.filename, migration.checksum(), int((time.monotonic() - started) * 1000)),
+                )
+                conn.commit()
+            return pending
+        finally:
+            conn.rollback()
+            cursor.execute("DO RELEASE_LOCK(%s)", (LOCK_NAME,))
+    finally:
+        cursor.close()
+
+
+def migrate_on_startup(pool):
+    """The startup path: one version check, and a locked migration run only if files are pending."""
+    if pool is None:
+        raise MigrationError("Database connection pool is not initialized")
+    migrations = discover()
+    latest = migrations[-1].version if migrations else 0
+    conn = pool.get_connection()
+    try:
+        cursor = conn.cursor()
+        try:
+            version = current_version(cursor)
+        finally:
+            cursor.close()
+        if version >= latest:
+            print(f"[MIGRATION] Schema is current (version {version}).")
+            return
+        applied = migrate(conn)
+        print(f"[MIGRATION] Schema migrated to version {latest} ({len(applied)} applied).")
+    finally:
+        conn.close()
+
+
+# ── Helpers for .py migrations ──
+
+def column_exists(cursor, table: str, column: str) -> bool:
+    cursor.execute("""
+        SELECT 1 FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table, column))
+    return cursor.fetchone() is not None
+
+
+def column_type(cursor, table: str, column: str) -> str:
+    """COLUMN_TYPE, e.g. "enum('Lost','Found')"; empty if the column does not exist."""
+    cursor.execute("""
+        SELECT COLUMN_TYPE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table, column))
+    row = cursor.fetchone()
+    return (row[0] or "") if row else ""
+
+
+def index_exists(cursor, table: str, index: str) -> bool:
+    cursor.execute("""
+        SELECT 1 FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+        LIMIT 1
+    """, (table, index))
+    return cursor.fetchone() is not None
+
+
+def foreign_key_exists(cursor, table: str, column: str, referenced_table: str) -> bool:
+    cursor.execute("""
+        SELECT 1 FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        AND REFERENCED_TABLE_NAME = %s
+        LIMIT 1
+    """, (table, column, referenced_table))
+    return cursor.fetchone() is not None
+
+
+def add_missing_columns(cursor, table: str, columns: Sequence[Tuple[str, str]]):
+    """Add each (name, definition) the table lacks, in one ALTER."""
+    clauses = [f"ADD COLUMN {name} {definition}" for name, definition in columns
+               if not column_exists(cursor, table, name)]
+    if clauses:
+        cursor.execute(f"ALTER TABLE {table} {', '.join(clauses)}")
+
+
+def add_missing_indexes(cursor, table: str, indexes: Sequence[Tuple[str, str]]):
+    """
+    Add each (name, columns) index the table lacks, in one in-place ALTER. No LOCK clause: MySQL
+    picks the least restrictive lock the table allows (concurrent writes where it can), whereas
+    LOCK=NONE makes the ALTER fail outright on tables it cannot serve that way, such as ones with
+    ON DELETE CASCADE / SET NULL foreign keys.
+    """
+    clauses = [f"ADD INDEX {name} ({columns})" for name, columns in indexes
+               if not index_exists(cursor, table, name)]
+    if clauses:
+        cursor.execute(f"ALTER TABLE {table} {', '.join(clauses)}, ALGORITHM=INPLACE")
+
+
+def main():
+    import config
+
+    conn = mysql.connector.connect(
+        host=config.DB_HOST, user=config.DB_USER, password=config.DB_PASSWORD,
+        database=config.DB_NAME, port=config.DB_PORT,
+    )
+    try:
+        if sys.argv[1:] == ["status"]:
+            cursor = conn.cursor()
+            try:
+                done = applied_checksums(cursor) if current_version(cursor) else {}
+            finally:
+                cursor.close()
+            for migration in discover():
+                if migration.version not in done:
+                    state = "pending"
+                elif done[migration.version] != migration.checksum():
+                    state = "CHANGED since applied"
+                else:
+                    state = "applied"
+                print(f"  {migration.filename:<45} {state}")
+            return
+        applied = migrate(conn)
+        print(f"Applied {len(applied)} migration(s): {', '.join(m.filename for m in applied) or 'none pending'}")
+    except MigrationError as err:
+        print(f"Error: {err}")
+        raise SystemExit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+-- Base tables. CREATE TABLE IF NOT EXISTS, so databases created by the old init_db.py /
+-- startup table check pass through unchanged; later migrations bring them up to date.
+
+CREATE TABLE IF NOT EXISTS users (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    password_hash VARCHAR(255),
+    full_name VARCHAR(255),
+    avatar_url VARCHAR(255),
+    role ENUM('student', 'admin') DEFAULT 'student',
+    auth_provider ENUM('google', 'email') DEFAULT 'email',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS items (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    status ENUM('Lost', 'Found', 'Recovered') NOT NULL DEFAULT 'Found',
+    category VARCHAR(100),
+    location VARCHAR(255),
+    keywords VARCHAR(255),
+    date_found DATE,
+    contact_preference VARCHAR(50) DEFAULT 'in_app',
+    image_url VARCHAR(500),
+    image_phash BIGINT UNSIGNED DEFAULT NULL,
+    user_id INT NOT NULL,
+    verification_pin VARCHAR(4) DEFAULT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_items_title (title),
+    INDEX idx_items_created (created_at),
+    INDEX idx_items_status_created (status, created_at),
+    INDEX idx_items_status_category_created (status, category, created_at),
+    FULLTEXT INDEX ft_items_search (title, description, location, keywords)
+);
+
+CREATE TABLE IF NOT EXISTS item_matches (
+    item_id INT NOT NULL,
+    candidate_id INT NOT NULL,
+    score FLOAT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (item_id, candidate_id),
+    INDEX idx_item_matches_rank (item_id, score),
+    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
+    FOREIGN KEY (candidate_id) REFERENCES items(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS saved_searches (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    query VARCHAR(255) DEFAULT NULL,
+    status VARCHAR(20) DEFAULT NULL,
+    category VARCHAR(100) DEFAULT NULL,
+    location VARCHAR(255) DEFAULT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_saved_searches_user (user_id)
+);
+
+CREATE TABLE IF NOT EXISTS messages (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    sender_id INT NOT NULL,
+    receiver_id INT NOT NULL,
+    item_id INT NOT NULL,
+    content TEXT NOT NULL,
+    is_read BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (sender_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (receiver_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
+    INDEX idx_messages_item_created (item_id, created_at, sender_id, receiver_id)
+);
+
+CREATE TABLE IF NOT EXISTS claims (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    item_id INT NOT NULL,
+    proof_description TEXT NOT NULL,
+    proof_image_url VARCHAR(500),
+    status ENUM('Pending', 'Approved', 'Rejected') DEFAULT 'Pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS conversations (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    item_id INT NOT NULL,
+    finder_id INT NOT NULL,
+    claimer_id INT NOT NULL,
+    finder_code VARCHAR(10) DEFAULT NULL,
+    claimer_code VARCHAR(10) DEFAULT NULL,
+    finder_code_created_at DATETIME DEFAULT NULL,
+    claimer_code_created_at DATETIME DEFAULT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
+    FOREIGN KEY (finder_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (claimer_id) REFERENCES users(id) ON DELETE CASCADE,
+    UNIQUE KEY unique_conversation (item_id, claimer_id),
+    INDEX idx_conversations_finder (finder_id, created_at),
+    INDEX idx_conversations_claimer (claimer_id, created_at)
+);
+
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NULL,
+    action VARCHAR(64) NOT NULL,
+    item_id INT NULL,
+    details TEXT,
+    ip_address VARCHAR(45),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL,
+    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE SET NULL,
+    INDEX idx_audit_logs_created (created_at),
+    INDEX idx_audit_logs_user_action (user_id, action, created_at)
+);
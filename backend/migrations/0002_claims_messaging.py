@@ -0,0 +1,47 @@
+"""Claim-based messaging (was update_schema_messaging.sql / run_messaging_migration.py)."""
+from migrate import add_missing_columns, column_type, foreign_key_exists
+
+
+def up(cursor):
+    add_missing_columns(cursor, "claims", [
+        ("claimer_id", "INT"),
+        ("finder_id", "INT"),
+        ("handover_code", "VARCHAR(10)"),
+    ])
+    if "'active'" not in column_type(cursor, "claims", "status"):
+        cursor.execute(
+            "ALTER TABLE claims MODIFY COLUMN status ENUM('Pending', 'Approved', 'Rejected', 'active', "
+            "'identity_requested', 'identity_submitted', 'handover_initiated', 'returned', 'rejected') DEFAULT 'active'"
+        )
+    # Claims made before the split: the claimer is the claim's user, the finder the item's reporter
+    cursor.execute("UPDATE claims SET claimer_id = user_id WHERE claimer_id IS NULL")
+    cursor.execute("""
+        UPDATE claims c JOIN items i ON c.item_id = i.id
+        SET c.finder_id = i.user_id WHERE c.finder_id IS NULL
+    """)
+    if not foreign_key_exists(cursor, "claims", "claimer_id", "users"):
+        cursor.execute("ALTER TABLE claims ADD FOREIGN KEY (claimer_id) REFERENCES users(id) ON DELETE CASCADE")
+    if not foreign_key_exists(cursor, "claims", "finder_id", "users"):
+        cursor.execute("ALTER TABLE claims ADD FOREIGN KEY (finder_id) REFERENCES users(id) ON DELETE CASCADE")
+
+    add_missing_columns(cursor, "messages", [
+        ("claim_id", "INT"),
+        ("message_type", "ENUM('text', 'system', 'identity_form', 'identity_response', 'handover_init', "
+                         "'handover_confirm') DEFAULT 'text'"),
+    ])
+    if not foreign_key_exists(cursor, "messages", "claim_id", "claims"):
+        cursor.execute("ALTER TABLE messages ADD FOREIGN KEY (claim_id) REFERENCES claims(id) ON DELETE CASCADE")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS identity_verifications (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            claim_id INT NOT NULL UNIQUE,
+            full_name VARCHAR(255) NOT NULL,
+            place_found VARCHAR(255),
+            date_of_loss DATE,
+            location_of_loss VARCHAR(255),
+            unlock_description TEXT,
+            submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (claim_id) REFERENCES claims(id) ON DELETE CASCADE
+        )
+    """)
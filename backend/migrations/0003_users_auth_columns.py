@@ -0,0 +1,16 @@
+"""Password reset codes, matric number, admin/suspended flags and the wider role enum."""
+from migrate import add_missing_columns, column_type
+
+
+def up(cursor):
+    add_missing_columns(cursor, "users", [
+        ("reset_code", "VARCHAR(4) DEFAULT NULL"),
+        ("reset_code_expires", "DATETIME DEFAULT NULL"),
+        ("matric_number", "VARCHAR(64) UNIQUE NULL"),
+        ("is_admin", "TINYINT(1) NOT NULL DEFAULT 0"),
+        ("is_suspended", "TINYINT(1) NOT NULL DEFAULT 0"),
+    ])
+    if "'staff'" not in column_type(cursor, "users", "role"):
+        cursor.execute(
+            "ALTER TABLE users MODIFY COLUMN role ENUM('student', 'staff', 'visitor', 'admin') NOT NULL DEFAULT 'student'"
+        )
@@ -0,0 +1,15 @@
+"""Handover codes and their creation times (codes expire after 15 minutes).
+
+Was migrate_handover_codes.py / add_handover_codes.sql (VARCHAR(4) codes, still fine for 4 digits
+where they were applied) and the startup probing in main.run_migrations.
+"""
+from migrate import add_missing_columns
+
+
+def up(cursor):
+    add_missing_columns(cursor, "conversations", [
+        ("finder_code", "VARCHAR(10) DEFAULT NULL"),
+        ("claimer_code", "VARCHAR(10) DEFAULT NULL"),
+        ("finder_code_created_at", "DATETIME DEFAULT NULL"),
+        ("claimer_code_created_at", "DATETIME DEFAULT NULL"),
+    ])
@@ -0,0 +1,18 @@
+"""'Returned' item status, full-text/title/feed indexes (search.py) and the photo hash column (photo_hash.py)."""
+from migrate import add_missing_columns, add_missing_indexes, column_type, index_exists
+
+
+def up(cursor):
+    if "'Returned'" not in column_type(cursor, "items", "status"):
+        cursor.execute(
+            "ALTER TABLE items MODIFY COLUMN status ENUM('Lost', 'Found', 'Recovered', 'Returned') NOT NULL DEFAULT 'Found'"
+        )
+    if not index_exists(cursor, "items", "ft_items_search"):
+        # FULLTEXT builds cannot run with LOCK=NONE
+        cursor.execute("ALTER TABLE items ADD FULLTEXT INDEX ft_items_search (title, description, location, keywords)")
+    # Keyset feed order (created_at DESC, id DESC); InnoDB appends the PK to secondary indexes
+    add_missing_indexes(cursor, "items", [
+        ("idx_items_title", "title"),
+        ("idx_items_created", "created_at"),
+    ])
+    add_missing_columns(cursor, "items", [("image_phash", "BIGINT UNSIGNED DEFAULT NULL")])
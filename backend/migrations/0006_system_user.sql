@@ -0,0 +1,2 @@
+-- System user for automatic claim/chat messages (not a real login)
+INSERT IGNORE INTO users (email, full_name, auth_provider) VALUES ('system@findit.internal', 'Findit System', 'email');
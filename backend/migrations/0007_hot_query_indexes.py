@@ -0,0 +1,20 @@
+"""Composite indexes for the hot query shapes; indexes.py explains each choice and checks the plans."""
+from migrate import add_missing_indexes
+
+
+def up(cursor):
+    add_missing_indexes(cursor, "messages", [
+        ("idx_messages_item_created", "item_id, created_at, sender_id, receiver_id"),
+    ])
+    add_missing_indexes(cursor, "conversations", [
+        ("idx_conversations_finder", "finder_id, created_at"),
+        ("idx_conversations_claimer", "claimer_id, created_at"),
+    ])
+    add_missing_indexes(cursor, "items", [
+        ("idx_items_status_created", "status, created_at"),
+        ("idx_items_status_category_created", "status, category, created_at"),
+    ])
+    add_missing_indexes(cursor, "audit_logs", [
+        ("idx_audit_logs_created", "created_at"),
+        ("idx_audit_logs_user_action", "user_id, action, created_at"),
+    ])
@@ -0,0 +1,43 @@
+"""Last-message and unread columns on conversations and claims, filled from messages (see conversation_summary.py)."""
+from migrate import add_missing_columns
+
+
+def up(cursor):
+    add_missing_columns(cursor, "conversations", [
+        ("last_message_id", "INT NULL"),
+        ("last_message_at", "TIMESTAMP NULL DEFAULT NULL"),
+        ("last_sender_id", "INT NULL"),
+        ("finder_unread", "INT NOT NULL DEFAULT 0"),
+        ("claimer_unread", "INT NOT NULL DEFAULT 0"),
+    ])
+    add_missing_columns(cursor, "claims", [
+        ("last_message_id", "INT NULL"),
+    ])
+    # The backfill is spelled out here rather than imported, so this file's checksum covers it.
+    # "Last" is the highest message id, as in conversation_summary.RECORD_MESSAGE_SQL; the claim_id
+    # foreign key index (claim_id, id) serves the per-claim MAX.
+    cursor.execute("""
+        UPDATE conversations c SET
+            c.last_message_id = (
+                SELECT MAX(m.id) FROM messages m
+                WHERE m.item_id = c.item_id AND (
+                    (m.sender_id = c.finder_id AND m.receiver_id = c.claimer_id)
+                    OR (m.sender_id = c.claimer_id AND m.receiver_id = c.finder_id)
+                )
+            ),
+            c.finder_unread = (
+                SELECT COUNT(*) FROM messages m
+                WHERE m.item_id = c.item_id AND m.sender_id = c.claimer_id AND m.receiver_id = c.finder_id AND NOT m.is_read
+            ),
+            c.claimer_unread = (
+                SELECT COUNT(*) FROM messages m
+                WHERE m.item_id = c.item_id AND m.sender_id = c.finder_id AND m.receiver_id = c.claimer_id AND NOT m.is_read
+            )
+    """)
+    cursor.execute("""
+        UPDATE conversations c JOIN messages m ON m.id = c.last_message_id
+        SET c.last_message_at = m.created_at, c.last_sender_id = m.sender_id
+    """)
+    cursor.execute("""
+        UPDATE claims c SET c.last_message_id = (SELECT MAX(m.id) FROM messages m WHERE m.claim_id = c.id)
+    """)
@@ -0,0 +1,67 @@
+"""
+pagination.py — Opaque keyset cursors for list endpoints.
+
+A cursor is the sort key of the last row on a page, JSON-encoded and base64url'd, so clients
+treat it as an opaque string and the next page is `WHERE (key) < (cursor key)` instead of OFFSET.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Default and cap the requested page size."""
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> dict:
+    """Decode a cursor from encode_cursor. Raises 400 on anything malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return payload
+
+
+def feed_cursor(created_at, item_id: int) -> str:
+    """Cursor for the (created_at DESC, id DESC) feed order."""
+    return encode_cursor({"c": created_at.isoformat() if isinstance(created_at, datetime) else str(created_at), "i": item_id})
+
+
+def rank_cursor(rank: float, item_id: int) -> str:
+    """Cursor for the (relevance DESC, id DESC) search order."""
+    return encode_cursor({"r": rank, "i": item_id})
+
+
+def parse_feed_cursor(token: str):
+    """Return (created_at, id) from a feed cursor."""
+    payload = decode_cursor(token)
+    try:
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def parse_rank_cursor(token: str):
+    """Return (rank, id) from a search cursor."""
+    payload = decode_cursor(token)
+    try:
+        return float(payload["r"]), int(payload["i"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,162 @@
+"""
+photo_hash.py — Perceptual hashes of item photos for duplicate-report detection.
+
+phash() is the classic 64-bit DCT hash: the image is reduced to 32x32 grayscale, the 8x8
+lowest-frequency DCT coefficients are compared against their median, and each comparison is one
+bit. Re-encoding, resizing and small crops flip only a few bits, so two photos of the same wallet
+land within MAX_DISTANCE bits of each other.
+
+Hashes are stored in items.image_phash and held in memory as one contiguous uint64 array, so a
+Hamming-radius lookup is a single vectorized XOR + popcount pass (about 0.2 ms per 100k photos).
+A BK-tree was tried first but degrades towards a full scan at useful radii on 64-bit hashes
+while paying Python per-node overhead. Like the trigram index, the array is loaded on first use
+and re-read every REFRESH_SECONDS; create and delete hooks in item_events keep it current in
+between. backfill_photo_hashes.py fills in hashes for photos uploaded before this existed.
+"""
+import io
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+HASH_SIZE = 8
+SAMPLE_SIZE = 32
+MAX_DISTANCE = 8  # of 64 bits
+REFRESH_SECONDS = 300
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * x + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    m[0] /= np.sqrt(2.0)
+    return m
+
+
+_DCT = _dct_matrix(SAMPLE_SIZE)
+
+
+def phash(content: bytes) -> Optional[int]:
+    """64-bit perceptual hash of an encoded image, or None if the bytes are not a readable image."""
+    try:
+        with Image.open(io.BytesIO(content)) as img:
+            img.draft("L", (SAMPLE_SIZE * 2, SAMPLE_SIZE * 2))  # JPEG: decode at reduced scale
+            img = ImageOps.exif_transpose(img)
+            gray = img.convert("L").resize((SAMPLE_SIZE, SAMPLE_SIZE), Image.LANCZOS)
+    except (UnidentifiedImageError, OSError, ValueError, Image.DecompressionBombError):
+        return None
+    pixels = np.asarray(gray, dtype=np.float64)
+    low = (_DCT @ pixels @ _DCT.T)[:HASH_SIZE, :HASH_SIZE].flatten()
+    bits = low > np.median(low[1:])  # skip the DC term, it only tracks overall brightness
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def _popcount_table(words: np.ndarray) -> np.ndarray:
+    return _BYTE_BITS[words.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+_BYTE_BITS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+# numpy >= 2.0 has a native per-element popcount; older versions count through a byte table
+_popcount = getattr(np, "bitwise_count", _popcount_table)
+
+
+class PhotoIndex:
+    """
+    Thread-safe item_id -> perceptual hash index packed into a flat uint64 array.
+    A lookup is one XOR and one popcount over the whole array. Deleted slots keep id -1 until
+    the next rebuild.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset_locked()
+        self._loaded_at = 0.0
+
+    def _reset_locked(self, capacity: int = 1024):
+        self._hashes = np.zeros(capacity, dtype=np.uint64)
+        self._ids = np.full(capacity, -1, dtype=np.int64)
+        self._size = 0
+        self._slots: Dict[int, int] = {}
+
+    def _add_locked(self, item_id: int, value: int):
+        old = self._slots.get(item_id)
+        if old is not None:
+            self._ids[old] = -1
+        if self._size == len(self._hashes):
+            grow = max(len(self._hashes), 1024)
+            self._hashes = np.concatenate([self._hashes, np.zeros(grow, dtype=np.uint64)])
+            self._ids = np.concatenate([self._ids, np.full(grow, -1, dtype=np.int64)])
+        self._hashes[self._size] = value
+        self._ids[self._size] = item_id
+        self._slots[item_id] = self._size
+        self._size += 1
+
+    def load(self, rows: Iterable[Tuple[int, int]]):
+        """Rebuild from (item_id, image_phash) rows."""
+        rows = [(item_id, int(value)) for item_id, value in rows if value is not None]
+        with self._lock:
+            self._reset_locked(max(len(rows) * 2, 1024))
+            for item_id, value in rows:
+                self._add_locked(item_id, value)
+            self._loaded_at = time.monotonic()
+
+    def add(self, item_id: int, value: Optional[int]):
+        if value is None:
+            return
+        with self._lock:
+            self._add_locked(item_id, int(value))
+
+    def remove(self, item_id: int):
+        with self._lock:
+            slot = self._slots.pop(item_id, None)
+            if slot is not None:
+                self._ids[slot] = -1
+
+    def clear(self):
+        with self._lock:
+            self._reset_locked()
+
+    def is_stale(self) -> bool:
+        return not self._loaded_at or time.monotonic() - self._loaded_at > REFRESH_SECONDS
+
+    def near(self, value: int, max_distance: int = MAX_DISTANCE) -> List[Tuple[int, int]]:
+        """Live items whose photo hash is within max_distance bits, closest first, as (item_id, distance)."""
+        with self._lock:
+            n = self._size
+            distances = _popcount(self._hashes[:n] ^ np.uint64(value))
+            hits = np.flatnonzero((distances <= max_distance) & (self._ids[:n] >= 0))
+            found = [(int(self._ids[i]), int(distances[i])) for i in hits]
+        return sorted(found, key=lambda hit: (hit[1], hit[0]))
+
+    def __len__(self):
+        return len(self._slots)
+
+
+index = PhotoIndex()
+
+
+def ensure_loaded(db):
+    if not index.is_stale():
+        return
+    cursor = db.cursor()
+    try:
+        cursor.execute("SELECT id, image_phash FROM items WHERE image_phash IS NOT NULL")
+        index.load(cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def find_duplicates(db, value: Optional[int]) -> List[int]:
+    """Ids of existing items whose photo is a near-duplicate of a photo with hash value."""
+    if value is None:
+        return []
+    ensure_loaded(db)
+    return [item_id for item_id, _d in index.near(value)]
+
+
+def fingerprint(db, content: bytes) -> Tuple[Optional[int], List[int]]:
+    """(phash, near-duplicate item ids) of an uploaded photo. CPU-bound: async routes call it through run_in_threadpool."""
+    value = phash(content)
+    return value, find_duplicates(db, value)
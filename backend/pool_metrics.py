@@ -0,0 +1,137 @@
+"""
+pool_metrics.py — Checkout/hold counters for the MySQL connection pool (see database.InstrumentedPool).
+
+Records, per worker process:
+  - checkout wait: time from asking the pool for a connection to getting one (includes queuing
+    when every connection is out, plus the session reset), as recent-sample percentiles
+  - hold time per route: how long each route (or "background" / "stream") keeps a connection
+  - in-use / idle counts and the in-use high-water mark
+  - exhaustion events (a checkout found no idle connection) and checkout timeouts
+
+The pool is "saturated" while every connection is checked out. readiness() reports degraded once
+it has stayed saturated for SATURATION_GRACE_SECONDS, or a checkout timed out within the last
+TIMEOUT_WINDOW_SECONDS — short bursts that drain quickly do not flip the probe.
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+WAIT_SAMPLES = 1000
+SATURATION_GRACE_SECONDS = 5.0
+TIMEOUT_WINDOW_SECONDS = 60.0
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class _HoldStats:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+
+class PoolMetrics:
+    def __init__(self, pool_size: int = 0):
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+        self._holds: Dict[str, _HoldStats] = {}
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.exhaustion_events = 0
+        self.timeouts = 0
+        self._saturated_since: Optional[float] = None
+        self._last_timeout_at: Optional[float] = None
+
+    def checked_out(self, wait_seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self._waits.append(wait_seconds)
+            self.in_use += 1
+            if self.in_use > self.peak_in_use:
+                self.peak_in_use = self.in_use
+            if self.pool_size and self.in_use >= self.pool_size and self._saturated_since is None:
+                self._saturated_since = time.monotonic()
+
+    def returned(self, label: str, hold_seconds: float):
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+            if self.in_use < self.pool_size:
+                self._saturated_since = None
+            stats = self._holds.get(label)
+            if stats is None:
+                stats = self._holds[label] = _HoldStats()
+            stats.add(hold_seconds)
+
+    def exhausted(self):
+        with self._lock:
+            self.exhaustion_events += 1
+
+    def timed_out(self):
+        with self._lock:
+            self.timeouts += 1
+            self._last_timeout_at = time.monotonic()
+
+    def readiness(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            saturated_for = now - self._saturated_since if self._saturated_since is not None else 0.0
+            recent_timeout = self._last_timeout_at is not None and now - self._last_timeout_at < TIMEOUT_WINDOW_SECONDS
+            in_use = self.in_use
+        reasons = []
+        if saturated_for >= SATURATION_GRACE_SECONDS:
+            reasons.append(f"pool saturated for {saturated_for:.1f}s")
+        if recent_timeout:
+            reasons.append(f"checkout timed out in the last {TIMEOUT_WINDOW_SECONDS:.0f}s")
+        return {
+            "status": "degraded" if reasons else "ok",
+            "reasons": reasons,
+            "in_use": in_use,
+            "pool_size": self.pool_size,
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits = sorted(self._waits)
+            holds = {
+                label: {
+                    "count": h.count,
+                    "avg_ms": round(h.total / h.count * 1000, 2) if h.count else 0.0,
+                    "max_ms": round(h.max * 1000, 2),
+                }
+                for label, h in sorted(self._holds.items(), key=lambda kv: kv[1].total, reverse=True)
+            }
+            return {
+                "pool_size": self.pool_size,
+                "in_use": self.in_use,
+                "idle": max(self.pool_size - self.in_use, 0),
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "exhaustion_events": self.exhaustion_events,
+                "timeouts": self.timeouts,
+                "wait_ms": {
+                    "samples": len(waits),
+                    "p50": round(_percentile(waits, 0.50) * 1000, 2),
+                    "p95": round(_percentile(waits, 0.95) * 1000, 2),
+                    "p99": round(_percentile(waits, 0.99) * 1000, 2),
+                    "max": round(waits[-1] * 1000, 2) if waits else 0.0,
+                },
+                "hold_by_route": holds,
+            }
+
+
+metrics = PoolMetrics()
@@ -0,0 +1,65 @@
+"""
+projection.py — Sparse fieldsets for item list responses (GET /items?fields=...).
+
+`fields` is a comma-separated subset of ITEM_COLUMNS, or `card` for what ItemCard renders.
+The column list is pushed down into the SELECT (and the users join is skipped when
+reporter_name is not requested), so unused TEXT columns are never read or serialized.
+"""
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+# Response field -> SELECT expression (items aliased i, users aliased u)
+ITEM_COLUMNS = {
+    "id": "i.id",
+    "title": "i.title",
+    "description": "i.description",
+    "status": "i.status",
+    "category": "i.category",
+    "location": "i.location",
+    "keywords": "i.keywords",
+    "date_found": "i.date_found",
+    "contact_preference": "i.contact_preference",
+    "image_url": "i.image_url",
+    "user_id": "i.user_id",
+    "reporter_name": "u.full_name AS reporter_name",
+    "verification_pin": "i.verification_pin",
+    "created_at": "i.created_at",
+}
+
+ALL_FIELDS = tuple(ITEM_COLUMNS)
+CARD_FIELDS = ("id", "title", "status", "category", "location", "image_url", "created_at")
+
+# Needed internally for keyset cursors even when the client did not ask for them
+CURSOR_FIELDS = ("id", "created_at")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Return the requested field names in response order, or None for the full representation."""
+    if fields is None or not fields.strip():
+        return None
+    if fields.strip().lower() == "card":
+        return CARD_FIELDS
+    names = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [name for name in names if name not in ITEM_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    if set(names) == set(ALL_FIELDS):
+        return None
+    return names
+
+
+def select_clause(requested: Optional[Tuple[str, ...]]) -> Tuple[str, bool]:
+    """SELECT list for the requested fields (plus cursor keys) and whether the users join is needed."""
+    names = list(requested or ALL_FIELDS)
+    for name in CURSOR_FIELDS:
+        if name not in names:
+            names.append(name)
+    return ", ".join(ITEM_COLUMNS[name] for name in names), "reporter_name" in names
+
+
+def hidden_fields(requested: Optional[Tuple[str, ...]]) -> Tuple[str, ...]:
+    """The cursor columns that were selected for pagination but not requested (left out of the rows)."""
+    if requested is None:
+        return ()
+    return tuple(name for name in CURSOR_FIELDS if name not in requested)
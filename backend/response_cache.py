@@ -0,0 +1,177 @@
+"""
+response_cache.py — Bounded in-process cache for public item reads.
+
+LRUTTLCache is an LRU with a per-entry TTL and an optional weight budget (e.g. total rows held),
+with hit/miss/eviction counters for sizing. Writers invalidate through item_events.
+
+Invalidation is race-safe: every clear()/invalidate() bumps a generation counter, and put() is
+dropped if the generation moved since the reader captured it before querying MySQL. So a read
+that started before a handover commit can never re-insert the pre-handover row after the
+handover's invalidation.
+
+With a read replica (database.py) a read that starts after the invalidation can still return the
+pre-write row, if the replica has not applied the write yet. Readers that read the replica pass
+settle_seconds (database.cache_settle_seconds): put() then also drops the value while the last
+invalidation is more recent than that, so a lagging replica cannot refill the cache with the old
+row for a whole TTL. Reads that must be fresh (database.use_primary) skip get() altogether.
+
+The cache is per worker process; other workers only see a write once their entry's TTL expires,
+which is why TTLs are kept short.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+MISS = object()
+
+_registry = []
+
+
+class LRUTTLCache:
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 512,
+        ttl_seconds: float = 15.0,
+        max_weight: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_weight = max_weight
+        self._weigh = weigh or (lambda _value: 1)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, weight, value)
+        self._weight = 0
+        self._generation = 0
+        self._invalidated_at = 0.0  # monotonic time of the last invalidate()/clear()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_puts = 0
+        self.unsettled_puts = 0
+        _registry.append(self)
+
+    @property
+    def generation(self) -> int:
+        """Capture before reading from the database; pass to put()."""
+        return self._generation
+
+    def get(self, key: Hashable):
+        """Return the cached value or MISS."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS
+            expires_at, weight, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._weight -= weight
+                self.expirations += 1
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value, generation: Optional[int] = None, settle_seconds: float = 0.0):
+        """
+        Store value unless an invalidation landed after generation was captured, or (for values read
+        from a replica) less than settle_seconds ago.
+        """
+        weight = self._weigh(value)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                # An invalidation landed while this value was being computed
+                self.stale_puts += 1
+                return
+            if settle_seconds and time.monotonic() - self._invalidated_at < settle_seconds:
+                # The replica may not have the invalidating write yet
+                self.unsettled_puts += 1
+                return
+            if self.max_weight is not None and weight > self.max_weight:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._weight -= old[1]
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, weight, value)
+            self._weight += weight
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_weight is not None and self._weight > self.max_weight)
+            ):
+                _key, (_expires, evicted_weight, _value) = self._entries.popitem(last=False)
+                self._weight -= evicted_weight
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._generation += 1
+            self._invalidated_at = time.monotonic()
+            self.invalidations += 1
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._weight -= entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._invalidated_at = time.monotonic()
+            self.invalidations += 1
+            self._entries.clear()
+            self._weight = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "weight": self._weight,
+                "max_weight": self.max_weight,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "stale_puts": self.stale_puts,
+                "unsettled_puts": self.unsettled_puts,
+            }
+
+
+def _row_count(value) -> int:
+    """Weight of a feed response: number of item rows it holds."""
+    if hasattr(value, "weight"):  # compression.CachedBody
+        return value.weight
+    if isinstance(value, dict):
+        return max(len(value.get("items") or ()), 1)
+    if isinstance(value, list):
+        return max(len(value), 1)
+    return 1
+
+
+# GET /items responses (encoded and precompressed, see compression.py) keyed by normalized query
+# parameters; budget is total rows held.
+items_feed = LRUTTLCache("items_feed", max_entries=256, ttl_seconds=15.0, max_weight=20000, weigh=_row_count)
+
+# GET /items/{item_id} responses keyed by id.
+item_detail = LRUTTLCache("item_detail", max_entries=2048, ttl_seconds=30.0)
+
+
+def feed_key(q, item_status, category, limit, page_cursor, fields=None) -> tuple:
+    """Normalize GET /items parameters so equivalent requests share an entry."""
+    q_norm = " ".join((q or "").lower().split()) or None
+    return (q_norm, item_status or None, category or None, limit, page_cursor or None, fields)
+
+
+def all_caches():
+    """Every cache created in this process (feeds, details, facets), for the admin stats endpoint."""
+    return list(_registry)
@@ -13,6 +13,9 @@ from datetime import datetime
 # When running from backend/, these modules are in sys.path
 from database import get_db_connection
 from auth_utils import get_current_user
+import item_events
+import conversation_summary
+import statements
 from schemas import (
     StartClaimRequest,
     SendMessageRequest,
@@ -86,6 +89,7 @@ def start_claim(
             VALUES (%s, %s, 'system', %s)
         """
         cursor.execute(insert_msg, (claim_id, current_user_id, system_msg))
+        conversation_summary.record_claim_message(cursor, cursor.lastrowid, claim_id)
 
         # 5. Insert automatic greeting from System user (skip if claimer already verified)
         cursor.execute("SELECT id FROM users WHERE email = 'system@findit.internal' LIMIT 1")
@@ -101,6 +105,7 @@ def start_claim(
                 "INSERT INTO messages (claim_id, sender_id, message_type, content) VALUES (%s, %s, 'system', %s)",
                 (claim_id, system_user["id"], greeting)
             )
+            conversation_summary.record_claim_message(cursor, cursor.lastrowid, claim_id)
 
         db.commit()
 
@@ -112,6 +117,31 @@ def start_claim(
     finally:
         cursor.close()
 
+
+# The claim list with each claim's last message (claims.last_message_id, kept up to date on every
+# message insert by conversation_summary.py). Both names are fetched; the other party is picked in Python.
+CLAIM_LIST_SQL = """
+    SELECT
+        c.id as claim_id,
+        c.status,
+        c.updated_at,
+        i.title as item_title,
+        i.image_url as item_photo,
+        u_claimer.full_name as claimer_name,
+        u_finder.full_name as finder_name,
+        c.claimer_id,
+        c.finder_id,
+        m.content as last_message
+    FROM claims c
+    JOIN items i ON c.item_id = i.id
+    JOIN users u_claimer ON c.claimer_id = u_claimer.id
+    JOIN users u_finder ON c.finder_id = u_finder.id
+    LEFT JOIN messages m ON m.id = c.last_message_id
+    WHERE c.claimer_id = %s OR c.finder_id = %s
+    ORDER BY c.updated_at DESC
+"""
+
+
 @router.get("/claims/list", response_model=List[ClaimResponse])
 def list_claims(
     current_user: dict = Depends(get_current_user),
@@ -120,38 +150,9 @@ def list_claims(
     """
     List all claims where current user is finder OR claimer.
     """
-    cursor = db.cursor(dictionary=True)
     try:
         user_id = current_user['id']
-        
-        # Query to fetch claims with details
-        # We need to determine the "other party" name based on who the current user is.
-        # This is a bit complex in SQL, so we can fetch both names and process in Python.
-        query = """
-            SELECT 
-                c.id as claim_id, 
-                c.status,
-                c.updated_at,
-                i.title as item_title, 
-                i.image_url as item_photo,
-                u_claimer.full_name as claimer_name,
-                u_finder.full_name as finder_name,
-                c.claimer_id,
-                c.finder_id,
-                (
-                    SELECT content FROM messages m 
-                    WHERE m.claim_id = c.id 
-                    ORDER BY m.created_at DESC LIMIT 1
-                ) as last_message
-            FROM claims c
-            JOIN items i ON c.item_id = i.id
-            JOIN users u_claimer ON c.claimer_id = u_claimer.id
-            JOIN users u_finder ON c.finder_id = u_finder.id
-            WHERE c.claimer_id = %s OR c.finder_id = %s
-            ORDER BY c.updated_at DESC
-        """
-        cursor.execute(query, (user_id, user_id))
-        claims = cursor.fetchall()
+        claims = statements.fetch_all(db, CLAIM_LIST_SQL, (user_id, user_id))
         
         results = []
         for c in claims:
@@ -177,8 +178,6 @@ def list_claims(
 
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=f"Database error: {err}")
-    finally:
-        cursor.close()
 
 
 @router.post("/claims/reject")
@@ -207,6 +206,7 @@ def reject_claim(
         msg = "[System] This claim has been rejected by the finder."
         cursor.execute("INSERT INTO messages (claim_id, sender_id, message_type, content) VALUES (%s, %s, 'system', %s)", 
                        (request.claim_id, current_user['id'], msg))
+        conversation_summary.record_claim_message(cursor, cursor.lastrowid, request.claim_id)
         
         db.commit()
         return {"success": True}
@@ -299,9 +299,11 @@ def send_message(
             VALUES (%s, %s, 'text', %s)
         """
         cursor.execute(insert_query, (request.claim_id, user_id, request.content))
+        message_id = cursor.lastrowid
+        conversation_summary.record_claim_message(cursor, message_id, request.claim_id)
         db.commit()
         
-        return {"success": True, "message_id": cursor.lastrowid}
+        return {"success": True, "message_id": message_id}
         
     except mysql.connector.Error as err:
         db.rollback()
@@ -334,6 +336,7 @@ def request_identity(
         msg_content = "[System] The finder has requested identity verification. Please fill in the form below."
         cursor.execute("INSERT INTO messages (claim_id, sender_id, message_type, content) VALUES (%s, %s, 'identity_form', %s)",
                        (request.claim_id, current_user['id'], msg_content))
+        conversation_summary.record_claim_message(cursor, cursor.lastrowid, request.claim_id)
                        
         db.commit()
         return {"success": True}
@@ -397,6 +400,7 @@ def submit_identity(
         
         cursor.execute("INSERT INTO messages (claim_id, sender_id, message_type, content) VALUES (%s, %s, 'identity_response', %s)",
                        (request.claim_id, current_user['id'], json.dumps(response_data)))
+        conversation_summary.record_claim_message(cursor, cursor.lastrowid, request.claim_id)
         
         db.commit()
         return {"success": True}
@@ -438,6 +442,7 @@ def initiate_handover(
         msg = f"[System] Hand-over initiated. Code: {code}"
         cursor.execute("INSERT INTO messages (claim_id, sender_id, message_type, content) VALUES (%s, %s, 'handover_init', %s)",
                        (request.claim_id, current_user['id'], msg))
+        conversation_summary.record_claim_message(cursor, cursor.lastrowid, request.claim_id)
                        
         db.commit()
         return {"success": True, "handover_code": code}
@@ -457,7 +462,13 @@ def confirm_handover(
     cursor = db.cursor(dictionary=True)
     try:
         # Permission: Only Claimer
-        cursor.execute("SELECT claimer_id, status, handover_code, item_id FROM claims WHERE id = %s", (request.claim_id,))
+        cursor.execute("""
+            SELECT c.claimer_id, c.status, c.handover_code, c.item_id,
+                   i.status AS item_status, i.category AS item_category, i.location AS item_location
+            FROM claims c
+            JOIN items i ON c.item_id = i.id
+            WHERE c.id = %s
+        """, (request.claim_id,))
         claim = cursor.fetchone()
         
         if not claim: 
@@ -490,8 +501,10 @@ def confirm_handover(
         msg = "[System] Verification Successful! The item has been returned. 🎉"
         cursor.execute("INSERT INTO messages (claim_id, sender_id, message_type, content) VALUES (%s, %s, 'handover_confirm', %s)",
                        (request.claim_id, current_user['id'], msg))
+        conversation_summary.record_claim_message(cursor, cursor.lastrowid, request.claim_id)
                        
         db.commit()
+        item_events.item_status_changed(claim['item_id'], claim['item_status'], 'Recovered', claim['item_category'], claim['item_location'])
         return {"success": True}
         
     except mysql.connector.Error as err:
@@ -0,0 +1,74 @@
+"""
+rows.py — Tuple row fetching with record classes compiled once per query shape.
+
+A dictionary cursor zips every row into a dict keyed by column name, and handlers then pop the
+columns they only selected for themselves. List handlers instead fetch plain tuples and turn them
+into records of a dataclass generated for the query's column list. The dataclass and a constructor
+lambda with the column indexes (and any converters) inlined are built the first time a shape is seen
+and cached, so nothing is looked up by name per row. orjson encodes dataclass instances natively,
+so serialization.JSONRows takes lists of records as they are.
+
+The records are deliberately not __slots__ classes: orjson reads a dataclass's instance __dict__ on
+a fast path but falls back to per-field getattr for slotted ones, which made slotted records slower
+to encode than dictionary-cursor rows (bench_serialization.py compares all three).
+
+    cursor = db.cursor()
+    cursor.execute(query, params)
+    shape = rows.shape(cursor.description, hidden=("relevance",))
+    records = shape.records(cursor.fetchall())
+
+Hidden columns are selected for the handler's own use (keyset cursors, ranking) and left out of
+the records; read them from the raw tuple with shape.value(raw_row, name).
+"""
+import keyword
+import threading
+from dataclasses import make_dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_shapes: Dict[tuple, "RowShape"] = {}
+_lock = threading.Lock()
+
+
+class RowShape:
+    """Column-index map and record class for one (columns, hidden, converters) combination."""
+
+    def __init__(self, names: Tuple[str, ...], hidden: Tuple[str, ...] = (), converters: Optional[Dict[str, Callable]] = None):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        visible = [name for name in names if name not in hidden]
+        for name in visible:
+            if not name.isidentifier() or keyword.iskeyword(name):
+                raise ValueError(f"Column {name!r} needs an alias that is a valid identifier")
+        self.record_class = make_dataclass("Row", visible)
+
+        namespace = {"cls": self.record_class}
+        args = []
+        for name in visible:
+            i = self.index[name]
+            if converters and name in converters:
+                namespace[f"convert_{i}"] = converters[name]
+                args.append(f"convert_{i}(r[{i}])")
+            else:
+                args.append(f"r[{i}]")
+        self.record = eval(f"lambda r: cls({', '.join(args)})", namespace)
+
+    def records(self, raw_rows: Iterable[Sequence]) -> List:
+        record = self.record
+        return [record(r) for r in raw_rows]
+
+    def value(self, raw_row: Sequence, name: str):
+        return raw_row[self.index[name]]
+
+
+def shape(description, hidden: Iterable[str] = (), converters: Optional[Dict[str, Callable]] = None) -> RowShape:
+    """The cached RowShape for a cursor.description (built on first use)."""
+    names = tuple(column[0] for column in description)
+    hidden = tuple(hidden)
+    key = (names, hidden, tuple(sorted((converters or {}).items(), key=lambda kv: kv[0])))
+    cached = _shapes.get(key)
+    if cached is None:
+        with _lock:
+            cached = _shapes.get(key)
+            if cached is None:
+                cached = _shapes[key] = RowShape(names, hidden, converters)
+    return cached
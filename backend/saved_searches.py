@@ -0,0 +1,234 @@
+"""
+saved_searches.py — "Alert me when ..." saved searches and the percolator that matches new items.
+
+A saved search is a set of required words (from its query text) plus optional status, category
+and location filters. A new item satisfies it when every word appears among the item's title,
+description, keywords and location words and every filter matches.
+
+Instead of running every saved search against each new item, the Percolator inverts them: each
+search is posted under a single anchor key that any matching item must contain — its longest
+(usually rarest) word, or failing that its location, category or status filter. A new item probes
+only the keys it carries (its words and its three filter values) and fully checks just the searches
+found there, so the work grows with the number of candidate matches, not with the number of
+subscribers.
+
+The index is per process: it is loaded from MySQL on first use, re-read every REFRESH_SECONDS to
+pick up searches saved through other workers, and updated directly by the endpoints in main.py.
+A search deleted through another worker can stay in this index until then, so matches are checked
+against the table (one lookup by id) before anyone is emailed. Matching and emailing run in a
+BackgroundTask after create_item has responded.
+"""
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import search
+import trigram
+from facets import canonical_location
+
+MAX_PER_USER = 20
+REFRESH_SECONDS = 300
+
+_COLUMNS = "id, user_id, query, status, category, location"
+
+Key = Tuple[str, str]
+
+
+def terms(text: Optional[str]) -> Tuple[str, ...]:
+    return tuple(sorted({w for w in trigram.words(text) if w not in search.STOPWORDS}))
+
+
+def _norm(value: Optional[str]) -> Optional[str]:
+    value = (value or "").strip().lower()
+    return value or None
+
+
+def _norm_location(value: Optional[str]) -> Optional[str]:
+    return _norm(canonical_location(value))
+
+
+class SavedSearch(NamedTuple):
+    id: int
+    user_id: int
+    query: Optional[str]
+    status: Optional[str]
+    category: Optional[str]
+    location: Optional[str]
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        return terms(self.query)
+
+    def anchor(self) -> Optional[Key]:
+        """The one key every matching item is guaranteed to carry."""
+        words = self.words
+        if words:
+            return ("word", max(words, key=lambda w: (len(w), w)))
+        if self.location:
+            return ("location", _norm_location(self.location))
+        if self.category:
+            return ("category", _norm(self.category))
+        if self.status:
+            return ("status", _norm(self.status))
+        return None
+
+    def matches(self, item_words: Set[str], status: Optional[str], category: Optional[str], location: Optional[str]) -> bool:
+        if self.status and _norm(self.status) != status:
+            return False
+        if self.category and _norm(self.category) != category:
+            return False
+        if self.location and _norm_location(self.location) != location:
+            return False
+        return all(w in item_words for w in self.words)
+
+
+class Percolator:
+    """Thread-safe reverse index: anchor key -> ids of saved searches posted under it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._searches: Dict[int, SavedSearch] = {}
+        self._postings: Dict[Key, Set[int]] = defaultdict(set)
+        self._loaded_at = 0.0
+
+    def _add_locked(self, saved: SavedSearch):
+        key = saved.anchor()
+        if key is None:
+            return
+        self._searches[saved.id] = saved
+        self._postings[key].add(saved.id)
+
+    def add(self, saved: SavedSearch):
+        with self._lock:
+            self._add_locked(saved)
+
+    def remove(self, search_id: int):
+        with self._lock:
+            saved = self._searches.pop(search_id, None)
+            if saved is None:
+                return
+            key = saved.anchor()
+            posting = self._postings.get(key)
+            if posting is not None:
+                posting.discard(search_id)
+                if not posting:
+                    del self._postings[key]
+
+    def load(self, rows: Iterable[Tuple]):
+        """Rebuild from (id, user_id, query, status, category, location) rows."""
+        with self._lock:
+            self._searches.clear()
+            self._postings.clear()
+            for row in rows:
+                self._add_locked(SavedSearch(*row))
+            self._loaded_at = time.monotonic()
+
+    def is_stale(self) -> bool:
+        return not self._loaded_at or time.monotonic() - self._loaded_at > REFRESH_SECONDS
+
+    def match(self, item: dict) -> List[SavedSearch]:
+        """Saved searches the item satisfies."""
+        item_words = set(trigram.words(" ".join(
+            item.get(field) or "" for field in ("title", "description", "keywords", "location")
+        )))
+        status = _norm(item.get("status"))
+        category = _norm(item.get("category"))
+        location = _norm_location(item.get("location"))
+        keys = [("word", w) for w in item_words]
+        keys += [("status", status), ("category", category), ("location", location)]
+        with self._lock:
+            candidate_ids = set()
+            for key in keys:
+                candidate_ids.update(self._postings.get(key, ()))
+            candidates = [self._searches[i] for i in candidate_ids]
+        return [s for s in candidates if s.matches(item_words, status, category, location)]
+
+    def __len__(self):
+        return len(self._searches)
+
+
+percolator = Percolator()
+
+
+def ensure_loaded(db):
+    if not percolator.is_stale():
+        return
+    cursor = db.cursor()
+    try:
+        cursor.execute(f"SELECT {_COLUMNS} FROM saved_searches")
+        percolator.load(cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def describe(saved: SavedSearch) -> str:
+    """Short human label, e.g. 'black backpack · Found · Laz Otti Library'."""
+    parts = [saved.query, saved.status, saved.category, saved.location]
+    return " · ".join(p.strip() for p in parts if p and p.strip())
+
+
+def notify_new_item(item: dict):
+    """BackgroundTask: alert users whose saved searches the new item satisfies (see notify_new_items)."""
+    notify_new_items([item])
+
+
+def _existing_search_ids(cursor, search_ids: Set[int]) -> Set[int]:
+    """The ids among search_ids still in saved_searches; the others are dropped from the percolator."""
+    placeholders = ", ".join(["%s"] * len(search_ids))
+    cursor.execute(f"SELECT id FROM saved_searches WHERE id IN ({placeholders})", tuple(search_ids))
+    live = {row["id"] for row in cursor.fetchall()}
+    for search_id in search_ids - live:
+        percolator.remove(search_id)
+    return live
+
+
+def notify_new_items(items: List[dict]):
+    """
+    BackgroundTask: email every user (other than the reporter) whose saved search a new item satisfies.
+    One email per user per item, naming the first matching search.
+    """
+    import database
+    from email_service import send_saved_search_alert
+
+    conn = None
+    try:
+        conn = database.connection_pool.get_connection()
+        ensure_loaded(conn)
+        matches = [(item, [s for s in percolator.match(item) if s.user_id != item.get("user_id")]) for item in items]
+        search_ids = {saved.id for _, found in matches for saved in found}
+        if not search_ids:
+            return
+        cursor = conn.cursor(dictionary=True)
+        try:
+            live = _existing_search_ids(cursor, search_ids)
+            alerts: List[Tuple[dict, Dict[int, SavedSearch]]] = []
+            user_ids: Set[int] = set()
+            for item, found in matches:
+                by_user: Dict[int, SavedSearch] = {}
+                for saved in sorted(found, key=lambda s: s.id):
+                    if saved.id in live:
+                        by_user.setdefault(saved.user_id, saved)
+                if by_user:
+                    alerts.append((item, by_user))
+                    user_ids.update(by_user)
+            if not alerts:
+                return
+            placeholders = ", ".join(["%s"] * len(user_ids))
+            cursor.execute(
+                f"SELECT id, email, full_name FROM users WHERE id IN ({placeholders}) AND COALESCE(is_suspended, 0) = 0",
+                tuple(user_ids),
+            )
+            users = {user["id"]: user for user in cursor.fetchall()}
+        finally:
+            cursor.close()
+        for item, by_user in alerts:
+            recipients = [users[user_id] for user_id in by_user if user_id in users]
+            print(f"[SAVED SEARCH] Item {item.get('id')} matches saved searches of {len(recipients)} user(s).")
+            for user in recipients:
+                send_saved_search_alert(user["email"], user.get("full_name"), item.get("title"), item.get("id"), describe(by_user[user["id"]]))
+    except Exception as e:
+        print(f"[SAVED SEARCH] Failed to notify for {len(items)} new item(s): {e}")
+    finally:
+        if conn is not None:
+            conn.close()
@@ -0,0 +1,73 @@
+"""
+search.py — Ranked full-text search for the items feed (GET /items?q=...).
+
+Backed by the InnoDB FULLTEXT index `ft_items_search` on items(title, description, location, keywords).
+MySQL maintains that index itself on INSERT, DELETE and UPDATE (including status changes), so
+create_item, the delete endpoints and the handover/PIN flows need no extra bookkeeping.
+
+Queries with no token long enough for the full-text index (innodb_ft_min_token_size, default 3)
+fall back to a prefix match on title, which can use idx_items_title instead of scanning.
+"""
+import re
+from typing import List, NamedTuple, Optional
+
+FULLTEXT_INDEX = "ft_items_search"
+TITLE_INDEX = "idx_items_title"
+
+# Must list exactly the columns of ft_items_search, in index order, for MATCH() to use it.
+MATCH_COLUMNS = "i.title, i.description, i.location, i.keywords"
+
+# innodb_ft_min_token_size default; shorter tokens are never indexed.
+MIN_TOKEN_LEN = 3
+
+# InnoDB's default stopword list (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD).
+# Requiring a stopword with '+' would match nothing, so they are dropped from the query.
+STOPWORDS = frozenset({
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for", "from",
+    "how", "i", "in", "is", "it", "la", "of", "on", "or", "that", "the", "this", "to",
+    "was", "what", "when", "where", "who", "will", "with", "und", "www",
+})
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchClause(NamedTuple):
+    """SQL fragments for one search. `rank_sql` is None on the fallback path (feed order is used)."""
+    where_sql: str
+    where_params: List[str]
+    rank_sql: Optional[str]
+    rank_params: List[str]
+
+
+def tokenize(q: str) -> List[str]:
+    """Split user input into lowercase word tokens; operators and punctuation are discarded."""
+    return [t.lower() for t in _TOKEN_RE.findall(q or "")]
+
+
+def to_boolean_query(q: str) -> str:
+    """
+    Build a BOOLEAN MODE query: every indexable token is required and prefix-matched,
+    so 'black wal' finds 'Black wallet' while the user is still typing.
+    Returns '' when no token is indexable.
+    """
+    terms = [t for t in tokenize(q) if len(t) >= MIN_TOKEN_LEN and t not in STOPWORDS]
+    return " ".join(f"+{t}*" for t in terms)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_search(q: Optional[str]) -> Optional[SearchClause]:
+    """Return the WHERE/ORDER fragments for ?q=, or None when q is blank."""
+    q = (q or "").strip()
+    if not q:
+        return None
+
+    boolean_query = to_boolean_query(q)
+    if boolean_query:
+        match_sql = f"MATCH({MATCH_COLUMNS}) AGAINST (%s IN BOOLEAN MODE)"
+        return SearchClause(match_sql, [boolean_query], match_sql, [boolean_query])
+
+    # Short query (e.g. 'ip', 'id'): anchored prefix match on title only.
+    return SearchClause("i.title LIKE %s", [_escape_like(q) + "%"], None, [])
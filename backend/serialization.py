@@ -0,0 +1,46 @@
+"""
+serialization.py — Encode MySQL rows straight to JSON bytes.
+
+List handlers used to walk every row calling str() on created_at/date_found and then let FastAPI
+re-validate each dict against the response_model before json.dumps. Returning JSONRows instead
+hands the raw rows to orjson in one call and skips response_model validation entirely (FastAPI
+passes Response objects through untouched). The response_model stays on the route for the docs.
+
+The wire format is unchanged: datetimes and dates are still written as str() gives them
+("2026-03-01 14:05:09", "2026-03-01"), because the admin page treats timestamps without a 'T' as
+UTC. Handlers must therefore select explicit columns — there is no model left to drop extras.
+
+bench_serialization.py measures the per-row cost of both paths.
+"""
+import datetime
+import decimal
+
+import orjson
+from fastapi.responses import Response
+
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode("utf-8", "replace")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj) -> bytes:
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+class JSONRows(Response):
+    """Pre-encoded JSON response for rows and row lists straight from a dictionary cursor."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -0,0 +1,148 @@
+"""
+statements.py — Per-connection cache of server-side prepared statements for the hot queries.
+
+A handful of statements run on nearly every chat or admin request: the participant checks on
+`conversations`, the conversation and claim lists with their last message, the user lookup by
+email at login and require_admin's role check. Sent as text, each call is interpolated
+client-side and parsed and planned by the server from scratch. fetch_one/fetch_all instead
+prepare a statement the first time a pooled connection sees that SQL text and keep it on the
+connection, so later calls on the same connection only send the parameters (binary protocol).
+
+Each connection keeps at most MAX_STATEMENTS statements in least-recently-used order; the oldest
+is closed (COM_STMT_CLOSE) to make room. Statements belong to the server session, so the cache is
+dropped when the connection reconnects (its connection id changes), and a statement the server no
+longer knows is prepared again once. This relies on the pools not resetting the session when a
+connection is returned (see database.InstrumentedPool.add_connection), since
+COM_RESET_CONNECTION deallocates every prepared statement.
+
+Statements run on the C extension's statement handle (CMySQLConnection.cmd_stmt_prepare /
+cmd_stmt_execute) rather than through cursor(prepared=True). Both prepared cursors, pure Python and
+C, send COM_STMT_RESET before every execute, a round trip that costs about what skipping the parse
+saves. Here every result is read to the end and no long data is sent, so there is nothing for a
+reset to clear. Without the C extension (pure-Python connections) fetch_one/fetch_all run the SQL
+as an ordinary text query, without caching it.
+
+Only for sync handlers on database.py connections: aiomysql (async_db.py) speaks the text
+protocol only. Use it for SELECTs that run many times per minute with a fixed SQL string; one-off
+and dynamically built queries gain nothing and would only churn the cache. bench_prepared.py
+compares both paths per hot query.
+"""
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+import mysql.connector
+
+try:
+    from mysql.connector.connection_cext import CMySQLConnection
+except ImportError:  # C extension not available on this platform
+    CMySQLConnection = None
+
+MAX_STATEMENTS = 16
+UNKNOWN_STATEMENT_ERRNO = 1243  # ER_UNKNOWN_STMT_HANDLER
+
+_counts = {"prepared": 0, "reused": 0, "evicted": 0, "text": 0}
+_counts_lock = threading.Lock()
+
+
+def _count(name: str):
+    with _counts_lock:
+        _counts[name] += 1
+
+
+def stats() -> dict:
+    """Statements prepared, executions that reused one, evictions and text fallbacks in this worker."""
+    with _counts_lock:
+        counts = dict(_counts)
+    counts["max_per_connection"] = MAX_STATEMENTS
+    counts["c_extension"] = CMySQLConnection is not None
+    return counts
+
+
+class _StatementCache:
+    """Prepared statements of one server session, least recently used first."""
+
+    def __init__(self, connection_id):
+        self.connection_id = connection_id
+        self.statements = OrderedDict()  # SQL text -> CMySQLPrepStmt
+
+
+def _cache_for(cnx) -> _StatementCache:
+    cache = getattr(cnx, "_findit_statements", None)
+    if cache is None or cache.connection_id != cnx.connection_id:
+        # New or reconnected session: the old statement ids died with the old session
+        cache = _StatementCache(cnx.connection_id)
+        cnx._findit_statements = cache
+    return cache
+
+
+def _evict(cnx, cache: _StatementCache, sql: str):
+    stmt = cache.statements.pop(sql)
+    _count("evicted")
+    try:
+        cnx.cmd_stmt_close(stmt)
+    except mysql.connector.Error:
+        pass
+
+
+def _statement(cnx, sql: str):
+    cache = _cache_for(cnx)
+    stmt = cache.statements.get(sql)
+    if stmt is not None:
+        cache.statements.move_to_end(sql)
+        _count("reused")
+        return stmt
+    while len(cache.statements) >= MAX_STATEMENTS:
+        _evict(cnx, cache, next(iter(cache.statements)))
+    stmt = cache.statements[sql] = cnx.cmd_stmt_prepare(sql.replace("%s", "?").encode("utf-8"))
+    _count("prepared")
+    return stmt
+
+
+def _execute(cnx, sql: str, params: Sequence) -> List[dict]:
+    stmt = _statement(cnx, sql)
+    result = cnx.cmd_stmt_execute(stmt, *params)
+    if not stmt.have_result_set:
+        return []
+    names = [column[0] for column in result["columns"]]
+    rows, _ = cnx.get_rows(prep_stmt=stmt)  # reads to the end and frees the result
+    return [dict(zip(names, row)) for row in rows]
+
+
+def _run(cnx, sql: str, params: Sequence) -> List[dict]:
+    cnx.handle_unread_result(prepared=True)
+    try:
+        return _execute(cnx, sql, params)
+    except mysql.connector.Error as err:
+        if err.errno != UNKNOWN_STATEMENT_ERRNO:
+            raise
+        # Deallocated server-side behind our back (e.g. a session reset): prepare it again
+        _evict(cnx, _cache_for(cnx), sql)
+        return _execute(cnx, sql, params)
+
+
+def _run_text(db, sql: str, params: Sequence) -> List[dict]:
+    _count("text")
+    cursor = db.cursor(dictionary=True)
+    try:
+        cursor.execute(sql, tuple(params))
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def fetch_all(db, sql: str, params: Sequence = ()) -> List[dict]:
+    """Run a SELECT as a cached prepared statement on db (a pooled connection); rows as dicts."""
+    cnx = getattr(db, "_cnx", db)  # statements outlive the checkout, so cache on the raw connection
+    if CMySQLConnection is None or not isinstance(cnx, CMySQLConnection):
+        return _run_text(db, sql, params)
+    run_first = getattr(db, "run_first", None)
+    if run_first is not None:
+        return run_first(_run, cnx, sql, tuple(params))
+    return _run(cnx, sql, tuple(params))
+
+
+def fetch_one(db, sql: str, params: Sequence = ()) -> Optional[dict]:
+    """fetch_all for lookups that return at most one row (the whole result is always read)."""
+    rows = fetch_all(db, sql, params)
+    return rows[0] if rows else None
@@ -0,0 +1,73 @@
+"""
+streaming.py — NDJSON streaming for large list endpoints (opt in with Accept: application/x-ndjson).
+
+The query runs on an unbuffered cursor and rows are pulled FETCH_BATCH at a time and written as one
+JSON object per line, so memory stays bounded and the first bytes go out before the last row is read.
+
+The request's get_db_connection dependency can be torn down before a StreamingResponse body is
+sent, so the stream owns its connection: sync handlers hand theirs over (database.hand_off) instead
+of holding it while the stream checks out a second one, and handlers without one (GET /items runs on
+the async pool) pass the pool to take it from. The query is executed before the response starts so
+SQL errors still surface as a normal 500.
+
+Rows are fetched as tuples and written through the query's rows.RowShape, so hidden columns and
+converters work the same way as in the buffered handlers.
+"""
+from typing import Callable, Dict, Iterable, Optional
+
+import mysql.connector
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+import database
+import rows
+import serialization
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+FETCH_BATCH = 500
+
+
+def wants_ndjson(request: Request) -> bool:
+    accept = request.headers.get("accept", "")
+    return any(part.split(";")[0].strip().lower() == NDJSON_MEDIA_TYPE for part in accept.split(","))
+
+
+def ndjson_response(query: str, params=(), hidden: Iterable[str] = (), converters: Optional[Dict[str, Callable]] = None, pool=None, db=None) -> StreamingResponse:
+    """
+    Stream the rows of query as NDJSON, leaving out the hidden columns (see rows.shape).
+    db is a connection handed off by the request (database.hand_off); the stream closes it. Without
+    one, a connection is checked out from pool (default the primary; read-only callers pass
+    database.read_pool(request)).
+    """
+    if db is None:
+        pool = pool or database.connection_pool
+        if not pool:
+            raise HTTPException(status_code=500, detail="Database connection pool is not initialized")
+        db = pool.get_connection(label="ndjson stream")
+    try:
+        cursor = db.cursor()  # unbuffered: rows stay on the socket until fetched
+        cursor.execute(query, tuple(params))
+        shape = rows.shape(cursor.description, hidden, converters)
+    except mysql.connector.Error as err:
+        db.close()
+        raise HTTPException(status_code=500, detail=f"Database error: {err}")
+
+    def lines():
+        record = shape.record
+        try:
+            while True:
+                batch = cursor.fetchmany(FETCH_BATCH)
+                if not batch:
+                    break
+                yield b"\n".join([serialization.dumps(record(r)) for r in batch]) + b"\n"
+        finally:
+            try:
+                # Client went away mid-stream: drain the rest so the connection goes back to the pool clean
+                if db.unread_result:
+                    db.consume_results()
+                cursor.close()
+            except mysql.connector.Error:
+                pass
+            db.close()
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,8 @@
+"""
+Tests run from backend/ (python -m pytest) and need no database: handlers are called directly with
+fake connections, and importing main opens none (the pools connect on demand).
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
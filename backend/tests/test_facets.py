@@ -0,0 +1,72 @@
+"""
+facets.ensure_loaded: writes hooked in while the GROUP BY runs are replayed onto the reloaded
+counter, a wipe during the reload discards its rows, and only one request reloads at a time.
+"""
+import facets
+
+
+class ReloadCursor:
+    """Returns rows; on_execute runs in the middle of the GROUP BY, as a concurrent write would."""
+
+    def __init__(self, rows, on_execute=None):
+        self.rows = rows
+        self.on_execute = on_execute
+
+    def execute(self, sql, params=()):
+        if self.on_execute:
+            self.on_execute()
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class ReloadConnection:
+    def __init__(self, rows, on_execute=None):
+        self.rows = rows
+        self.on_execute = on_execute
+        self.reloads = 0
+
+    def cursor(self):
+        self.reloads += 1
+        return ReloadCursor(self.rows, self.on_execute)
+
+
+def counts():
+    return dict(facets.counter.snapshot())
+
+
+def fresh_counter(monkeypatch):
+    monkeypatch.setattr(facets, "counter", facets.FacetCounter())
+
+
+def test_writes_during_reload_are_replayed(monkeypatch):
+    fresh_counter(monkeypatch)
+
+    def concurrent_writes():
+        facets.counter.add("Found", "Electronics", "Library")
+        facets.counter.remove("Lost", "Keys", "Gym")
+
+    db = ReloadConnection([("Found", "Electronics", "Library", 3), ("Lost", "Keys", "Gym", 2)], concurrent_writes)
+    facets.ensure_loaded(db)
+    assert counts() == {("Found", "Electronics", "Library"): 4, ("Lost", "Keys", "Gym"): 1}
+    assert not facets.counter.is_stale()
+
+
+def test_wipe_during_reload_discards_its_rows(monkeypatch):
+    fresh_counter(monkeypatch)
+    db = ReloadConnection([("Found", "Electronics", "Library", 3)], facets.counter.clear)
+    facets.ensure_loaded(db)
+    assert counts() == {}
+    assert facets.counter.is_stale()  # the next request reloads
+
+
+def test_one_reload_at_a_time(monkeypatch):
+    fresh_counter(monkeypatch)
+    inner = ReloadConnection([("Found", None, None, 1)])
+    outer = ReloadConnection([("Found", None, None, 1)], lambda: facets.ensure_loaded(inner))
+    facets.ensure_loaded(outer)
+    assert (outer.reloads, inner.reloads) == (1, 0)
+    assert counts() == {("Found", None, None): 1}
@@ -0,0 +1,71 @@
+"""
+What `import main` costs a cold worker (python -X importtime).
+
+The integration SDKs are loaded on first use (main.cloudinary_uploader, google_login,
+email_service._resend, auth_utils); a new top-level import of one of them would quietly put it
+back on the cold start, so importing main must not pull in any of LAZY_MODULES. On failure the
+message lists the heaviest top-level packages (self time of the package and all its submodules).
+"""
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+LAZY_MODULES = ["cloudinary", "google.auth", "google.oauth2", "resend", "jose"]
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+_BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str = "main"):
+    """[(module name, self microseconds, cumulative microseconds, depth)] in import order."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_BACKEND, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, f"import {module} failed:\n{result.stderr[-2000:]}"
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def by_package(rows):
+    """Self time summed per top-level package, in microseconds."""
+    totals = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def lazy_violations(rows):
+    names = {name for name, _, _, _ in rows}
+    return [lazy for lazy in LAZY_MODULES if any(n == lazy or n.startswith(lazy + ".") for n in names)]
+
+
+def test_lazy_violations_matches_submodules():
+    rows = [("json", 1, 1, 0), ("google.oauth2.id_token", 1, 1, 1), ("joseph", 1, 1, 0)]
+    assert lazy_violations(rows) == ["google.oauth2"]
+
+
+def test_import_main_leaves_sdks_lazy():
+    rows = measure()
+    assert rows, "python -X importtime printed nothing"
+    total_ms = sum(self_us for _, self_us, _, _ in rows) / 1000
+    heaviest = sorted(by_package(rows).items(), key=lambda kv: -kv[1])[:10]
+    report = ", ".join(f"{package} {self_us / 1000:.1f} ms" for package, self_us in heaviest)
+    assert lazy_violations(rows) == [], (
+        f"imported at startup; import it where it is first used "
+        f"(import main: {total_ms:.1f} ms; {report})"
+    )
+
+
+def test_import_config_is_quiet():
+    # Settings are reported by config.report() in the startup hook, not printed at import
+    result = subprocess.run([sys.executable, "-c", "import config"], cwd=_BACKEND, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == ""
@@ -0,0 +1,59 @@
+"""
+indexes.py EXPLAINs the handlers' own SQL with sample parameters, and migrate.add_missing_indexes
+builds the ALTER that migration 0007 runs. Both are checked here without a database; the plans
+themselves need `python indexes.py` against a real copy.
+"""
+import indexes
+import main
+import migrate
+
+
+class SampleCursor:
+    """Answers sample_params' lookups: the newest conversation, item and the System user."""
+
+    def __init__(self):
+        self.last = ""
+
+    def execute(self, sql, params=()):
+        self.last = sql
+
+    def fetchone(self):
+        if "FROM conversations" in self.last:
+            return (3, 1, 2)
+        if "FROM items" in self.last:
+            return ("Found", "Electronics")
+        return (9,)
+
+
+def test_every_hot_query_gets_its_parameters():
+    samples = indexes.sample_params(SampleCursor())
+    for query in indexes.HOT_QUERIES:
+        assert query.sql.count("%s") == len(samples[query.params]), query.name
+
+
+def test_hot_queries_are_the_handlers_sql():
+    sql = {query.name: query.sql for query in indexes.HOT_QUERIES}
+    assert sql["message history"] == main.message_history_sql(with_system=True)
+    assert "OR sender_id = %s" in sql["message history"]
+    assert sql["conversation list"] == main.CONVERSATION_LIST_SQL
+
+
+class IndexCursor:
+    def __init__(self, existing):
+        self.existing = existing
+        self.executed = []
+        self.found = False
+
+    def execute(self, sql, params=()):
+        self.executed.append(sql)
+        self.found = bool(params) and params[-1] in self.existing
+
+    def fetchone(self):
+        return (1,) if self.found else None
+
+
+def test_add_missing_indexes_leaves_lock_level_to_mysql():
+    cursor = IndexCursor(existing={"idx_old"})
+    migrate.add_missing_indexes(cursor, "messages", [("idx_old", "a"), ("idx_new", "item_id, created_at")])
+    alter = cursor.executed[-1]
+    assert alter == "ALTER TABLE messages ADD INDEX idx_new (item_id, created_at), ALGORITHM=INPLACE"
@@ -0,0 +1,103 @@
+"""
+GET /conversations/{id}/messages is served by the async route: opening a thread marks the messages
+to the reader read and resets their unread count in one transaction, and writes nothing when
+there is nothing unread.
+"""
+import asyncio
+
+import pytest
+
+import conversation_summary
+import main
+
+CONVERSATION_ID = 5
+FINDER_ID = 1
+CLAIMER_ID = 2
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.last = None
+
+    async def execute(self, query, params=()):
+        self.connection.log.append(query)
+        self.last = query
+
+    async def fetchone(self):
+        if "FROM conversations" in self.last:
+            return dict(self.connection.conversation)
+        return None
+
+    async def fetchall(self):
+        return []
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class FakeConnection:
+    """aiomysql connection; log records statements and transaction boundaries in order."""
+
+    def __init__(self, finder_unread, claimer_unread):
+        self.conversation = {
+            "item_id": 9, "finder_id": FINDER_ID, "claimer_id": CLAIMER_ID,
+            "finder_unread": finder_unread, "claimer_unread": claimer_unread,
+        }
+        self.log = []
+
+    def cursor(self, *args):
+        return _Awaitable(FakeCursor(self))
+
+    async def begin(self):
+        self.log.append("BEGIN")
+
+    async def commit(self):
+        self.log.append("COMMIT")
+
+    async def rollback(self):
+        self.log.append("ROLLBACK")
+
+
+class _Awaitable:
+    """What aiomysql's Connection.cursor() returns: usable with await and with async with."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __await__(self):
+        yield from asyncio.sleep(0).__await__()
+        return self.cursor
+
+    async def __aenter__(self):
+        return self.cursor
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+def _open_thread(db, user_id):
+    return asyncio.run(main.get_conversation_messages(CONVERSATION_ID, current_user={"id": user_id}, db=db))
+
+
+@pytest.mark.parametrize("user_id", [FINDER_ID, CLAIMER_ID])
+def test_opening_thread_marks_read_in_one_transaction(user_id):
+    db = FakeConnection(finder_unread=3, claimer_unread=2)
+    _open_thread(db, user_id)
+    start = db.log.index("BEGIN")
+    assert db.log[start:start + 4] == [
+        "BEGIN", conversation_summary.MARK_MESSAGES_READ_SQL, conversation_summary.MARK_READ_SQL, "COMMIT",
+    ]
+
+
+def test_opening_read_thread_writes_nothing():
+    db = FakeConnection(finder_unread=0, claimer_unread=4)
+    _open_thread(db, FINDER_ID)
+    assert "BEGIN" not in db.log
+    assert not any(query.lstrip().startswith("UPDATE") for query in db.log)
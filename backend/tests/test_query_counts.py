@@ -0,0 +1,94 @@
+"""
+The conversation and claim lists read the stored last message and unread counts
+(conversation_summary.py) in one query. Each handler is called for a user with several rows on a
+fake connection that counts statements, so a per-row lookup creeping back in (N+1) fails here.
+"""
+import asyncio
+import datetime
+
+import main
+from routers.messaging import list_claims
+
+USER_ID = 1
+ROWS = 3
+
+
+def _conversation_row(i: int) -> dict:
+    sent = datetime.datetime(2026, 3, 1, 12, i)
+    return {
+        "id": i, "item_id": 100 + i, "finder_id": USER_ID, "claimer_id": 10 + i, "created_at": sent,
+        "last_message_at": sent, "last_sender_id": 10 + i, "finder_unread": 1, "claimer_unread": 0,
+        "item_title": f"Item {i}", "finder_name": "Finder", "finder_avatar": None,
+        "claimer_name": f"Claimer {i}", "claimer_avatar": None, "last_content": f"Message {i}",
+    }
+
+
+def _claim_row(i: int) -> dict:
+    return {
+        "claim_id": i, "status": "pending", "updated_at": datetime.datetime(2026, 3, 1, 12, i),
+        "item_title": f"Item {i}", "item_photo": None, "claimer_name": f"Claimer {i}",
+        "finder_name": "Finder", "claimer_id": 10 + i, "finder_id": USER_ID, "last_message": f"Message {i}",
+    }
+
+
+class CountingCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query, params=()):
+        self.connection.statements += 1
+
+    def fetchall(self):
+        return [dict(row) for row in self.connection.rows]
+
+    def fetchone(self):
+        return dict(self.connection.rows[0]) if self.connection.rows else None
+
+    def close(self):
+        pass
+
+
+class CountingConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = 0
+
+    def cursor(self, *args, **kwargs):
+        return CountingCursor(self)
+
+
+class AsyncCountingCursor(CountingCursor):
+    async def execute(self, query, params=()):
+        super().execute(query, params)
+
+    async def fetchall(self):
+        return super().fetchall()
+
+    async def close(self):
+        pass
+
+
+class AsyncCountingConnection(CountingConnection):
+    async def cursor(self, *args, **kwargs):
+        return AsyncCountingCursor(self)
+
+
+def test_conversations_legacy_sends_one_statement():
+    db = CountingConnection([_conversation_row(i) for i in range(ROWS)])
+    conversations = main.get_conversations_legacy(current_user={"id": USER_ID}, db=db)
+    assert len(conversations) == ROWS
+    assert db.statements == 1
+
+
+def test_my_conversations_sends_one_statement():
+    db = AsyncCountingConnection([_conversation_row(i) for i in range(ROWS)])
+    conversations = asyncio.run(main.get_my_conversations(current_user={"id": USER_ID}, db=db))
+    assert len(conversations) == ROWS
+    assert db.statements == 1
+
+
+def test_list_claims_sends_one_statement():
+    db = CountingConnection([_claim_row(i) for i in range(ROWS)])
+    claims = list_claims(current_user={"id": USER_ID}, db=db)
+    assert len(claims) == ROWS
+    assert db.statements == 1
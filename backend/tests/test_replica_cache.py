@@ -0,0 +1,127 @@
+"""
+GET /items/{id} with a lagging replica: after a write, neither the writer nor anyone else may be
+served the pre-write row from response_cache once the replica has been given time to catch up.
+"""
+import asyncio
+import json
+
+import pytest
+from starlette.requests import Request
+
+import database
+import item_events
+import main
+import response_cache
+from auth_utils import create_access_token
+
+ITEM_ID = 7
+WRITER_ID = 42
+
+
+class FakeCursor:
+    def __init__(self, server):
+        self.server = server
+
+    def execute(self, query, params=()):
+        self.server.queries += 1
+
+    def fetchone(self):
+        return dict(self.server.row)
+
+    def fetchall(self):
+        return [dict(self.server.row)]
+
+    def close(self):
+        pass
+
+
+class FakeServer:
+    """A primary or replica connection; row is what SELECT ... FROM items returns there."""
+
+    def __init__(self, title):
+        self.row = {"id": ITEM_ID, "title": title, "status": "Found", "user_id": WRITER_ID}
+        self.queries = 0
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self)
+
+
+def request(user_id=None):
+    headers = []
+    if user_id is not None:
+        headers.append((b"authorization", f"Bearer {create_access_token({'id': user_id})}".encode()))
+    return Request({"type": "http", "method": "GET", "path": f"/items/{ITEM_ID}", "headers": headers, "query_string": b""})
+
+
+def get_item(req, primary, replica):
+    # What get_read_db_connection would hand the route for this request
+    db = replica if database.reads_replica(req) else primary
+    return json.loads(main.get_item(req, ITEM_ID, db=db).body)["title"]
+
+
+def get_items_by_ids(req, primary, replica, monkeypatch):
+    # GET /items?ids= checks out its own connection from database.read_pool(request)
+    monkeypatch.setattr(database, "with_connection",
+                        lambda label, fn, *args, pool=None: fn(replica if pool is database.replica_pool else primary, *args))
+    return json.loads(asyncio.run(main.get_items(req, ids=str(ITEM_ID))).body)["items"][0]["title"]
+
+
+@pytest.fixture
+def replica_setup(monkeypatch):
+    monkeypatch.setattr(database, "replica_pool", object())
+    monkeypatch.setattr(database, "_recent_writers", {})
+    monkeypatch.setattr(response_cache, "item_detail", response_cache.LRUTTLCache("item_detail_test", ttl_seconds=30.0))
+    primary, replica = FakeServer("old title"), FakeServer("old title")
+    return primary, replica
+
+
+def test_lagging_replica_does_not_refill_cache_after_write(replica_setup, monkeypatch):
+    primary, replica = replica_setup
+    assert get_item(request(), primary, replica) == "old title"  # cached from the replica
+
+    # The writer renames the item: committed on the primary, not yet applied on the replica
+    primary.row["title"] = "new title"
+    item_events.item_updated(ITEM_ID)
+    database.mark_write(WRITER_ID)
+
+    # Someone else reads the lagging replica right after the invalidation: served, but not cached
+    assert get_item(request(), primary, replica) == "old title"
+    assert response_cache.item_detail.get(ITEM_ID) is response_cache.MISS
+
+    # The writer's read bypasses the cache and sees the primary
+    assert get_item(request(WRITER_ID), primary, replica) == "new title"
+
+    # Once the replica has caught up and the lag window has passed, replica reads are cached again
+    replica.row["title"] = "new title"
+    clock = database.time.monotonic() + database.REPLICA_LAG_SECONDS + 1
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: clock)
+    assert get_item(request(), primary, replica) == "new title"
+    queries = replica.queries
+    assert get_item(request(), primary, replica) == "new title"
+    assert replica.queries == queries  # served from the cache
+
+
+def test_primary_reads_skip_cache(replica_setup):
+    primary, replica = replica_setup
+    assert get_item(request(), primary, replica) == "old title"
+    primary.row["title"] = "new title"
+    req = Request({"type": "http", "method": "GET", "path": f"/items/{ITEM_ID}", "query_string": b"",
+                   "headers": [(database.READ_PRIMARY_HEADER.lower().encode(), b"primary")]})
+    assert get_item(req, primary, replica) == "new title"
+
+
+def test_ids_lookup_does_not_refill_cache_from_lagging_replica(replica_setup, monkeypatch):
+    primary, replica = replica_setup
+    assert get_items_by_ids(request(), primary, replica, monkeypatch) == "old title"
+
+    primary.row["title"] = "new title"
+    item_events.item_updated(ITEM_ID)
+    database.mark_write(WRITER_ID)
+
+    # A replica read through ?ids= right after the invalidation must not put the old row back
+    assert get_items_by_ids(request(), primary, replica, monkeypatch) == "old title"
+    assert response_cache.item_detail.get(ITEM_ID) is response_cache.MISS
+
+    # The writer's ?ids= read skips the cache and sees the primary, and so does GET /items/{id}
+    assert get_items_by_ids(request(WRITER_ID), primary, replica, monkeypatch) == "new title"
+    assert get_item(request(WRITER_ID), primary, replica) == "new title"
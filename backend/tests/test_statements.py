@@ -0,0 +1,114 @@
+"""
+statements.py: one prepared statement per SQL text per server session, at most MAX_STATEMENTS of
+them in LRU order, executed without COM_STMT_RESET; text queries on non-C-extension connections.
+"""
+import mysql.connector
+import pytest
+
+import statements
+
+
+class FakeStatement:
+    def __init__(self, sql):
+        self.sql = sql
+        self.have_result_set = False
+
+
+class FakeCConnection:
+    """Stands in for CMySQLConnection; log records the commands that would go to the server."""
+
+    def __init__(self):
+        self.connection_id = 1
+        self.log = []
+        self.forget_statements = False
+
+    def handle_unread_result(self, prepared=False):
+        pass
+
+    def cmd_stmt_prepare(self, sql):
+        self.log.append(("prepare", sql))
+        return FakeStatement(sql)
+
+    def cmd_stmt_execute(self, stmt, *params):
+        if self.forget_statements:
+            self.forget_statements = False
+            raise mysql.connector.Error(errno=statements.UNKNOWN_STATEMENT_ERRNO)
+        self.log.append(("execute", stmt.sql, params))
+        stmt.have_result_set = True
+        return {"columns": [("id",), ("email",)]}
+
+    def get_rows(self, prep_stmt=None):
+        prep_stmt.have_result_set = False
+        return [(7, "a@b.c")], None
+
+    def cmd_stmt_close(self, stmt):
+        self.log.append(("close", stmt.sql))
+
+    def cmd_stmt_reset(self, stmt):
+        self.log.append(("reset", stmt.sql))
+
+    def commands(self, name):
+        return [entry for entry in self.log if entry[0] == name]
+
+
+@pytest.fixture
+def cnx(monkeypatch):
+    monkeypatch.setattr(statements, "CMySQLConnection", FakeCConnection)
+    return FakeCConnection()
+
+
+def test_prepares_once_and_reuses_without_reset(cnx):
+    for _ in range(3):
+        assert statements.fetch_one(cnx, "SELECT id, email FROM users WHERE id = %s", (7,)) == {"id": 7, "email": "a@b.c"}
+    assert cnx.commands("prepare") == [("prepare", b"SELECT id, email FROM users WHERE id = ?")]
+    assert len(cnx.commands("execute")) == 3
+    assert cnx.commands("reset") == []
+
+
+def test_evicts_least_recently_used(cnx):
+    queries = [f"SELECT {i}" for i in range(statements.MAX_STATEMENTS)]
+    for sql in queries:
+        statements.fetch_all(cnx, sql)
+    statements.fetch_all(cnx, queries[0])  # now the most recently used
+    statements.fetch_all(cnx, "SELECT 'new'")
+    assert cnx.commands("close") == [("close", b"SELECT 1")]
+    assert len(cnx._findit_statements.statements) == statements.MAX_STATEMENTS
+
+
+def test_reprepares_after_reconnect_or_deallocation(cnx):
+    sql = "SELECT id FROM users WHERE id = %s"
+    statements.fetch_all(cnx, sql, (1,))
+    cnx.connection_id = 2  # reconnected: a new server session
+    statements.fetch_all(cnx, sql, (1,))
+    cnx.forget_statements = True  # deallocated server-side
+    statements.fetch_all(cnx, sql, (1,))
+    assert len(cnx.commands("prepare")) == 3
+
+
+class TextCursor:
+    def __init__(self, db):
+        self.db = db
+
+    def execute(self, sql, params=()):
+        self.db.executed.append((sql, params))
+
+    def fetchall(self):
+        return [{"id": 7}]
+
+    def close(self):
+        pass
+
+
+class PureConnection:
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self, dictionary=False):
+        return TextCursor(self)
+
+
+def test_pure_python_connection_runs_text_query(monkeypatch):
+    monkeypatch.setattr(statements, "CMySQLConnection", FakeCConnection)
+    db = PureConnection()
+    assert statements.fetch_one(db, "SELECT id FROM users WHERE id = %s", (7,)) == {"id": 7}
+    assert db.executed == [("SELECT id FROM users WHERE id = %s", (7,))]
@@ -0,0 +1,172 @@
+"""
+trigram.py — Typo-tolerant lookup over items.title and items.keywords.
+
+An in-memory trigram index in the style of pg_trgm: each word is padded ("  word ") and split into
+3-grams, and two words are similar when the Jaccard overlap of their trigram sets passes a threshold.
+Misspellings like "iphne", "airpod" and "bage" still share most trigrams with "iphone", "airpods"
+and "badge".
+
+Candidate generation never scans every item or every word. A word can only reach similarity t with
+a query word Q if it shares at least ceil(t * |Q|) trigrams, so it must contain one of the
+|Q| - ceil(t * |Q|) + 1 rarest trigrams of Q (prefix filtering). Only those posting lists are
+probed, and only the words found there are scored exactly.
+
+The index is per process. main.py keeps it current on create_item and the delete endpoints, and it
+is rebuilt from MySQL on first use and every REFRESH_SECONDS to pick up writes from other workers.
+"""
+import math
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+DEFAULT_THRESHOLD = 0.3
+MAX_CANDIDATES = 200
+REFRESH_SECONDS = 300
+MIN_WORD_LEN = 2
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def words(text: str) -> List[str]:
+    return [w for w in _WORD_RE.findall((text or "").lower()) if len(w) >= MIN_WORD_LEN]
+
+
+def trigrams(word: str) -> FrozenSet[str]:
+    padded = f"  {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+class TrigramIndex:
+    """Thread-safe trigram index: trigram -> words -> item ids."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._word_grams: Dict[str, FrozenSet[str]] = {}
+        self._gram_words: Dict[str, Set[str]] = defaultdict(set)
+        self._word_items: Dict[str, Set[int]] = defaultdict(set)
+        self._item_words: Dict[int, FrozenSet[str]] = {}
+        self._loaded_at = 0.0
+
+    # ── maintenance ──
+
+    def add(self, item_id: int, *texts: str):
+        """Index (or re-index) an item from its title/keywords."""
+        item_words = frozenset(w for text in texts for w in words(text))
+        with self._lock:
+            self._remove_locked(item_id)
+            self._item_words[item_id] = item_words
+            for word in item_words:
+                if word not in self._word_grams:
+                    grams = trigrams(word)
+                    self._word_grams[word] = grams
+                    for gram in grams:
+                        self._gram_words[gram].add(word)
+                self._word_items[word].add(item_id)
+
+    def remove(self, item_id: int):
+        with self._lock:
+            self._remove_locked(item_id)
+
+    def _remove_locked(self, item_id: int):
+        for word in self._item_words.pop(item_id, ()):
+            ids = self._word_items.get(word)
+            if ids is None:
+                continue
+            ids.discard(item_id)
+            if not ids:
+                # Last item using this word: drop it from the vocabulary too
+                del self._word_items[word]
+                for gram in self._word_grams.pop(word, ()):
+                    posting = self._gram_words.get(gram)
+                    if posting is not None:
+                        posting.discard(word)
+                        if not posting:
+                            del self._gram_words[gram]
+
+    def clear(self):
+        with self._lock:
+            self._word_grams.clear()
+            self._gram_words.clear()
+            self._word_items.clear()
+            self._item_words.clear()
+
+    def load(self, rows: Iterable[Tuple[int, str, str]]):
+        """Rebuild from (id, title, keywords) rows."""
+        with self._lock:
+            self.clear()
+            for item_id, title, keywords in rows:
+                self.add(item_id, title, keywords)
+            self._loaded_at = time.monotonic()
+
+    def is_stale(self) -> bool:
+        return not self._loaded_at or time.monotonic() - self._loaded_at > REFRESH_SECONDS
+
+    def __len__(self):
+        return len(self._item_words)
+
+    # ── lookup ──
+
+    def _similar_words(self, grams: FrozenSet[str], threshold: float) -> Dict[str, float]:
+        """Vocabulary words with similarity >= threshold to the query word's trigrams."""
+        # Rarest trigrams first; probing the first len - ceil(t*len) + 1 is enough (prefix filter)
+        ordered = sorted(grams, key=lambda g: len(self._gram_words.get(g, ())))
+        probe = len(ordered) - math.ceil(threshold * len(ordered)) + 1
+        candidates: Set[str] = set()
+        for gram in ordered[:max(probe, 1)]:
+            candidates.update(self._gram_words.get(gram, ()))
+        matches = {}
+        for word in candidates:
+            score = similarity(grams, self._word_grams[word])
+            if score >= threshold:
+                matches[word] = score
+        return matches
+
+    def search(self, query: str, threshold: float = DEFAULT_THRESHOLD, limit: int = 50) -> List[Tuple[int, float]]:
+        """
+        Items whose words fuzzily match every query word, best first, as (item_id, score).
+        Score is the mean over query words of the best similarity among the item's words.
+        """
+        query_words = list(dict.fromkeys(words(query)))
+        if not query_words:
+            return []
+        with self._lock:
+            scores: Dict[int, float] = {}
+            for position, query_word in enumerate(query_words):
+                best: Dict[int, float] = {}
+                for word, score in self._similar_words(trigrams(query_word), threshold).items():
+                    for item_id in self._word_items[word]:
+                        if score > best.get(item_id, 0.0):
+                            best[item_id] = score
+                if position == 0:
+                    scores = best
+                else:
+                    # AND semantics: keep only items that also matched this query word
+                    scores = {item_id: total + best[item_id] for item_id, total in scores.items() if item_id in best}
+                if not scores:
+                    return []
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], -kv[0]))[:limit]
+        return [(item_id, total / len(query_words)) for item_id, total in ranked]
+
+
+index = TrigramIndex()
+
+
+def ensure_loaded(db):
+    """Build (or periodically rebuild) the index from the items table."""
+    if not index.is_stale():
+        return
+    cursor = db.cursor()
+    try:
+        cursor.execute("SELECT id, title, keywords FROM items")
+        index.load(cursor.fetchall())
+    finally:
+        cursor.close()
@@ -28,25 +28,53 @@ let cache: {
   promise: Promise<DashboardItemsData> | null;
 } = { data: null, promise: null };
 
-function processItems(data: ApiItem[]): DashboardItemsData {
+function startOfToday(): number {
   const today = new Date();
   today.setHours(0, 0, 0, 0);
+  return today.getTime();
+}
+
+function dayOf(item: ApiItem): number {
+  const itemDate = new Date(item.created_at || '');
+  itemDate.setHours(0, 0, 0, 0);
+  return itemDate.getTime();
+}
+
+function processItems(data: ApiItem[]): DashboardItemsData {
+  const today = startOfToday();
   const todaysItems: ApiItem[] = [];
   const older: ApiItem[] = [];
   for (const item of data) {
-    const itemDate = new Date(item.created_at || '');
-    itemDate.setHours(0, 0, 0, 0);
-    if (itemDate.getTime() === today.getTime()) todaysItems.push(item);
+    if (dayOf(item) === today) todaysItems.push(item);
     else older.push(item);
   }
   return { todaysItems, previousItems: older.slice(0, 5) };
 }
 
+const DASHBOARD_PAGE_SIZE = 50;
+
+/**
+ * Newest items, a keyset page at a time, until the page ends with an item from before today:
+ * that covers all of today's items plus the 5 most recent older ones.
+ */
+export async function fetchRecentItems(): Promise<ApiItem[]> {
+  const items: ApiItem[] = [];
+  let cursor: string | null = null;
+  do {
+    const url = `${API_BASE_URL}/items?limit=${DASHBOARD_PAGE_SIZE}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`;
+    const res = await fetch(url);
+    if (!res.ok) throw new Error(`Server error: ${res.status}`);
+    const page: { items: ApiItem[]; next_cursor: string | null } = await res.json();
+    items.push(...page.items);
+    cursor = page.next_cursor;
+  } while (cursor && items.length > 0 && dayOf(items[items.length - 1]) === startOfToday());
+  return items;
+}
+
 function loadItems(): Promise<DashboardItemsData> {
-  return fetch(`${API_BASE_URL}/items`)
-    .then((res) => (res.ok ? res.json() : []))
-    .then((data: ApiItem[]) => {
-      const result = processItems(data);
+  return fetchRecentItems()
+    .then((items) => {
+      const result = processItems(items);
       try {
         const raw = localStorage.getItem(DASHBOARD_CACHE_KEY);
         const prev = raw ? JSON.parse(raw) : {};
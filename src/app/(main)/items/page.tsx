@@ -8,6 +8,8 @@ import { CATEGORIES } from '@/services/items';
 import { API_BASE_URL } from '@/lib/config';
 import { CAMPUS_LOCATIONS } from '@/lib/constants';
 
+const PAGE_SIZE = 50;
+
 interface ApiItem {
   id: number;
   title: string;
@@ -32,34 +34,55 @@ export default function ItemsFoundPage() {
   const [locationFilter, setLocationFilter] = useState('All Locations');
   const [customLocationSearch, setCustomLocationSearch] = useState('');
   const [items, setItems] = useState<ApiItem[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
+  // One keyset page of GET /items; pass the previous page's next_cursor for the page after it
+  const fetchPage = useCallback(async (cursor: string | null) => {
+    const params = new URLSearchParams();
+    if (searchQuery.trim()) params.set('q', searchQuery.trim());
+    if (selectedStatus !== 'All') params.set('status', selectedStatus);
+    if (selectedCategory !== 'All') params.set('category', selectedCategory);
+    params.set('limit', String(PAGE_SIZE));
+    if (cursor) params.set('cursor', cursor);
+
+    const res = await fetch(`${API_BASE_URL}/items?${params.toString()}`);
+    if (!res.ok) throw new Error(`Server error: ${res.status}`);
+    return (await res.json()) as { items: ApiItem[]; next_cursor: string | null };
+  }, [searchQuery, selectedStatus, selectedCategory]);
+
   const fetchItems = useCallback(async () => {
     setIsLoading(true);
     setError(null);
 
     try {
-      const params = new URLSearchParams();
-      if (searchQuery.trim()) params.set('q', searchQuery.trim());
-      if (selectedStatus !== 'All') params.set('status', selectedStatus);
-      if (selectedCategory !== 'All') params.set('category', selectedCategory);
-
-      const queryString = params.toString();
-      const url = `${API_BASE_URL}/items${queryString ? `?${queryString}` : ''}`;
-
-      const res = await fetch(url);
-      if (!res.ok) throw new Error(`Server error: ${res.status}`);
-
-      const data: ApiItem[] = await res.json();
-      setItems(data);
+      const page = await fetchPage(null);
+      setItems(page.items);
+      setNextCursor(page.next_cursor);
     } catch (err: unknown) {
       const message = err instanceof Error ? err.message : 'Failed to load items';
       setError(message);
     } finally {
       setIsLoading(false);
     }
-  }, [searchQuery, selectedStatus, selectedCategory]);
+  }, [fetchPage]);
+
+  const loadMore = async () => {
+    if (!nextCursor || isLoadingMore) return;
+    setIsLoadingMore(true);
+    try {
+      const page = await fetchPage(nextCursor);
+      setItems((prev) => [...prev, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } catch (err: unknown) {
+      const message = err instanceof Error ? err.message : 'Failed to load items';
+      setError(message);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
 
   // Fetch on mount and when filters change (debounced for search)
   useEffect(() => {
@@ -294,6 +317,16 @@ export default function ItemsFoundPage() {
             )}
           </div>
         )}
+
+        {!isLoading && !error && nextCursor && (
+          <button
+            onClick={loadMore}
+            disabled={isLoadingMore}
+            className="mt-6 w-full h-12 bg-[#F1F5F9] rounded-xl text-sm font-medium text-[#003898] hover:bg-slate-200 disabled:opacity-50 transition-colors"
+          >
+            {isLoadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        )}
       </section>
     </div>
   );
@@ -244,6 +244,8 @@ export default function AdminPage() {
     const [auditLogs, setAuditLogs] = useState<AuditLogEntry[]>([]);
     const [users, setUsers] = useState<AdminUser[]>([]);
     const [items, setItems] = useState<ApiItem[]>([]);
+    const [itemsCursor, setItemsCursor] = useState<string | null>(null);
+    const [itemsTotal, setItemsTotal] = useState<number | null>(null);
     const [handovers, setHandovers] = useState<{ stuck: StuckHandoverEntry[], completed: CompletedHandoverEntry[] } | null>(null);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState('');
@@ -281,11 +283,17 @@ export default function AdminPage() {
         setUsers(await res.json());
     }, [getToken]);
 
-    const loadItems = useCallback(async () => {
-        const res = await fetch(`${API_BASE_URL}/items`);
+    // GET /items is paged: the first page replaces the list, "Load more" appends the next one
+    const loadItems = useCallback(async (cursor: string | null = null) => {
+        const res = await fetch(`${API_BASE_URL}/items?limit=100${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`);
         if (!res.ok) return;
-        const data = await res.json();
-        setItems(Array.isArray(data) ? data : []);
+        const page: { items: ApiItem[]; next_cursor: string | null } = await res.json();
+        setItems(prev => (cursor ? [...prev, ...page.items] : page.items));
+        setItemsCursor(page.next_cursor);
+        if (!cursor) {
+            const facetsRes = await fetch(`${API_BASE_URL}/items/facets`);
+            if (facetsRes.ok) setItemsTotal((await facetsRes.json()).total);
+        }
     }, []);
 
     const loadHandovers = useCallback(async () => {
@@ -511,7 +519,7 @@ export default function AdminPage() {
                 <div className="grid grid-cols-3 gap-4">
                     {[
                         { label: 'Total Users', value: loading ? '—' : users.length, icon: '👤', color: 'bg-blue-50 text-blue-600' },
-                        { label: 'Total Items', value: loading ? '—' : items.length, icon: '📦', color: 'bg-emerald-50 text-emerald-600' },
+                        { label: 'Total Items', value: loading ? '—' : (itemsTotal ?? items.length), icon: '📦', color: 'bg-emerald-50 text-emerald-600' },
                         { label: 'Activity Logs', value: loading ? '—' : auditLogs.length, icon: '📋', color: 'bg-violet-50 text-violet-600' },
                     ].map(stat => (
                         <div key={stat.label} className="bg-white rounded-2xl p-4 border border-slate-100 shadow-sm">
@@ -668,6 +676,14 @@ export default function AdminPage() {
                                     ))}
                                 </ul>
                             )}
+                            {itemsCursor && (
+                                <button
+                                    onClick={() => loadItems(itemsCursor)}
+                                    className="w-full py-3 text-sm text-[#003898] font-medium hover:bg-slate-50 transition-colors"
+                                >
+                                    Load more
+                                </button>
+                            )}
                         </div>
                     )}
 
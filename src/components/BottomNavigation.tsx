@@ -3,6 +3,7 @@
 import Link from 'next/link';
 import { usePathname, useRouter } from 'next/navigation';
 import { API_BASE_URL } from '@/lib/config';
+import { fetchRecentItems } from '@/app/(main)/dashboard/dashboardItemsResource';
 
 const DASHBOARD_CACHE_KEY = 'findit_dashboard_cache';
 const PROFILE_CACHE_KEY = 'findit_profile_cache';
@@ -20,9 +21,9 @@ export function BottomNavigation() {
     const headers = { Authorization: `Bearer ${token}` };
     Promise.all([
       fetch(`${API_BASE_URL}/users/me`, { headers }).then((r) => (r.ok ? r.json() : null)),
-      fetch(`${API_BASE_URL}/items`).then((r) => (r.ok ? r.json() : [])),
+      fetchRecentItems(),
     ]).then(([user, data]) => {
-      if (!user || !Array.isArray(data)) return;
+      if (!user) return;
       const today = new Date();
       today.setHours(0, 0, 0, 0);
       const todays: unknown[] = [];